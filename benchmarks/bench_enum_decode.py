@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Per entry cost of decoding raw values with the IntEnum/IntFlag
+constructors versus the precomputed EnumTables used by parse_elf.
+
+    python benchmarks/bench_enum_decode.py [--number N] [--json results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from elfparser import elfenums  # noqa: E402
+from elfparser.enumtables import enum_table  # noqa: E402
+
+# raw values in roughly the mix a parse sees them
+SAMPLES = {
+    'STT': [0, 1, 2, 2, 2, 3, 4, 6, 10],
+    'STB': [0, 1, 1, 1, 2, 10],
+    'STV': [0, 0, 0, 1, 2, 3],
+    'SHT': [0, 1, 1, 2, 3, 4, 6, 8, 11, 0x6ffffff6, 0x6fffffff],
+    'PT': [1, 1, 1, 1, 2, 3, 4, 6, 0x6474e550, 0x6474e551, 0x6474e552],
+    'PF': [4, 5, 6, 4],
+    'DT': [1, 1, 1, 12, 13, 25, 26, 5, 6, 10, 11, 0x6ffffef5, 0x6ffffffb, 0],
+    'DF_1': [0x1, 0x8000001, 0x8000000],
+}
+
+
+def bench(name, number):
+    enum_class = getattr(elfenums, name)
+    table = enum_table(enum_class)
+    values = SAMPLES[name]
+
+    def with_enum():
+        for v in values:
+            enum_class(v)
+
+    def with_table():
+        for v in values:
+            table(v)
+
+    # warm the composite flag cache the same way a parse would
+    with_table()
+    enum_time = min(timeit.repeat(with_enum, number=number, repeat=5))
+    table_time = min(timeit.repeat(with_table, number=number, repeat=5))
+    per_entry = number*len(values)
+    return enum_time*1e9/per_entry, table_time*1e9/per_entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000)
+    parser.add_argument('--json', help="write the results to this file")
+    args = parser.parse_args()
+
+    results = {}
+    print('%-6s %12s %12s %8s' % ('enum', 'enum ns', 'table ns', 'speedup'))
+    for name in SAMPLES:
+        enum_ns, table_ns = bench(name, args.number)
+        results[name] = {'enum_ns': enum_ns, 'table_ns': table_ns}
+        print('%-6s %12.1f %12.1f %7.1fx' % (name, enum_ns, table_ns, enum_ns/table_ns))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
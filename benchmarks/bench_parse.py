@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Time and measure the peak memory of each ElfParser parse stage on
+synthetic files from synth_elf.
+
+    python benchmarks/bench_parse.py [--bits 32 64] [--endianness little big]
+                                     [--mode lazy eager mmap] [--symbols N]
+                                     [--relocations N] [--sections N]
+                                     [--dynamic-entries N] [--repeat N]
+                                     [--json results.json]
+
+Every stage runs on a fresh parser, in the order the properties would
+trigger them, so a stage never pays for work that an earlier one did.
+Stages that build a lazy view are timed including decoding every record.
+Timings are the min and median over --repeat runs. Peak memory comes from a
+separate tracemalloc run so the tracing overhead doesn't skew the timings.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from elfparser.parse_elf import ElfParser  # noqa: E402
+from synth_elf import write_elf  # noqa: E402
+
+MODES = {'lazy': {'lazy_load': True},
+         'eager': {'lazy_load': False},
+         'mmap': {'use_mmap': True}}
+
+
+def _relocations(elf):
+    for section in elf._relocation_sections:
+        if section.is_rela:
+            list(elf._parse_rela_entries(section))
+        else:
+            list(elf._parse_rel_entries(section))
+
+
+def _materialized(stage, table):
+    """Run stage, then decode every record of the view it built, so the
+    timing covers the decoding as well"""
+    def run(elf):
+        getattr(elf, stage)()
+        list(getattr(elf, table))
+    return run
+
+
+def _open(path, kwargs):
+    # _parse_ident and _parse_ehdr run from __init__, so they are timed by
+    # running them again on an open parser
+    return ElfParser(path, **kwargs)
+
+
+STAGES = [('_parse_ident', lambda elf: elf._parse_ident()),
+          ('_parse_ehdr', lambda elf: elf._parse_ehdr()),
+          ('build_id', lambda elf: elf.build_id()),
+          ('_parse_shdrs', _materialized('_parse_shdrs', '_sections')),
+          ('_parse_symbols', lambda elf: elf._parse_symbols()),
+          ('_parse_dyn_symbols', lambda elf: elf._parse_dyn_symbols()),
+          ('_parse_symbol_entries', _materialized('_parse_symbol_entries', '_static_symbol_entries')),
+          ('_parse_dyn_symbol_entries', _materialized('_parse_dyn_symbol_entries', '_dyn_symbol_entries')),
+          ('_parse_phdrs', _materialized('_parse_phdrs', '_program_headers')),
+          ('_parse_dyn_entries', _materialized('_parse_dyn_entries', '_dynamic_entries')),
+          ('relocations', _relocations)]
+
+
+def _run_once(path, kwargs, measure):
+    """measure(fn) -> number, for every stage in order on one parser"""
+    results = {}
+    opened = []
+    results['open'] = measure(lambda: opened.append(_open(path, kwargs)))
+    elf = opened[0]
+    try:
+        for name, stage in STAGES:
+            results[name] = measure(lambda: stage(elf))
+    finally:
+        elf.close()
+    return results
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _peak_memory(fn):
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fn()
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def bench_file(path, mode, repeat):
+    kwargs = MODES[mode]
+    timings = [_run_once(path, kwargs, _time) for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        peaks = _run_once(path, kwargs, _peak_memory)
+    finally:
+        tracemalloc.stop()
+
+    stages = {}
+    for name in timings[0]:
+        samples = [t[name] for t in timings]
+        stages[name] = {'min_s': min(samples),
+                        'median_s': statistics.median(samples),
+                        'peak_bytes': peaks[name]}
+
+    with ElfParser(path, **kwargs) as elf:
+        counts = {'sections': len(elf.sections),
+                  'symbol_entries': len(elf.symbol_entries),
+                  'program_headers': len(elf.program_headers),
+                  'dynamic_entries': len(elf.dynamic_entries),
+                  'relocation_entries': len(elf.relocation_entries)}
+    return stages, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bits', type=int, nargs='+', choices=(32, 64), default=[32, 64])
+    parser.add_argument('--endianness', nargs='+', choices=('little', 'big'),
+                        default=['little', 'big'])
+    parser.add_argument('--mode', nargs='+', choices=sorted(MODES), default=['lazy'])
+    parser.add_argument('--sections', type=int, default=64)
+    parser.add_argument('--symbols', type=int, default=20000)
+    parser.add_argument('--dynamic-entries', type=int, default=64)
+    parser.add_argument('--relocations', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', help="write the results to this file, - for stdout")
+    args = parser.parse_args()
+
+    synth_args = {'sections': args.sections,
+                  'symbols': args.symbols,
+                  'dynamic_entries': args.dynamic_entries,
+                  'relocations': args.relocations,
+                  'seed': args.seed}
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for bits in args.bits:
+            for endianness in args.endianness:
+                path = write_elf(os.path.join(tmp, 'synth%d%s.so' % (bits, endianness[0])),
+                                 bits=bits, endianness=endianness, **synth_args)
+                for mode in args.mode:
+                    stages, counts = bench_file(path, mode, args.repeat)
+                    results.append({'bits': bits,
+                                    'endianness': endianness,
+                                    'mode': mode,
+                                    'file_size': os.path.getsize(path),
+                                    'counts': counts,
+                                    'stages': stages})
+
+    report = {'python': platform.python_version(),
+              'platform': platform.platform(),
+              'synth': synth_args,
+              'repeat': args.repeat,
+              'results': results}
+
+    out = sys.stderr if args.json == '-' else sys.stdout
+    for result in results:
+        print('%d-bit %s, %s, %d bytes' % (result['bits'], result['endianness'],
+                                           result['mode'], result['file_size']), file=out)
+        print('  %-26s %12s %12s %12s' % ('stage', 'min ms', 'median ms', 'peak KiB'), file=out)
+        for name, stage in result['stages'].items():
+            print('  %-26s %12.3f %12.3f %12.1f' % (name, stage['min_s']*1e3, stage['median_s']*1e3,
+                                                   stage['peak_bytes']/1024), file=out)
+
+    if args.json == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Deterministic synthetic elf writer for the benchmarks.
+
+Builds a shared object out of the elfstructs ctypes structures with a
+configurable number of sections, symbols, dynamic entries and relocations.
+The same arguments always produce the same bytes.
+
+    python benchmarks/synth_elf.py out.so [--bits 32|64] [--endianness little|big]
+                                          [--sections N] [--symbols N]
+                                          [--dynamic-entries N] [--relocations N]
+"""
+
+import argparse
+import os
+import random
+import sys
+from ctypes import sizeof
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from elfparser import elfenums, elfstructs  # noqa: E402
+from elfparser.parse_elf import elf_hash  # noqa: E402
+
+# (bits, endianness) -> (machine, uses RELA, GLOB_DAT relocation type)
+MACHINES = {(64, 'little'): (elfenums.EM.EM_X86_64, True, 0x6),
+            (32, 'little'): (elfenums.EM.EM_386, False, 0x6),
+            (64, 'big'): (elfenums.EM.EM_PPC64, True, 0x14),
+            (32, 'big'): (elfenums.EM.EM_PPC, True, 0x14)}
+
+TEXT_ADDRESS = 0x10000
+DATA_ADDRESS = 0x200000
+
+
+def _align(offset, alignment):
+    return (offset + alignment - 1) & ~(alignment - 1)
+
+
+class _StringTable:
+    def __init__(self):
+        self.data = bytearray(b'\x00')
+        self._offsets = {'': 0}
+
+    def add(self, s):
+        offset = self._offsets.get(s)
+        if offset is None:
+            offset = self._offsets[s] = len(self.data)
+            self.data += s.encode() + b'\x00'
+        return offset
+
+
+def _struct(structure, **fields):
+    s = structure()
+    for k, v in fields.items():
+        setattr(s, k, v)
+    return bytes(s)
+
+
+def _dyn(structure, tag, value):
+    d = structure()
+    d.d_tag = tag
+    d.d_un.d_val = value
+    return bytes(d)
+
+
+def build_elf(bits=64, endianness='little', sections=8, symbols=1000,
+              dynamic_entries=32, relocations=1000, needed=4, seed=0,
+              soname=None, rpath=None, runpath=None, extra_sections=()):
+    """Bytes of a synthetic ET_DYN file.
+
+    sections: number of filler PROGBITS sections on top of the ones that
+              hold the tables (.dynsym, .dynstr, .hash, .rel[a].dyn,
+              .dynamic, .symtab, .strtab, .shstrtab)
+    symbols: entries in both .symtab and .dynsym, besides the null symbol
+    dynamic_entries: total .dynamic entries including DT_NULL, padded with
+                     DT_DEBUG. At least the required entries are written
+    relocations: GLOB_DAT relocations against the dynamic symbols
+    needed: number of DT_NEEDED entries, or a list of their names
+    soname, rpath, runpath: DT_SONAME, DT_RPATH and DT_RUNPATH strings, left
+                            out when None
+    extra_sections: (name, sh_type, sh_flags, data[, sh_link, sh_info]) of
+                    sections added after the filler sections, from index
+                    9 + sections on. NOBITS sections take sh_size from
+                    len(data) but occupy no space in the file
+
+    A .note.gnu.build-id with a build-id derived from seed comes right
+    after the phdrs, like it does in linked files"""
+    structures = elfstructs.get_elf_structures(bits, endianness)
+    Ehdr = structures['ElfW_Ehdr']
+    Shdr = structures['ElfW_Shdr']
+    Phdr = structures['ElfW_Phdr']
+    Sym = structures['ElfW_Sym']
+    Dyn = structures['ElfW_Dyn']
+    machine, is_rela, reloc_type = MACHINES[(bits, endianness)]
+    Rel = structures['ElfW_Rela'] if is_rela else structures['ElfW_Rel']
+    word_size = bits // 8
+    rng = random.Random(seed)
+
+    # ehdr, then the phdr table (PT_LOAD, PT_DYNAMIC and PT_NOTE)
+    phnum = 3
+    offset = sizeof(Ehdr) + phnum*sizeof(Phdr)
+    blobs = []
+    shdrs = []
+    shstrtab = _StringTable()
+    # every section after the null one, in shdr order. Symbols need the
+    # index of .text before it is added
+    filler_names = ['.text' if i == 0 else '.synth.%d' % i for i in range(sections)]
+    section_names = ([None, '.note.gnu.build-id', '.dynstr', '.dynsym', '.hash',
+                      '.rela.dyn' if is_rela else '.rel.dyn', '.dynamic', '.strtab', '.symtab']
+                     + filler_names + [extra[0] for extra in extra_sections] + ['.shstrtab'])
+
+    def add_section(name, sh_type, data, entsize=0, alignment=word_size,
+                    link=0, info=0, flags=0):
+        nonlocal offset
+        assert section_names[len(shdrs)] == name, name
+        offset = _align(offset, alignment)
+        blobs.append((offset, bytes(data)))
+        shdrs.append(dict(sh_name=shstrtab.add(name), sh_type=sh_type,
+                          sh_flags=flags, sh_addr=offset, sh_offset=offset,
+                          sh_size=len(data), sh_link=link, sh_info=info,
+                          sh_addralign=alignment, sh_entsize=entsize))
+        offset += len(data)
+        return len(shdrs) - 1
+
+    # index 0 is the null section
+    shdrs.append(dict(sh_name=0, sh_type=0, sh_flags=0, sh_addr=0, sh_offset=0,
+                      sh_size=0, sh_link=0, sh_info=0, sh_addralign=0, sh_entsize=0))
+
+    build_id = bytes(rng.getrandbits(8) for _ in range(20))
+    note = (_struct(structures['ElfW_Nhdr'], n_namesz=4, n_descsz=len(build_id),
+                    n_type=elfenums.NT.NT_GNU_BUILD_ID) + b'GNU\x00' + build_id)
+    note_index = add_section('.note.gnu.build-id', elfenums.SHT.SHT_NOTE, note, alignment=4,
+                             flags=elfenums.SHF.SHF_ALLOC)
+
+    dynstr = _StringTable()
+    strtab = _StringTable()
+    if isinstance(needed, int):
+        needed_names = ['libsynth%d.so' % i for i in range(needed)]
+    else:
+        needed_names = list(needed)
+    for name in needed_names + [soname, rpath, runpath]:
+        if name is not None:
+            dynstr.add(name)
+    symbol_names = ['synth_symbol_%d_%08x' % (i, rng.getrandbits(32)) for i in range(symbols)]
+
+    # symbols point into the first filler section, which acts as .text, or
+    # are absolute when there are no filler sections
+    text_index = section_names.index('.text') if sections else elfenums.SHN.SHN_ABS
+    sym_values = [(TEXT_ADDRESS + i*16, 16, (elfenums.STB.STB_GLOBAL << 4) | rng.choice((elfenums.STT.STT_FUNC,
+                                                                                        elfenums.STT.STT_OBJECT)))
+                  for i in range(symbols)]
+
+    dynsym = bytearray(sizeof(Sym))
+    symtab = bytearray(sizeof(Sym))
+    for name, (value, size, info) in zip(symbol_names, sym_values):
+        dynsym += _struct(Sym, st_name=dynstr.add(name), st_value=value, st_size=size,
+                          st_info=info, st_other=0, st_shndx=text_index)
+        symtab += _struct(Sym, st_name=strtab.add(name), st_value=value, st_size=size,
+                          st_info=info, st_other=0, st_shndx=text_index)
+
+    # sysv hash table over .dynsym
+    nsyms = symbols + 1
+    nbucket = max(1, nsyms // 2)
+    buckets = [0]*nbucket
+    chains = [0]*nsyms
+    for i, name in enumerate(symbol_names, 1):
+        h = elf_hash(name.encode()) % nbucket
+        chains[i] = buckets[h]
+        buckets[h] = i
+    hash_data = b''.join(v.to_bytes(4, endianness) for v in [nbucket, nsyms] + buckets + chains)
+
+    relocs = bytearray()
+    for i in range(relocations):
+        r_sym = i % symbols + 1 if symbols else 0
+        r_info = (r_sym << 8 | reloc_type) if bits == 32 else (r_sym << 32 | reloc_type)
+        fields = dict(r_offset=DATA_ADDRESS + i*word_size, r_info=r_info)
+        if is_rela:
+            fields['r_addend'] = rng.randrange(0, 64)
+        relocs += _struct(Rel, **fields)
+
+    dynstr_index = add_section('.dynstr', elfenums.SHT.SHT_STRTAB, dynstr.data, alignment=1,
+                               flags=elfenums.SHF.SHF_ALLOC)
+    dynsym_index = add_section('.dynsym', elfenums.SHT.SHT_DYNSYM, dynsym, sizeof(Sym),
+                               link=dynstr_index, info=1, flags=elfenums.SHF.SHF_ALLOC)
+    hash_index = add_section('.hash', elfenums.SHT.SHT_HASH, hash_data, 4, link=dynsym_index,
+                             flags=elfenums.SHF.SHF_ALLOC)
+    rel_index = add_section('.rela.dyn' if is_rela else '.rel.dyn',
+                            elfenums.SHT.SHT_RELA if is_rela else elfenums.SHT.SHT_REL,
+                            relocs, sizeof(Rel), link=dynsym_index, flags=elfenums.SHF.SHF_ALLOC)
+
+    dt = elfenums.DT
+    dyn_values = [(dt.DT_NEEDED, dynstr.add(name)) for name in needed_names]
+    for tag, value in ((dt.DT_SONAME, soname), (dt.DT_RPATH, rpath), (dt.DT_RUNPATH, runpath)):
+        if value is not None:
+            dyn_values.append((tag, dynstr.add(value)))
+    rel_shdr = shdrs[rel_index]
+    dyn_values += [(dt.DT_HASH, shdrs[hash_index]['sh_addr']),
+                   (dt.DT_STRTAB, shdrs[dynstr_index]['sh_addr']),
+                   (dt.DT_SYMTAB, shdrs[dynsym_index]['sh_addr']),
+                   (dt.DT_STRSZ, len(dynstr.data)),
+                   (dt.DT_SYMENT, sizeof(Sym))]
+    if is_rela:
+        dyn_values += [(dt.DT_RELA, rel_shdr['sh_addr']), (dt.DT_RELASZ, rel_shdr['sh_size']),
+                       (dt.DT_RELAENT, sizeof(Rel))]
+    else:
+        dyn_values += [(dt.DT_REL, rel_shdr['sh_addr']), (dt.DT_RELSZ, rel_shdr['sh_size']),
+                       (dt.DT_RELENT, sizeof(Rel))]
+    dyn_values += [(dt.DT_DEBUG, 0)]*(dynamic_entries - len(dyn_values) - 1)
+    dyn_values.append((dt.DT_NULL, 0))
+    dynamic = b''.join(_dyn(Dyn, tag, value) for tag, value in dyn_values)
+    dynamic_index = add_section('.dynamic', elfenums.SHT.SHT_DYNAMIC, dynamic, sizeof(Dyn),
+                                link=dynstr_index,
+                                flags=elfenums.SHF.SHF_ALLOC | elfenums.SHF.SHF_WRITE)
+
+    strtab_index = add_section('.strtab', elfenums.SHT.SHT_STRTAB, strtab.data, alignment=1)
+    add_section('.symtab', elfenums.SHT.SHT_SYMTAB, symtab, sizeof(Sym), link=strtab_index, info=1)
+
+    for name in filler_names:
+        add_section(name, elfenums.SHT.SHT_PROGBITS, bytes(rng.getrandbits(8) for _ in range(16)),
+                    alignment=16, flags=elfenums.SHF.SHF_ALLOC)
+
+    for name, sh_type, flags, data, *link_info in extra_sections:
+        link, info = link_info or (0, 0)
+        index = add_section(name, sh_type, b'' if sh_type == elfenums.SHT.SHT_NOBITS else data,
+                            alignment=16, link=link, info=info, flags=flags)
+        shdrs[index]['sh_size'] = len(data)
+
+    shstrndx = len(shdrs)
+    shstrtab.add('.shstrtab')
+    add_section('.shstrtab', elfenums.SHT.SHT_STRTAB, shstrtab.data, alignment=1)
+
+    shoff = _align(offset, word_size)
+    dynamic_shdr = shdrs[dynamic_index]
+    note_shdr = shdrs[note_index]
+    phdrs = [_struct(Phdr, p_type=elfenums.PT.PT_LOAD, p_flags=elfenums.PF.PF_R | elfenums.PF.PF_W,
+                     p_offset=0, p_vaddr=0, p_paddr=0, p_filesz=shoff, p_memsz=shoff, p_align=0x1000),
+             _struct(Phdr, p_type=elfenums.PT.PT_DYNAMIC, p_flags=elfenums.PF.PF_R | elfenums.PF.PF_W,
+                     p_offset=dynamic_shdr['sh_offset'], p_vaddr=dynamic_shdr['sh_addr'],
+                     p_paddr=dynamic_shdr['sh_addr'], p_filesz=dynamic_shdr['sh_size'],
+                     p_memsz=dynamic_shdr['sh_size'], p_align=word_size),
+             _struct(Phdr, p_type=elfenums.PT.PT_NOTE, p_flags=elfenums.PF.PF_R,
+                     p_offset=note_shdr['sh_offset'], p_vaddr=note_shdr['sh_addr'],
+                     p_paddr=note_shdr['sh_addr'], p_filesz=note_shdr['sh_size'],
+                     p_memsz=note_shdr['sh_size'], p_align=4)]
+
+    ehdr = Ehdr()
+    ehdr.e_ident.ei_elfmag[:] = list(b'\x7fELF')
+    ehdr.e_ident.ei_class = elfenums.ELFCLASS.ELFCLASS32 if bits == 32 else elfenums.ELFCLASS.ELFCLASS64
+    ehdr.e_ident.ei_data = (elfenums.ELFDATA.ELFDATA2LSB if endianness == 'little'
+                            else elfenums.ELFDATA.ELFDATA2MSB)
+    ehdr.e_ident.ei_version = 1
+    ehdr.e_type = elfenums.ET.ET_DYN
+    ehdr.e_machine = machine
+    ehdr.e_version = 1
+    ehdr.e_phoff = sizeof(Ehdr)
+    ehdr.e_shoff = shoff
+    ehdr.e_ehsize = sizeof(Ehdr)
+    ehdr.e_phentsize = sizeof(Phdr)
+    ehdr.e_phnum = phnum
+    ehdr.e_shentsize = sizeof(Shdr)
+    ehdr.e_shnum = len(shdrs)
+    ehdr.e_shstrndx = shstrndx
+
+    out = bytearray(shoff + len(shdrs)*sizeof(Shdr))
+    out[0:sizeof(Ehdr)] = bytes(ehdr)
+    out[sizeof(Ehdr):sizeof(Ehdr) + len(phdrs)*sizeof(Phdr)] = b''.join(phdrs)
+    for blob_offset, data in blobs:
+        out[blob_offset:blob_offset + len(data)] = data
+    out[shoff:] = b''.join(_struct(Shdr, **shdr) for shdr in shdrs)
+    return bytes(out)
+
+
+def write_elf(path, **kwargs):
+    """Write build_elf(**kwargs) to path"""
+    with open(path, 'wb') as f:
+        f.write(build_elf(**kwargs))
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output')
+    parser.add_argument('--bits', type=int, choices=(32, 64), default=64)
+    parser.add_argument('--endianness', choices=('little', 'big'), default='little')
+    parser.add_argument('--sections', type=int, default=8)
+    parser.add_argument('--symbols', type=int, default=1000)
+    parser.add_argument('--dynamic-entries', type=int, default=32)
+    parser.add_argument('--relocations', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    write_elf(args.output, bits=args.bits, endianness=args.endianness,
+              sections=args.sections, symbols=args.symbols,
+              dynamic_entries=args.dynamic_entries, relocations=args.relocations,
+              seed=args.seed)
+
+
+if __name__ == '__main__':
+    main()
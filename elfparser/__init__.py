@@ -56,8 +56,17 @@ context = GlobalContext()
 
 from . import elftypes
 from . import elfenums
-from . import elfmacros
 from . import elfstructs
 from . import constexpr
-from . import arch_specific
+import importlib
+
+# elfmacros is big and arch_specific creates every relocation enum, so they
+# are only imported when first accessed
+_LAZY_SUBMODULES = ('elfmacros', 'arch_specific')
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""ctypes arrays over the memory of buffer protocol objects"""
+
+from ctypes import c_char_p, c_int, c_ubyte, c_void_p, c_ssize_t, POINTER, PYFUNCTYPE, Structure, byref, py_object, pythonapi
+
+
+class _Py_buffer(Structure):
+    _fields_ = [("buf", c_void_p),
+                ("obj", c_void_p),
+                ("len", c_ssize_t),
+                ("itemsize", c_ssize_t),
+                ("readonly", c_int),
+                ("ndim", c_int),
+                ("format", c_char_p),
+                ("shape", POINTER(c_ssize_t)),
+                ("strides", POINTER(c_ssize_t)),
+                ("suboffsets", POINTER(c_ssize_t)),
+                ("internal", c_void_p)]
+
+
+PyBUF_SIMPLE = 0
+
+# private prototypes so the argtypes of pythonapi's own function pointers
+# aren't changed for everyone else
+_PyObject_GetBuffer = PYFUNCTYPE(c_int, py_object, POINTER(_Py_buffer), c_int)(("PyObject_GetBuffer", pythonapi))
+_PyBuffer_Release = PYFUNCTYPE(None, POINTER(_Py_buffer))(("PyBuffer_Release", pythonapi))
+
+
+def buffer_address(view):
+    """Address of the first byte of a contiguous memoryview"""
+    pybuf = _Py_buffer()
+    _PyObject_GetBuffer(view, byref(pybuf), PyBUF_SIMPLE)
+    address = pybuf.buf
+    _PyBuffer_Release(byref(pybuf))
+    return address
+
+
+def c_array_from_buffer(obj):
+    """c_ubyte array over the bytes of obj (bytes, bytearray, memoryview,
+    mmap, array, ...) without copying them. The array keeps obj alive and
+    exported, so an mmap can't be closed or a bytearray resized under it.
+
+    ctypes has no read only arrays: the array over a read only buffer is
+    writable as far as ctypes is concerned, but must never be written to"""
+    view = memoryview(obj).cast('B')
+    if not view.readonly:
+        return (c_ubyte*len(view)).from_buffer(view)
+
+    array_class = c_ubyte*len(view)
+    if len(view) == 0:
+        return array_class()
+    # from_buffer refuses read only buffers, so build the array on the
+    # address of the memory instead. view pins that memory for as long as
+    # the array is alive
+    array = array_class.from_address(buffer_address(view))
+    array._elfparser_backing = view
+    return array
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""Persistent GNU build-id -> file index, for finding the binary and the
+separate debug file of a build-id with one query.
+
+The index is an SQLite database with one row per crawled file: its path,
+(st_mtime_ns, st_size) when it was parsed, build-id and debug_info kind
+(see scanner.debug_info_kind). update() walks directory trees and only
+sends new or changed files to the scanner's process pool, files that
+disappeared are dropped. Files that aren't elf, or have no build-id, are
+kept with a NULL build-id so they aren't parsed again.
+"""
+
+import os
+import sqlite3
+
+from .scanner import scan_paths
+
+# bump when the schema changes, older indexes are rebuilt from scratch
+INDEX_FORMAT_VERSION = 1
+
+_SCAN_FIELDS = ('build_id', 'debug_info')
+# rows written per transaction while updating
+_BATCH_SIZE = 512
+
+_SCHEMA = """
+CREATE TABLE files (path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    build_id TEXT,
+                    debug_info TEXT);
+CREATE INDEX files_build_id ON files (build_id) WHERE build_id IS NOT NULL;
+"""
+
+# lookup preference, stripped binaries before ones carrying debug info
+_BINARY_ORDER = {'none': 0, 'embedded': 1}
+_DEBUG_ORDER = {'separate': 0, 'embedded': 1}
+
+
+def _normalize_build_id(build_id):
+    if isinstance(build_id, (bytes, bytearray)):
+        return build_id.hex()
+    return build_id.lower()
+
+
+def _walk(root, follow_symlinks):
+    """(path, stat) of every regular file under root. Directories reached
+    again through a symlink, such as a link back to a parent, are skipped"""
+    stack = [root]
+    visited = set()
+    if follow_symlinks:
+        try:
+            st = os.stat(root)
+        except OSError:
+            return
+        visited.add((st.st_dev, st.st_ino))
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if follow_symlinks:
+                        st = entry.stat()
+                        if (st.st_dev, st.st_ino) in visited:
+                            continue
+                        visited.add((st.st_dev, st.st_ino))
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=follow_symlinks):
+                    yield entry.path, entry.stat(follow_symlinks=follow_symlinks)
+            except OSError:
+                continue
+
+
+def _under(root):
+    """[low, high) bounds of the paths under root, for a range query on
+    the primary key"""
+    prefix = root.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+class BuildIdIndex:
+    """Build-id index stored in the SQLite database at path"""
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        version, = self._db.execute('PRAGMA user_version').fetchone()
+        if version != INDEX_FORMAT_VERSION:
+            with self._db:
+                self._db.execute('DROP TABLE IF EXISTS files')
+                self._db.executescript(_SCHEMA)
+                self._db.execute('PRAGMA user_version = %d' % INDEX_FORMAT_VERSION)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM files WHERE build_id IS NOT NULL').fetchone()[0]
+
+    def update(self, roots, workers=None, follow_symlinks=False):
+        """Crawl every directory in roots, parsing the files that are new
+        or whose mtime or size changed, in workers processes (see
+        scanner.scan_paths). Returns (parsed, unchanged, removed) counts"""
+        if isinstance(roots, (str, os.PathLike)):
+            roots = [roots]
+        counts = [0, 0, 0]
+        for root in roots:
+            root = os.path.abspath(os.fspath(root))
+            low, high = _under(root)
+            known = {path: (mtime_ns, size) for path, mtime_ns, size
+                     in self._db.execute('SELECT path, mtime_ns, size FROM files WHERE path >= ? AND path < ?',
+                                         (low, high))}
+            # (mtime_ns, size) of the files handed to the scanner, until
+            # their summary comes back
+            pending = {}
+
+            def changed_paths():
+                for path, st in _walk(root, follow_symlinks):
+                    identity = (st.st_mtime_ns, st.st_size)
+                    if known.pop(path, None) == identity:
+                        counts[1] += 1
+                        continue
+                    pending[path] = identity
+                    yield path
+
+            rows = []
+            for summary in scan_paths(changed_paths(), fields=_SCAN_FIELDS, workers=workers):
+                path = summary['path']
+                mtime_ns, size = pending.pop(path)
+                rows.append((path, mtime_ns, size, summary.get('build_id'), summary.get('debug_info')))
+                counts[0] += 1
+                if len(rows) >= _BATCH_SIZE:
+                    self._store(rows)
+                    rows = []
+            self._store(rows)
+
+            # whatever is left in known wasn't found by the walk
+            with self._db:
+                self._db.executemany('DELETE FROM files WHERE path = ?', ((path,) for path in known))
+            counts[2] += len(known)
+        return tuple(counts)
+
+    def _store(self, rows):
+        if not rows:
+            return
+        with self._db:
+            self._db.executemany('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)', rows)
+
+    def lookup(self, build_id):
+        """(binary path, debug file path) for build_id, a hex string or
+        bytes. Either is None if no crawled file fits. A file with both
+        code and debug info can be both"""
+        return self.lookup_many([build_id]).get(_normalize_build_id(build_id), (None, None))
+
+    def lookup_many(self, build_ids):
+        """lookup() for every build-id at once, such as every module of a
+        core file. Returns {hex build-id: (binary path, debug file path)}
+        for the build-ids that are in the index"""
+        build_ids = list({_normalize_build_id(build_id) for build_id in build_ids})
+        found = {}
+        # stay under SQLITE_MAX_VARIABLE_NUMBER on older sqlite builds
+        for start in range(0, len(build_ids), 900):
+            chunk = build_ids[start:start + 900]
+            query = ('SELECT build_id, path, debug_info FROM files WHERE build_id IN (%s)'
+                     % ', '.join('?'*len(chunk)))
+            for build_id, path, debug_info in self._db.execute(query, chunk):
+                found.setdefault(build_id, []).append((path, debug_info))
+
+        results = {}
+        for build_id, files in found.items():
+            binaries = sorted((_BINARY_ORDER[kind], path) for path, kind in files if kind in _BINARY_ORDER)
+            debug_files = sorted((_DEBUG_ORDER[kind], path) for path, kind in files if kind in _DEBUG_ORDER)
+            results[build_id] = (binaries[0][1] if binaries else None,
+                                 debug_files[0][1] if debug_files else None)
+        return results
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Persistent on-disk cache of decoded ElfParser tables.
+
+Entries are keyed by file identity, (st_dev, st_ino, st_size, st_mtime_ns),
+or optionally by a hash of the file contents. Each entry is one marshal
+file of builtin types. The cache directory is kept under max_bytes by
+evicting the least recently used entries.
+"""
+
+from collections import namedtuple
+from types import SimpleNamespace
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+
+from . import elfenums
+from . import records
+from .enumtables import enum_table
+from .parse_elf import ElfParser
+
+# bump when the layout of a cache entry changes
+CACHE_FORMAT_VERSION = 2
+
+_TABLES = ('sections', 'symbol_entries', 'dynamic_entries', 'relocation_entries')
+_RECORD_NAMES = {'sections': 'Section',
+                 'symbol_entries': 'Symbol',
+                 'dynamic_entries': 'Dyn',
+                 'relocation_entries': 'Relocation'}
+
+_record_classes = {}
+
+# unknown header values come back as plain ints, like ElfParser decodes them
+_ELFOSABI = enum_table(elfenums.ELFOSABI)
+_ET = enum_table(elfenums.ET)
+_EM = enum_table(elfenums.EM)
+
+
+def _record_class(bits, table, fields):
+    """The records class the parser uses for rows with these fields"""
+    key = (bits, table, fields)
+    record_class = _record_classes.get(key)
+    if record_class is None:
+        for candidate in records.get_records(bits).values():
+            if candidate._fields == fields:
+                record_class = candidate
+                break
+        else:
+            record_class = namedtuple(_RECORD_NAMES[table], fields)
+        _record_classes[key] = record_class
+    return record_class
+
+
+# stand in for the ElfW_Dyn d_un union
+DynUn = namedtuple('DynUn', ['d_val', 'd_ptr'])
+
+
+def _record_to_row(record):
+    fields = []
+    row = []
+    for k, v in zip(record._fields, record):
+        if k == 'd_un':
+            v = v.d_val
+        elif isinstance(v, int):
+            v = int(v)
+        fields.append(k)
+        row.append(v)
+    return tuple(fields), tuple(row)
+
+
+def _table_to_rows(records):
+    """(fields, rows) for a table. Tables can mix record types (.rel and
+    .rela relocations), so rows are grouped per field list"""
+    groups = []
+    for record in records:
+        fields, row = _record_to_row(record)
+        if not groups or groups[-1][0] != fields:
+            groups.append((fields, []))
+        groups[-1][1].append(row)
+    return groups
+
+
+def _rows_to_table(bits, table, groups):
+    entries = []
+    for fields, rows in groups:
+        record_class = _record_class(bits, table, fields)
+        if 'd_un' in fields:
+            d_un_index = fields.index('d_un')
+            for row in rows:
+                row = list(row)
+                row[d_un_index] = DynUn(row[d_un_index], row[d_un_index])
+                entries.append(record_class(*row))
+        else:
+            entries.extend(record_class(*row) for row in rows)
+    return entries
+
+
+class ParseCache:
+    """Cache of parsed files in directory.
+
+    key: 'stat' keys entries by (st_dev, st_ino, st_size, st_mtime_ns),
+         'content' by the sha256 of the file contents, which survives
+         copies and touches but has to read the whole file
+    max_bytes: upper bound on the total size of the cache files"""
+    def __init__(self, directory, max_bytes=256*1024*1024, key='stat'):
+        if key not in ('stat', 'content'):
+            raise ValueError("key must be 'stat' or 'content'")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.key = key
+        self._total_bytes = None
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, path):
+        if self.key == 'content':
+            h = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+        else:
+            st = os.stat(path)
+            h = hashlib.sha256(('%d:%d:%d:%d' % (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)).encode())
+        # the marshal format can change between python versions
+        h.update(('%d:%d:%d.%d' % ((CACHE_FORMAT_VERSION, marshal.version) + sys.version_info[:2])).encode())
+        return h.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.directory, key + '.elfcache')
+
+    def get(self, path):
+        """Cached entry for path, or None on a miss"""
+        entry_path = self._entry_path(self.key_for(path))
+        try:
+            with open(entry_path, 'rb') as f:
+                data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        # mark as recently used for eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return self._from_data(path, data)
+
+    def put(self, path, elf=None):
+        """Decode every table of path (or of an existing parser for it) and
+        store the result"""
+        if elf is None:
+            with ElfParser(path) as elf:
+                data = self._to_data(elf)
+        else:
+            data = self._to_data(elf)
+
+        encoded = marshal.dumps(data)
+        entry_path = self._entry_path(self.key_for(path))
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(encoded)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if self._total_bytes is not None:
+            self._total_bytes += len(encoded)
+        self._evict()
+        return self._from_data(path, data)
+
+    def load(self, path):
+        """Cached entry for path, parsing and storing it on a miss"""
+        cached = self.get(path)
+        if cached is None:
+            cached = self.put(path)
+        return cached
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.elfcache'):
+                os.unlink(entry.path)
+        self._total_bytes = 0
+
+    def _evict(self):
+        if self._total_bytes is not None and self._total_bytes <= self.max_bytes:
+            return
+
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.elfcache'):
+                continue
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(entry_path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+    @staticmethod
+    def _to_data(elf):
+        data = {'bits': elf.bits,
+                'endianness': elf.endianness,
+                'osabi': int(elf.osabi),
+                'e_type': int(elf.e_type),
+                'e_machine': int(elf.e_machine),
+                'needed_libraries': list(elf.needed_libraries),
+                'dynamic_flags': int(elf.dynamic_flags),
+                'symbols': dict(elf.symbols),
+                'dyn_symbols': dict(elf.dyn_symbols)}
+        for table in _TABLES:
+            data[table] = _table_to_rows(getattr(elf, table))
+        return data
+
+    @staticmethod
+    def _from_data(path, data):
+        """Rebuild the parser's public attributes. Header enums are restored,
+        enum valued record fields come back as plain ints"""
+        cached = SimpleNamespace(file=path,
+                                 bits=data['bits'],
+                                 endianness=data['endianness'],
+                                 osabi=_ELFOSABI(data['osabi']),
+                                 e_type=_ET(data['e_type']),
+                                 e_machine=_EM(data['e_machine']),
+                                 needed_libraries=data['needed_libraries'],
+                                 dynamic_flags=data['dynamic_flags'],
+                                 symbols=data['symbols'],
+                                 dyn_symbols=data['dyn_symbols'])
+        for table in _TABLES:
+            setattr(cached, table, _rows_to_table(data['bits'], table, data[table]))
+        return cached
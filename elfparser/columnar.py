@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Columnar (struct of arrays) views over the raw elf tables.
+
+numpy is an optional dependency, it is only imported once one of these
+views is created.
+"""
+
+from ctypes import sizeof, Structure, Union
+
+
+def _require_numpy():
+    """The numpy module, imported on first use"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for columnar views") from None
+    return numpy
+
+
+def ctypes_structure_to_dtype(structure, endianness):
+    """Build a numpy structured dtype with the same layout as a ctypes
+    elf structure, in the byte order of the elf file"""
+    numpy = _require_numpy()
+    byteorder = '<' if endianness == 'little' else '>'
+    names = []
+    formats = []
+    offsets = []
+    for name, typ in structure._fields_:
+        if issubclass(typ, (Structure, Union)):
+            raise TypeError("Nested structures are not supported: %s" % name)
+        kind = 'i' if typ._type_ in 'bhilq' else 'u'
+        names.append(name)
+        formats.append('%s%s%d' % (byteorder, kind, sizeof(typ)))
+        offsets.append(getattr(structure, name).offset)
+
+    return numpy.dtype({'names': names,
+                        'formats': formats,
+                        'offsets': offsets,
+                        'itemsize': sizeof(structure)})
+
+
+def view_c_array(c_array, dtype):
+    """Zero-copy, read-only numpy view of a ctypes array"""
+    numpy = _require_numpy()
+    if len(c_array) == 0:
+        records = numpy.zeros(0, dtype=dtype)
+    else:
+        records = numpy.frombuffer(c_array, dtype=dtype)
+    records.flags.writeable = False
+    return records
+
+
+class SymbolColumns:
+    """Symbol table as one numpy array per field. The field arrays are views
+    over the bytes of the symbol table, nothing is decoded until it is used"""
+    def __init__(self, sym_array, sym_structure, endianness, string_table):
+        self._records = view_c_array(sym_array,
+                                     ctypes_structure_to_dtype(sym_structure, endianness))
+        self._string_table = string_table
+        self.st_name = self._records['st_name']
+        self.st_value = self._records['st_value']
+        self.st_size = self._records['st_size']
+        self.st_info = self._records['st_info']
+        self.st_other = self._records['st_other']
+        self.st_shndx = self._records['st_shndx']
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def type(self):
+        """STT_* value of every symbol"""
+        return self.st_info & 0xf
+
+    @property
+    def binding(self):
+        """STB_* value of every symbol"""
+        return self.st_info >> 4
+
+    @property
+    def visibility(self):
+        """STV_* value of every symbol"""
+        return self.st_other & 0x3
+
+    def name(self, index):
+        if self._string_table is None:
+            return ''
+        return self._string_table[int(self.st_name[index])]
+
+    def names(self, indices=None):
+        """Names of the symbols at indices (all symbols by default)"""
+        if indices is None:
+            indices = range(len(self))
+        return [self.name(i) for i in indices]
+
+
+
+class RelocationColumns:
+    """Relocation table (SHT_REL or SHT_RELA) as one numpy array per field.
+    r_sym and r_type are split out of r_info for the whole table at once.
+    Symbol names are only looked up when asked for"""
+    def __init__(self, rel_array, rel_structure, endianness, bits, symbol_columns):
+        self._records = view_c_array(rel_array,
+                                     ctypes_structure_to_dtype(rel_structure, endianness))
+        self._symbol_columns = symbol_columns
+        self.r_offset = self._records['r_offset']
+        self.r_info = self._records['r_info']
+        if 'r_addend' in self._records.dtype.names:
+            self.r_addend = self._records['r_addend']
+        else:
+            # SHT_REL keeps the addend in the relocated field
+            numpy = _require_numpy()
+            self.r_addend = numpy.zeros(len(self._records), dtype=numpy.int64)
+        # ELF32_R_SYM/ELF32_R_TYPE and ELF64_R_SYM/ELF64_R_TYPE
+        if bits == 32:
+            self.r_sym = self.r_info >> 8
+            self.r_type = self.r_info & 0xff
+        else:
+            self.r_sym = self.r_info >> 32
+            self.r_type = self.r_info & 0xffffffff
+
+    def __len__(self):
+        return len(self._records)
+
+    def name(self, index):
+        r_sym = int(self.r_sym[index])
+        if self._symbol_columns is None or r_sym >= len(self._symbol_columns):
+            return ''
+        return self._symbol_columns.name(r_sym)
+
+    def names(self, indices=None):
+        """Symbol names of the relocations at indices (all by default)"""
+        if indices is None:
+            indices = range(len(self))
+        return [self.name(i) for i in indices]
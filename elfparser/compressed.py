@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Lazy decompression of compressed sections.
+
+SHF_COMPRESSED sections start with an ElfW_Chdr followed by a zlib or zstd
+stream. Legacy .zdebug_* sections start with b'ZLIB' and the big endian 64
+bit uncompressed size, followed by a zlib stream. Either way a section is
+decompressed in chunks, only as far as the furthest byte asked for so far.
+
+zstandard is an optional dependency, it is only needed for sections
+compressed with ELFCOMPRESS_ZSTD.
+"""
+
+from collections import OrderedDict
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# compressed bytes read, and decompressed bytes produced, per step
+CHUNK_SIZE = 1 << 20
+
+ZDEBUG_MAGIC = b'ZLIB'
+# magic and the big endian uncompressed size
+ZDEBUG_HEADER_SIZE = 12
+
+
+def _require_zstandard():
+    if zstandard is None:
+        raise ImportError("zstandard is required for zstd compressed sections")
+
+
+class _ZstdDecompressor:
+    """zstandard's decompressobj behind the parts of the zlib decompressobj
+    interface SectionStream uses. Output isn't bounded by max_length, a
+    step produces whatever one chunk of input decompresses to"""
+    unconsumed_tail = b''
+
+    def __init__(self):
+        _require_zstandard()
+        self._decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    @property
+    def eof(self):
+        return getattr(self._decompressor, 'eof', False)
+
+    def decompress(self, data, max_length=0):
+        return self._decompressor.decompress(data)
+
+    def flush(self):
+        return b''
+
+
+def zlib_decompressor():
+    return zlib.decompressobj()
+
+
+def zstd_decompressor():
+    return _ZstdDecompressor()
+
+
+class SectionStream:
+    """Decompressed contents of one section, produced on demand.
+
+    read_compressed(offset, size) returns the compressed bytes at offset
+    within the compressed stream, which is compressed_size long. Everything
+    decompressed so far is kept, so reads behind the furthest one so far
+    are free"""
+    def __init__(self, read_compressed, compressed_size, decompressor, size):
+        self._read_compressed = read_compressed
+        self._compressed_size = compressed_size
+        self._compressed_pos = 0
+        self._decompressor = decompressor
+        self._data = bytearray()
+        self.size = size
+
+    def __len__(self):
+        """Bytes decompressed so far"""
+        return len(self._data)
+
+    @property
+    def complete(self):
+        return self._decompressor is None
+
+    def _fill(self, end):
+        decompressor = self._decompressor
+        while decompressor is not None and len(self._data) < end:
+            if decompressor.unconsumed_tail:
+                data = decompressor.unconsumed_tail
+            elif self._compressed_pos < self._compressed_size:
+                data = self._read_compressed(self._compressed_pos,
+                                             min(CHUNK_SIZE, self._compressed_size - self._compressed_pos))
+                self._compressed_pos += len(data)
+                if len(data) == 0:
+                    # the section runs past the end of the file
+                    data = None
+            else:
+                data = None
+
+            if data is None:
+                # out of input. Output zlib held back for max_length comes
+                # out of flush, a truncated stream ends where its data does
+                self._data += decompressor.flush()
+                self._decompressor = decompressor = None
+                break
+            self._data += decompressor.decompress(data, CHUNK_SIZE)
+            if decompressor.eof:
+                self._decompressor = decompressor = None
+
+    def read(self, start=0, size=None):
+        """size bytes (up to the end by default) at start in the
+        decompressed section"""
+        end = self.size if size is None else min(start + size, self.size)
+        self._fill(end)
+        return bytes(self._data[start:end])
+
+
+class SectionCache:
+    """SectionStreams by section index, evicting the least recently used
+    ones once the bytes they have decompressed exceed max_bytes. The stream
+    being read is never evicted, even on its own past max_bytes"""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._streams = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._streams
+
+    def __len__(self):
+        return len(self._streams)
+
+    @property
+    def total_bytes(self):
+        return sum(len(stream) for stream in self._streams.values())
+
+    def get(self, key):
+        stream = self._streams.get(key)
+        if stream is not None:
+            self._streams.move_to_end(key)
+        return stream
+
+    def add(self, key, stream):
+        self._streams[key] = stream
+        self._streams.move_to_end(key)
+
+    def evict(self):
+        total = self.total_bytes
+        while total > self.max_bytes and len(self._streams) > 1:
+            _, stream = self._streams.popitem(last=False)
+            total -= len(stream)
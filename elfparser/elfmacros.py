@@ -302,6 +302,7 @@ SHF_GNU_RETAIN = (1 << 21)
 SHF_ORDERED = (1 << 30)
 SHF_EXCLUDE = (1 << 31)
 ELFCOMPRESS_ZLIB = 0x1
+ELFCOMPRESS_ZSTD = 0x2
 ELFCOMPRESS_LOOS = 0x60000000
 ELFCOMPRESS_HIOS = 0x6fffffff
 ELFCOMPRESS_LOPROC = 0x70000000
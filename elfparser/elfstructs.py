@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 from ctypes import c_ubyte, c_uint16, c_uint32, c_int32, c_uint64, c_int64, sizeof, cast, Structure, Union, ARRAY, POINTER, memmove, byref, addressof, Array
 import _ctypes
-from . import elfmacros
 from . import elfenums
 from .elftypes import elf32_addr, elf32_half, elf32_off, elf32_section, elf32_sword, elf32_sxword, elf32_versym, elf32_word, elf32_xword, elf64_addr, elf64_half, elf64_off, elf64_section, elf64_sword, elf64_sxword, elf64_versym, elf64_word, elf64_xword
 from types import new_class
@@ -464,10 +463,11 @@ class Elf32_aux_t_NonNative(NonNativeStructure, NiceHexFieldRepr, CtypesByteLeve
 
 
 class Elf32_Dyn_NonNative(NonNativeStructure, NiceHexFieldRepr, CtypesByteLevelManipulation):
-    class _Elf32_Dyn_d_un_NonNative(Union, metaclass=_swapped_meta):
-        _swappedbytes_ = None
-        _fields_ = [("d_val", elf32_word),
-                    ("d_ptr", elf32_addr)]
+    # _swapped_meta would lay the union out like a structure, so swap the
+    # member types directly
+    class _Elf32_Dyn_d_un_NonNative(Union):
+        _fields_ = [("d_val", _other_endian(elf32_word)),
+                    ("d_ptr", _other_endian(elf32_addr))]
     _fields_ = [("d_tag", elf32_sword),
                 ("d_un", _Elf32_Dyn_d_un_NonNative)]
 
@@ -481,10 +481,11 @@ class Elf64_aux_t_NonNative(NonNativeStructure, NiceHexFieldRepr, CtypesByteLeve
 
 
 class Elf64_Dyn_NonNative(NonNativeStructure, NiceHexFieldRepr, CtypesByteLevelManipulation):
-    class _Elf64_Dyn_d_un_NonNative(Union, metaclass=_swapped_meta):
-        _swappedbytes_ = None
-        _fields_ = [("d_val", elf64_xword),
-                    ("d_ptr", elf64_addr)]
+    # _swapped_meta would lay the union out like a structure, so swap the
+    # member types directly
+    class _Elf64_Dyn_d_un_NonNative(Union):
+        _fields_ = [("d_val", _other_endian(elf64_xword)),
+                    ("d_ptr", _other_endian(elf64_addr))]
     _fields_ = [("d_tag", elf64_sxword),
                 ("d_un", _Elf64_Dyn_d_un_NonNative)]
 
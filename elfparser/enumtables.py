@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Precomputed raw value -> enum member tables.
+
+Calling an IntEnum to convert a raw value goes through EnumMeta.__call__
+and __new__, which is slow when done for every symbol, section and
+relocation of a file, and raises ValueError for vendor specific values
+that aren't in the enum. EnumTable does the same conversion with a dict
+lookup and hands back the raw int for unknown values.
+"""
+
+import enum
+
+# composite flag values are cached as they are seen, bounded in case of
+# garbage input
+MAX_CACHED_FLAG_VALUES = 4096
+
+
+class EnumTable:
+    """Callable replacement for enum_class(value)"""
+    def __init__(self, enum_class):
+        self.enum_class = enum_class
+        self._is_flag = issubclass(enum_class, enum.Flag)
+        # aliases map to the canonical member, the same as enum_class(value)
+        self._table = {member.value: member for member in enum_class.__members__.values()}
+
+    def __call__(self, value):
+        member = self._table.get(value)
+        if member is None:
+            return self._missing(value)
+        return member
+
+    def _missing(self, value):
+        if self._is_flag is False:
+            return int(value)
+        member = self.enum_class(value)
+        if len(self._table) < MAX_CACHED_FLAG_VALUES:
+            self._table[value] = member
+        return member
+
+
+_enum_tables = {}
+
+
+def enum_table(enum_class):
+    """Shared EnumTable for enum_class"""
+    table = _enum_tables.get(enum_class)
+    if table is None:
+        table = _enum_tables[enum_class] = EnumTable(enum_class)
+    return table
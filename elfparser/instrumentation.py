@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Optional per stage instrumentation for ElfParser.
+
+    stats = ParseStats()
+    elf = ElfParser(path, stats=stats)
+    elf.relocation_entries
+    stats.as_dict()
+
+stats can also be any callable, it is called with a StageRecord every time a
+parse stage finishes. Parsers created without stats aren't touched at all,
+the stage methods are only wrapped on instrumented parsers.
+"""
+
+from collections import namedtuple
+import time
+
+# seconds and bytes_read are exclusive of nested stages, e.g. the
+# _parse_shdrs that _parse_symbol_entries triggers is recorded on its own.
+# bytes_read is what the stage read from the file (see ElfParser.bytes_read),
+# so it is 0 for parsers that don't load lazily.
+# Stages that build a view only set the view up, its records are decoded
+# when they are read. Every decode is reported as a record of the stage that
+# built the view with decoded=1 and entries=0, and is excluded from the
+# stage that was running when the record was read
+StageRecord = namedtuple('StageRecord', ['stage', 'seconds', 'bytes_read', 'entries', 'decoded'],
+                         defaults=(0,))
+
+# stage -> number of entries it decoded. Stages that build a view report the
+# length of the view
+_STAGE_ENTRIES = {'_parse_ident': lambda elf, result: 1,
+                  '_parse_ehdr': lambda elf, result: 1,
+                  '_parse_shdrs': lambda elf, result: len(elf._sections),
+                  '_parse_symbols': lambda elf, result: len(elf._symbols),
+                  '_parse_dyn_symbols': lambda elf, result: len(elf._dyn_symbols),
+                  '_parse_symbol_entries': lambda elf, result: len(elf._static_symbol_entries),
+                  '_parse_dyn_symbol_entries': lambda elf, result: len(elf._dyn_symbol_entries),
+                  '_parse_phdrs': lambda elf, result: len(elf._program_headers),
+                  '_parse_dyn_entries': lambda elf, result: len(elf._dynamic_entries),
+                  '_parse_versions': lambda elf, result: len(elf._versym),
+                  '_parse_version_symbols': lambda elf, result: len(elf._version_symbols),
+                  '_parse_rela_entries': lambda elf, result: len(result),
+                  '_parse_rel_entries': lambda elf, result: len(result)}
+
+# stage -> the RecordView it builds, whose decodes are timed
+_STAGE_VIEWS = {'_parse_shdrs': lambda elf, result: elf._sections,
+                '_parse_symbol_entries': lambda elf, result: elf._static_symbol_entries,
+                '_parse_dyn_symbol_entries': lambda elf, result: elf._dyn_symbol_entries,
+                '_parse_phdrs': lambda elf, result: elf._program_headers,
+                '_parse_dyn_entries': lambda elf, result: elf._dynamic_entries,
+                '_parse_rela_entries': lambda elf, result: result,
+                '_parse_rel_entries': lambda elf, result: result}
+
+
+class ParseStats:
+    """Totals per stage over every parser it is passed to. callback, if
+    given, is also called with every StageRecord"""
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.calls = {}
+        self.seconds = {}
+        self.bytes_read = {}
+        self.entries = {}
+        self.decoded = {}
+        self.decode_seconds = {}
+
+    def __call__(self, record):
+        stage = record.stage
+        if record.decoded:
+            self.calls.setdefault(stage, 0)
+            self.decoded[stage] = self.decoded.get(stage, 0) + record.decoded
+            self.decode_seconds[stage] = self.decode_seconds.get(stage, 0.0) + record.seconds
+        else:
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + record.seconds
+        self.bytes_read[stage] = self.bytes_read.get(stage, 0) + record.bytes_read
+        self.entries[stage] = self.entries.get(stage, 0) + record.entries
+        if self.callback is not None:
+            self.callback(record)
+
+    @property
+    def total_seconds(self):
+        return sum(self.seconds.values())
+
+    @property
+    def total_bytes_read(self):
+        return sum(self.bytes_read.values())
+
+    def as_dict(self):
+        return {stage: {'calls': self.calls[stage],
+                        'seconds': self.seconds[stage],
+                        'bytes_read': self.bytes_read[stage],
+                        'entries': self.entries[stage],
+                        'decoded': self.decoded.get(stage, 0),
+                        'decode_seconds': self.decode_seconds.get(stage, 0.0)}
+                for stage in self.calls}
+
+
+def instrument(elf, stats):
+    """Shadow the stage methods of one parser with wrappers that report to
+    stats"""
+    # one [child seconds, child bytes read] frame per running stage
+    frames = []
+    for stage, entries in _STAGE_ENTRIES.items():
+        setattr(elf, stage, _wrap_stage(elf, stage, getattr(elf, stage), entries, _STAGE_VIEWS.get(stage),
+                                        frames, stats))
+
+
+def _wrap_decode(elf, stage, decode, frames, stats):
+    def wrapper(entry):
+        bytes_before = elf.bytes_read
+        start = time.perf_counter()
+        try:
+            return decode(entry)
+        finally:
+            elapsed = time.perf_counter() - start
+            bytes_read = elf.bytes_read - bytes_before
+            if frames:
+                frames[-1][0] += elapsed
+                frames[-1][1] += bytes_read
+            stats(StageRecord(stage, elapsed, bytes_read, 0, 1))
+    return wrapper
+
+
+def _wrap_stage(elf, stage, method, entries, view, frames, stats):
+    def wrapper(*args, **kwargs):
+        frame = [0.0, 0]
+        frames.append(frame)
+        bytes_before = elf.bytes_read
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            bytes_read = elf.bytes_read - bytes_before
+            frames.pop()
+            if frames:
+                frames[-1][0] += elapsed
+                frames[-1][1] += bytes_read
+        stats(StageRecord(stage, elapsed - frame[0], bytes_read - frame[1], entries(elf, result)))
+        if view is not None:
+            # slices of the view share the wrapped decode
+            record_view = view(elf, result)
+            record_view._decode = _wrap_decode(elf, stage, record_view._decode, frames, stats)
+        return result
+    return wrapper
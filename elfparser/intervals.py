@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Sorted interval index for address lookups"""
+
+from bisect import bisect_right
+import sys
+
+
+def _is_numpy_array(addrs):
+    # numpy is optional, and an ndarray can only exist once something else
+    # imported numpy, so it is never imported here just for the check
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(addrs, numpy.ndarray)
+
+
+class IntervalIndex:
+    """Maps an address to the value of the interval [start, end) that
+    contains it. Built once, then queried with bisect, or searchsorted for
+    numpy arrays of addresses.
+    Intervals are allowed to overlap, the one with the greatest start wins"""
+    def __init__(self, intervals):
+        intervals = sorted(intervals, key=lambda i: (i[0], i[1]))
+        self.starts = [i[0] for i in intervals]
+        self.ends = [i[1] for i in intervals]
+        self.values = [i[2] for i in intervals]
+        # running maximum of the ends, lets find stop walking backwards as
+        # soon as no earlier interval can still contain the address
+        self._max_ends = []
+        max_end = None
+        for end in self.ends:
+            if max_end is None or end > max_end:
+                max_end = end
+            self._max_ends.append(max_end)
+        self._np_starts = None
+        self._np_ends = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _find_index(self, addr, i):
+        while i >= 0 and self._max_ends[i] > addr:
+            if addr < self.ends[i]:
+                return i
+            i -= 1
+        return None
+
+    def find(self, addr, default=None):
+        i = self._find_index(addr, bisect_right(self.starts, addr) - 1)
+        if i is None:
+            return default
+        return self.values[i]
+
+    def find_all(self, addrs, default=None):
+        """Batched find. addrs can be any iterable of addresses, numpy
+        arrays are searched with a single vectorized searchsorted"""
+        if _is_numpy_array(addrs):
+            return self._find_all_numpy(addrs, default)
+        return [self.find(addr, default) for addr in addrs]
+
+    def find_indices(self, addrs):
+        """Vectorized lookup for a numpy array of addresses. Returns an
+        array of interval indices and a boolean array that is False where
+        no interval contains the address"""
+        import numpy
+        if self._np_starts is None:
+            self._np_starts = numpy.array(self.starts, dtype=numpy.uint64)
+            self._np_ends = numpy.array(self.ends, dtype=numpy.uint64)
+            self._np_max_ends = numpy.array(self._max_ends, dtype=numpy.uint64)
+        addrs = numpy.asarray(addrs).astype(numpy.uint64, copy=False)
+        indices = numpy.searchsorted(self._np_starts, addrs, side='right').astype(numpy.int64) - 1
+        valid = indices >= 0
+        found = numpy.zeros(len(addrs), dtype=bool)
+        found[valid] = addrs[valid] < self._np_ends[indices[valid]]
+        # only addresses covered by an earlier, overlapping interval need
+        # the slow backwards walk
+        overlapped = numpy.zeros(len(addrs), dtype=bool)
+        overlapped[valid] = addrs[valid] < self._np_max_ends[indices[valid]]
+        for j in numpy.nonzero(overlapped & ~found)[0].tolist():
+            i = self._find_index(int(addrs[j]), int(indices[j]))
+            if i is not None:
+                indices[j] = i
+                found[j] = True
+        indices[~found] = 0
+        return indices, found
+
+    def _find_all_numpy(self, addrs, default):
+        if len(self) == 0:
+            return [default]*len(addrs)
+        indices, found = self.find_indices(addrs)
+        return [self.values[i] if hit else default
+                for i, hit in zip(indices.tolist(), found.tolist())]
+
+
+class SegmentMap(IntervalIndex):
+    """Translates between two address spaces (file offsets and virtual
+    addresses) through a list of (start, size, target_start) segments"""
+    def __init__(self, segments, inclusive_end=False):
+        extra = 1 if inclusive_end is True else 0
+        super().__init__([(start, start + size + extra, (start, target_start))
+                          for start, size, target_start in segments])
+        self._np_bases = None
+
+    def translate(self, addr, default=None):
+        bases = self.find(addr)
+        if bases is None:
+            return default
+        return addr - bases[0] + bases[1]
+
+    def translate_all(self, addrs, default=None):
+        """Batched translate. A numpy array of addresses is translated
+        without a python level loop and comes back as a masked uint64
+        array, masked where the address isn't in any segment. Any other
+        iterable comes back as a list with default for unmapped addresses"""
+        if not _is_numpy_array(addrs):
+            return [self.translate(addr, default) for addr in addrs]
+        numpy = sys.modules['numpy']
+
+        addrs = addrs.astype(numpy.uint64, copy=False)
+        if len(self) == 0:
+            return numpy.ma.masked_array(numpy.zeros(len(addrs), dtype=numpy.uint64),
+                                         mask=numpy.ones(len(addrs), dtype=bool))
+        if self._np_bases is None:
+            self._np_bases = numpy.array(self.values, dtype=numpy.uint64).reshape(-1, 2)
+        indices, found = self.find_indices(addrs)
+        result = addrs - self._np_bases[indices, 0] + self._np_bases[indices, 1]
+        return numpy.ma.masked_array(result, mask=~found)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Bulk reads for lazy loading.
+
+Lazily loaded tables used to be read with one seek and read each. The
+ReadPlanner instead takes the ranges that are about to be needed, merges
+the ones that are adjacent or close together, and reads each merged range
+with a single os.pread. Later reads are served out of those blocks without
+copying.
+"""
+
+from bisect import bisect_right
+from ctypes import c_ubyte
+import os
+
+
+def merge_ranges(ranges, gap=0, max_block=None):
+    """Sorted, merged (start, end) ranges covering every (offset, size) in
+    ranges. Ranges at most gap bytes apart are merged, as long as the
+    merged range stays within max_block bytes"""
+    merged = []
+    for offset, size in sorted(ranges):
+        if size <= 0:
+            continue
+        end = offset + size
+        if merged:
+            start, last_end = merged[-1]
+            if offset - last_end <= gap and (max_block is None or max(end, last_end) - start <= max_block):
+                merged[-1] = (start, max(end, last_end))
+                continue
+        merged.append((offset, end))
+    return merged
+
+
+class ReadPlanner:
+    """Reads from fd through a set of cached blocks.
+
+    fd: an os level file descriptor, or a file object, whose fileno is read
+        from for as long as the file object is open
+    base_offset: offset of the elf file within fd
+    gap: ranges that are at most this far apart are read together, reading
+         the bytes between them rather than issuing another read
+    max_block: upper bound on a merged read, ranges bigger than this are
+               still read in one go
+    min_read: a read that misses every block reads at least this much, so
+              the ehdr, the phdrs and often the shdrs arrive in one read"""
+    def __init__(self, fd, base_offset=0, gap=64*1024, max_block=16*1024*1024, min_read=4096):
+        self._file = None
+        if not isinstance(fd, int):
+            self._file = fd
+            fd = fd.fileno()
+        self.fd = fd
+        self._closed = False
+        self.base_offset = base_offset
+        self.gap = gap
+        self.max_block = max_block
+        self.min_read = min_read
+        self.bytes_read = 0
+        self.read_count = 0
+        # sorted by start, parallel lists so lookups can bisect
+        self._starts = []
+        self._blocks = []
+
+    @property
+    def closed(self):
+        return self._closed or (self._file is not None and self._file.closed)
+
+    def close(self):
+        """Stop reading from fd, which may be reused by another file once it
+        is closed. Cached blocks can still be read"""
+        self._closed = True
+        self._file = None
+
+    def _pread(self, offset, size):
+        if self.closed:
+            raise ValueError("I/O on closed parser")
+        # a short read only happens at the end of a regular file
+        block = bytearray(os.pread(self.fd, size, self.base_offset + offset))
+        self.read_count += 1
+        self.bytes_read += len(block)
+        return block
+
+    def _add_block(self, start, block):
+        i = bisect_right(self._starts, start)
+        self._starts.insert(i, start)
+        self._blocks.insert(i, block)
+
+    def _find_block(self, offset, size):
+        i = bisect_right(self._starts, offset) - 1
+        # blocks can overlap, so a block further back can still cover the range
+        while i >= 0:
+            start = self._starts[i]
+            block = self._blocks[i]
+            if offset + size <= start + len(block):
+                return start, block
+            i -= 1
+        return None
+
+    def prefetch(self, ranges):
+        """Read every (offset, size) range in ranges that isn't cached yet,
+        using as few reads as possible"""
+        missing = [(offset, size) for offset, size in ranges
+                   if size > 0 and self._find_block(offset, size) is None]
+        for start, end in merge_ranges(missing, self.gap, self.max_block):
+            self._add_block(start, self._pread(start, end - start))
+
+    def read_uncached(self, offset, size):
+        """size bytes at offset, from a cached block if one covers them,
+        otherwise read without keeping them. For data that is read once,
+        like the input of a decompressor"""
+        found = self._find_block(offset, size)
+        if found is None:
+            return self._pread(offset, size)
+        start, block = found
+        return block[offset - start:offset - start + size]
+
+    def read_block(self, offset, size):
+        """(block, position of offset in block) of the cached block that
+        covers size bytes at offset, reading it first on a miss"""
+        found = self._find_block(offset, size)
+        if found is None:
+            block = self._pread(offset, max(size, self.min_read))
+            self._add_block(offset, block)
+            found = (offset, block)
+        start, block = found
+        return block, offset - start
+
+    def read(self, offset, size):
+        """c_ubyte array of size bytes at offset, backed by a cached block"""
+        block, start = self.read_block(offset, size)
+        return (c_ubyte*size).from_buffer(block, start)
@@ -2,14 +2,59 @@
 
 from . import elfstructs
 from . import elfenums
-from . import elfmacros
 from . import constexpr
+from .enumtables import enum_table
+from . import columnar
+from .intervals import IntervalIndex, SegmentMap
+from .ioplan import ReadPlanner
+from .buffers import c_array_from_buffer
+from .strtab import StringTable
+from . import records
+from . import compressed
+from .views import RecordView, ChainView
 from ctypes import c_ubyte, sizeof, addressof, cast, POINTER, create_string_buffer, string_at
 from types import SimpleNamespace
-from collections import defaultdict, namedtuple
+from collections import defaultdict
+from array import array
 import _ctypes
-import _io
+import gc
 import io
+import mmap
+import os
+import struct
+import sys
+
+
+# elfmacros.ELFMAG, kept here so that parsing doesn't have to import elfmacros
+ELFMAG = b"\177ELF"
+# elfmacros.ELF_NOTE_GNU, the owner of the GNU notes
+ELF_NOTE_GNU = "GNU"
+
+
+# raw value -> enum decoding used in the hot loops below. Unknown values
+# decode to plain ints instead of raising
+_ELFOSABI = enum_table(elfenums.ELFOSABI)
+_ET = enum_table(elfenums.ET)
+_EM = enum_table(elfenums.EM)
+_SHT = enum_table(elfenums.SHT)
+_STT = enum_table(elfenums.STT)
+_STB = enum_table(elfenums.STB)
+_STV = enum_table(elfenums.STV)
+_PT = enum_table(elfenums.PT)
+_PF = enum_table(elfenums.PF)
+_DT = enum_table(elfenums.DT)
+_DF_1 = enum_table(elfenums.DF_1)
+
+# versym entries: the version index, and the bit marking a symbol that
+# isn't the default version of its name
+VERSYM_VERSION = 0x7fff
+VERSYM_HIDDEN = 0x8000
+
+# section types whose contents _parse_shdrs loads
+_PREFETCH_SECTION_TYPES = frozenset([elfenums.SHT.SHT_STRTAB, elfenums.SHT.SHT_SYMTAB,
+                                     elfenums.SHT.SHT_DYNSYM, elfenums.SHT.SHT_DYNAMIC,
+                                     elfenums.SHT.SHT_RELA, elfenums.SHT.SHT_REL,
+                                     elfenums.SHT.SHT_HASH, elfenums.SHT.SHT_GNU_HASH])
 
 
 def pull_stringtable(elf_array, shdr):
@@ -34,59 +79,283 @@ def string_at_offset(stringtable, offset=0, cast_to_str=True):
     return s
 
 
+def gnu_hash(name):
+    """dl_new_hash from glibc, the hash used by DT_GNU_HASH"""
+    h = 5381
+    for c in name:
+        h = (h * 33 + c) & 0xffffffff
+    return h
+
+
+def elf_hash(name):
+    """The SysV ABI hash used by DT_HASH"""
+    h = 0
+    for c in name:
+        h = (h << 4) + c
+        g = h & 0xf0000000
+        if g != 0:
+            h ^= g >> 24
+        h &= ~g
+    return h
+
+
+class RelocationSection:
+    """A single SHT_RELA or SHT_REL section. Entries are decoded the
+    first time they are read"""
+    def __init__(self, parser, index, name, array, is_rela, symbol_table_index, target_section_index):
+        self._parser = parser
+        self.index = index
+        self.name = name
+        self.is_rela = is_rela
+        # sh_link, the symbol table the relocations refer to
+        self.symbol_table_index = symbol_table_index
+        # sh_info, the section the relocations apply to. 0 for dynamic
+        # relocations that aren't tied to a single section
+        self.target_section_index = target_section_index
+        self._array = array
+        self._entries = None
+
+    def __len__(self):
+        return len(self._array)
+
+    def __repr__(self):
+        return '%s(%r, entries=%d)' % (self.__class__.__name__, self.name, len(self))
+
+    @property
+    def target_section(self):
+        if self.target_section_index == 0:
+            return None
+        return self._parser.sections[self.target_section_index]
+
+    def columns(self):
+        """numpy backed columnar view of this section. Requires numpy"""
+        return self._parser._relocation_columns(self)
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            if self.is_rela is True:
+                self._entries = self._parser._parse_rela_entries(self)
+            else:
+                self._entries = self._parser._parse_rel_entries(self)
+        return self._entries
+
+
+def _supports_buffer(obj):
+    try:
+        memoryview(obj)
+    except TypeError:
+        return False
+    return True
+
+
+def _is_regular_file_object(file):
+    """True for file objects that sit directly on an os level file, so
+    reads can go to their fileno. Compressed streams and sockets have a
+    fileno as well, but its contents aren't the stream's"""
+    file = getattr(file, 'raw', file)
+    return isinstance(file, io.FileIO)
+
+
+# tables an mmap parser builds on the mapping, see ElfParser.close
+_MMAP_BACKED_ATTRIBUTES = ('_find_buffer', '_ehdr', '_phdr_array', '_load_entries', '_shdr_array',
+                           '_shstrtab', '_sections', '_program_headers', '_sym_array', '_dyn_sym_array',
+                           '_dyn_array', '_static_symbol_entries', '_dyn_symbol_entries', '_dynamic_entries',
+                           '_relocation_sections', '_relocation_entries', '_symbol_tables', '_string_tables',
+                           '_string_table', '_dynamic_string_table', '_gnu_hash_table', '_hash_table',
+                           '_got', '_got_plt')
+
+
 class ElfParser:
-    def __init__(self, file, lazy_load=True):
-        if isinstance(file, (io.TextIOWrapper)) or issubclass(file.__class__, (_io._TextIOBase)):
-            self.file = file.name
-            self._fd = file
-            self.__original_offset = self._fd.tell()
-        elif isinstance(file, str):
-            self.file = file
+    def __init__(self, file, lazy_load=True, use_mmap=False, stats=None,
+                 section_cache_bytes=64*1024*1024):
+        """
+        file: a path (str or os.PathLike), a binary file object, or an
+              object that supports the buffer protocol (bytes, bytearray,
+              memoryview, mmap, ...). Buffers are parsed in place without
+              copying
+        lazy_load: read each table from the file as it is needed instead of
+                   reading the whole file up front
+        use_mmap: map the file copy-on-write and build every table directly
+                  on top of the mapping. Nothing is copied into the python
+                  heap, so this takes precedence over lazy_load
+        stats: instrumentation.ParseStats, or any callable taking a
+               StageRecord, that gets the time, bytes read and entry count
+               of every parse stage
+        section_cache_bytes: bound on the decompressed section data kept by
+                             section_data, least recently used sections
+                             are dropped first
+        """
+        self._fd = None
+        self._owns_fd = False
+        self.__original_offset = 0
+        buffer = None
+        if isinstance(file, (str, os.PathLike)):
+            self.file = os.fsdecode(file)
             self._fd = open(file, "rb")
-            self.__original_offset = 0
+            self._owns_fd = True
+        elif _supports_buffer(file):
+            # bytes, bytearray, memoryview, mmap or any other object that
+            # supports the buffer protocol
+            self.file = None
+            buffer = file
+        elif hasattr(file, 'read'):
+            # binary file object, parsed from its current position. A text
+            # file object's position and read ahead are in characters, the
+            # bytes under them can't be found reliably
+            if isinstance(file, io.TextIOBase):
+                raise TypeError("file objects must be opened in binary mode")
+            self.file = getattr(file, 'name', None)
+            if hasattr(file, 'getbuffer'):
+                # io.BytesIO, parse its buffer in place
+                buffer = file.getbuffer()[file.tell():]
+            elif _is_regular_file_object(file):
+                self._fd = file
+                self.__original_offset = self._fd.tell()
+            else:
+                buffer = file.read()
+                if isinstance(buffer, str):
+                    raise TypeError("file objects must be opened in binary mode")
         else:
-            raise NotImplementedError("file must be a filepath or ")
-        self.sections = []
+            raise TypeError("file must be a path, a file object or a buffer, not %s"
+                            % file.__class__.__name__)
         self.segments = []
-        self.symbols = {}
-        self.dyn_symbols = {}
-        self.symbol_entries = []
-        self.dynamic_entries = []
-        self.relocation_entries = []
-        self.program_headers = []
-        self.needed_libraries = []
+        self._shdr_array = None
+        self._shstrtab = None
+        # every table below is parsed the first time its property is read
+        self._sections = None
+        self._symbols = None
+        self._dyn_symbols = None
+        self._static_symbol_entries = None
+        self._dyn_symbol_entries = None
+        self._dynamic_entries = None
+        self._relocation_entries = None
+        self._program_headers = None
+        self._needed_libraries = []
+        self._soname = None
+        self._rpath = []
+        self._runpath = []
         self._sym_array = []
         self._dyn_sym_array = []
-        self._rela_array = []
-        self._rel_array = []
-        self.dynamic_flags = 0
-        self.relocation_enum = None
-        self.address = 0
-        self.got = None
-        self.got_plt = None
+        self._dyn_array = []
+        self._relocation_sections = []
+        self._symtab_section_index = None
+        self._dynsym_section_index = None
+        self._dynstr_section_index = None
+        self._versym_section_index = None
+        self._verdef_section_index = None
+        self._verneed_section_index = None
+        self._symbol_tables = {}
+        self._string_tables = {}
+        self._section_indices = None
+        self._section_cache = compressed.SectionCache(section_cache_bytes)
+        self._versym = None
+        self._versions = None
+        self._needed_versions = None
+        self._version_files = None
+        self._version_symbols = None
+        self._string_table = None
+        self._dynamic_string_table = None
+        self._gnu_hash_table = None
+        self._hash_table = None
+        self._hash_entry_size = 4
+        self._dynamic_symbols_located = False
+        self._dynamic_flags = 0
+        self._relocation_enum = None
+        self._address = 0
+        self._symbol_index = None
+        self._got = None
+        self._got_plt = None
         self._load_entries = []
 
         # alternate strategy for casting from bytes
         # ehdr = ((Elf32_Ehdr*1).from_buffer(bytearray(f.read(sizeof(Elf32_Ehdr)))))[0]
 
+        self._mmap = None
+        self._reader = None
+        # buffer with a find method under __elf_array, and the offset of the
+        # file in it, for searching string tables in place
+        self._find_buffer = None
+        self._find_offset = 0
+        self._bytes_read = 0
+        self._read_count = 0
         self._lazy_load = lazy_load
-        if self._lazy_load is False:
+        if buffer is not None:
+            # already in memory, tables are built on top of it without copies
+            self._lazy_load = False
+            self.__elf_array = c_array_from_buffer(buffer)
+            if isinstance(buffer, (bytes, bytearray, mmap.mmap)):
+                self._find_buffer = buffer
+        elif use_mmap is True:
+            # ACCESS_COPY instead of ACCESS_READ because ctypes from_buffer
+            # needs a writable buffer. pages are only copied if written to
+            self._lazy_load = False
+            self._mmap = mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_COPY)
+            self.__elf_array = (c_ubyte*(len(self._mmap) - self.__original_offset)).from_buffer(self._mmap, self.__original_offset)
+            self._find_buffer = self._mmap
+            self._find_offset = self.__original_offset
+        elif self._lazy_load is False:
             e = self._fd.read()
-            self.__elf_array = (c_ubyte*len(e)).from_buffer(bytearray(e))
+            self._bytes_read = len(e)
+            self._read_count = 1
+            self._find_buffer = bytearray(e)
+            self.__elf_array = (c_ubyte*len(e)).from_buffer(self._find_buffer)
         else:
             self.__elf_array = None
+            self._reader = ReadPlanner(self._fd, self.__original_offset)
+
+        if stats is not None:
+            from .instrumentation import instrument
+            instrument(self, stats)
 
         self._parse_ident()
         self._apply_elf_structures()
         self._constexpr = constexpr.ELF32_CONSTEXPR if self.bits == 32 else constexpr.ELF64_CONSTEXPR
         self._parse_ehdr()
-        self.relocation_enum = self._get_relocation_enum_for_machine()
-        self._parse_shdrs()
-        self._parse_symbol_entries()
-        self._parse_phdrs()
-        self._parse_dyn_entries()
-        self._parse_rela_entries()
-        self._parse_rel_entries()
+
+    def close(self):
+        """Close the file if the parser opened it. Tables that were
+        already parsed stay usable, a lazy parser raises ValueError for a
+        table that still has to be read from the file. A use_mmap parser's
+        tables are built on the mapping, so they are dropped and the mapping
+        is closed. Views and arrays of an mmap parser that the caller still
+        holds can't be read any more, but keep the mapping alive until they
+        are gone"""
+        if self._mmap is not None:
+            self._release_mmap()
+        if self._reader is not None:
+            # the fd number can be reused by the next file opened, tables
+            # that aren't cached yet must not be read from it
+            self._reader.close()
+        if self._owns_fd is True:
+            self._fd.close()
+
+    def _release_mmap(self):
+        # every ctypes object over the mapping holds an export of it, and
+        # mmap.close raises BufferError while there are any
+        for name in _MMAP_BACKED_ATTRIBUTES:
+            setattr(self, name, None)
+        self.__elf_array = None
+        self._section_cache = compressed.SectionCache(self._section_cache.max_bytes)
+        try:
+            self._mmap.close()
+        except BufferError:
+            # ctypes cast leaves reference cycles behind, so the dropped
+            # tables may only be freed by the cycle collector
+            gc.collect()
+            try:
+                self._mmap.close()
+            except BufferError:
+                # still exported to something the caller kept, the mapping
+                # is unmapped once the last of them goes
+                pass
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
     def address(self):
@@ -94,31 +363,188 @@ class ElfParser:
 
     @address.setter
     def address(self, value):
-        for k in self.symbols.keys():
-            self.symbols[k] = self.symbols[k] - self._address + value
+        # symbols that haven't been parsed yet get the new address applied
+        # when they are parsed
+        if self._symbols is not None:
+            for k in self._symbols.keys():
+                self._symbols[k] = self._symbols[k] - self._address + value
 
         self._address = value
+        self._symbol_index = None
 
-    def _get_c_array_at_offset(self, offset, size, reset_pos=True):
-        memory_class = (c_ubyte*size)
-        if self._lazy_load is True:
-            orig_pos = self._fd.tell()
-            self._fd.seek(self.__original_offset + offset)
-            buffer = memory_class.from_buffer(bytearray(self._fd.read(size)))
-            if reset_pos is True:
-                self._fd.seek(orig_pos)
-        else:
-            buffer = memory_class.from_buffer(self.__elf_array, offset)
+    @property
+    def bytes_read(self):
+        """Bytes read from the file so far. Pages of a use_mmap parser are
+        faulted in by the os and aren't counted"""
+        if self._reader is not None:
+            return self._reader.bytes_read
+        return self._bytes_read
+
+    @property
+    def read_count(self):
+        """Number of reads issued to the file so far"""
+        if self._reader is not None:
+            return self._reader.read_count
+        return self._read_count
+
+    @property
+    def relocation_enum(self):
+        # only the relocation enum for this machine is ever created
+        if self._relocation_enum is None:
+            self._relocation_enum = self._get_relocation_enum_for_machine()
+        return self._relocation_enum
 
-        return buffer
+    @property
+    def sections(self):
+        if self._sections is None:
+            self._parse_shdrs()
+        return self._sections
+
+    @property
+    def got(self):
+        self.sections
+        return self._got
+
+    @property
+    def got_plt(self):
+        self.sections
+        return self._got_plt
+
+    @property
+    def symbols(self):
+        if self._symbols is None:
+            self._parse_symbols()
+        return self._symbols
+
+    @property
+    def dyn_symbols(self):
+        if self._dyn_symbols is None:
+            self._parse_dyn_symbols()
+        return self._dyn_symbols
+
+    @property
+    def symbol_entries(self):
+        """.symtab entries followed by .dynsym entries"""
+        if self._static_symbol_entries is None:
+            self._parse_symbol_entries()
+        if self._dyn_symbol_entries is None:
+            self._parse_dyn_symbol_entries()
+        return ChainView(self._static_symbol_entries, self._dyn_symbol_entries)
+
+    @property
+    def program_headers(self):
+        if self._program_headers is None:
+            self._parse_phdrs()
+        return self._program_headers
+
+    @property
+    def dynamic_entries(self):
+        if self._dynamic_entries is None:
+            self._parse_dyn_entries()
+        return self._dynamic_entries
+
+    @property
+    def needed_libraries(self):
+        self.dynamic_entries
+        return self._needed_libraries
+
+    @property
+    def soname(self):
+        """DT_SONAME, None if there isn't one"""
+        self.dynamic_entries
+        return self._soname
+
+    @property
+    def rpath(self):
+        """Directories of DT_RPATH, unexpanded"""
+        self.dynamic_entries
+        return self._rpath
+
+    @property
+    def runpath(self):
+        """Directories of DT_RUNPATH, unexpanded"""
+        self.dynamic_entries
+        return self._runpath
+
+    @property
+    def dynamic_flags(self):
+        self.dynamic_entries
+        return self._dynamic_flags
+
+    @property
+    def versym(self):
+        """Raw .gnu.version entries, an array('H') aligned with .dynsym.
+        Empty if the file has no symbol versions"""
+        if self._versym is None:
+            self._parse_versions()
+        return self._versym
+
+    @property
+    def versions(self):
+        """versym index (VERSYM_VERSION bits) -> version name, for the
+        versions defined in .gnu.version_d and needed in .gnu.version_r"""
+        if self._versions is None:
+            self._parse_versions()
+        return self._versions
+
+    @property
+    def needed_versions(self):
+        """needed file -> names of the versions needed from it, in
+        .gnu.version_r order"""
+        if self._needed_versions is None:
+            self._parse_versions()
+        return self._needed_versions
+
+    @property
+    def version_symbols(self):
+        """version name -> sorted .dynsym indices of the symbols with that
+        version"""
+        if self._version_symbols is None:
+            self._parse_version_symbols()
+        return self._version_symbols
+
+    @property
+    def relocation_sections(self):
+        self.sections
+        return self._relocation_sections
+
+    @property
+    def relocation_entries(self):
+        if self._relocation_entries is None:
+            self._relocation_entries = ChainView(*[relocation_section.entries
+                                                   for relocation_section in self.relocation_sections])
+        return self._relocation_entries
+
+    def _get_c_array_at_offset(self, offset, size):
+        if self._reader is not None:
+            return self._reader.read(offset, size)
+        return (c_ubyte*size).from_buffer(self.__elf_array, offset)
+
+    def _get_string_table_at_offset(self, offset, size):
+        """StringTable over size bytes at offset, searched in place in the
+        read planner block, the mmap or the buffer holding them"""
+        if self._reader is not None:
+            block, start = self._reader.read_block(offset, size)
+            return StringTable(block, start, size)
+        if self._find_buffer is not None:
+            return StringTable(self._find_buffer, self._find_offset + offset, size)
+        return StringTable(self._get_c_array_at_offset(offset, size))
+
+    def _read_bytes(self, offset, size):
+        """size bytes at offset for one time use, the read planner doesn't
+        keep them"""
+        if self._reader is not None:
+            return self._reader.read_uncached(offset, size)
+        return string_at(addressof(self.__elf_array) + offset,
+                         max(0, min(size, len(self.__elf_array) - offset)))
 
     def _parse_ident(self):
-        ident_buf = self._get_c_array_at_offset(self.__original_offset, sizeof(elfstructs.Elf_Ident))
+        ident_buf = self._get_c_array_at_offset(0, sizeof(elfstructs.Elf_Ident))
         # ident_buf_class = c_ubyte*sizeof(elfstructs.Elf_Ident)
         # ident_buf = ident_buf_class.from_buffer(bytearray(self._fd.read(sizeof(elfstructs.Elf_Ident))))
         ident = cast(ident_buf, POINTER(elfstructs.Elf_Ident)).contents
         # confirm elf magic
-        if bytes(ident.ei_elfmag) != elfmacros.ELFMAG:
+        if bytes(ident.ei_elfmag) != ELFMAG:
             raise Exception("Elf magic not present")
 
         self.elfclass = elfenums.ELFCLASS(ident.ei_class)
@@ -131,11 +557,13 @@ class ElfParser:
         self._endianness_flag = elfenums.ELFDATA(ident.ei_data)
         if self._endianness_flag == elfenums.ELFDATA.ELFDATA2LSB:
             self.endianness = "little"
+            self._struct_byteorder = "<"
         elif self._endianness_flag == elfenums.ELFDATA.ELFDATA2MSB:
             self.endianness = "big"
+            self._struct_byteorder = ">"
         else:
             raise Exception("Invalid ELFDATA")
-        self.osabi = elfenums.ELFOSABI(ident.ei_osabi)
+        self.osabi = _ELFOSABI(ident.ei_osabi)
 
     def _apply_elf_structures(self):
         # get appropriate elf structures for the bitness and endianness found
@@ -147,53 +575,73 @@ class ElfParser:
             # create buffers/backings for every basic elf class
             memory_class = c_ubyte*sizeof(v)
             setattr(self, prefix + k + '_memory_class', memory_class)
+        self._records = records.get_records(self.bits)
 
     def _parse_ehdr(self):
         """Parse ElfXX_Ehdr"""
-        ehdr_buf = self._get_c_array_at_offset(self.__original_offset, sizeof(self._ElfW_Ehdr_memory_class))
+        ehdr_buf = self._get_c_array_at_offset(0, sizeof(self._ElfW_Ehdr_memory_class))
         ehdr = self._ehdr = cast(ehdr_buf, POINTER(self._ElfW_Ehdr)).contents
-        self.e_type = elfenums.ET(ehdr.e_type)
-        self.e_machine = elfenums.EM(ehdr.e_machine)
+        self.e_type = _ET(ehdr.e_type)
+        self.e_machine = _EM(ehdr.e_machine)
 
+        # setup progam header array / segment array
+        phdr_array_memory_class = self._ElfW_Phdr*ehdr.e_phnum
+        phdr_array_buffer = self._get_c_array_at_offset(ehdr.e_phoff, ehdr.e_phentsize*ehdr.e_phnum)
+        self._phdr_array = cast(phdr_array_buffer, POINTER(phdr_array_memory_class)).contents
+
+    def _read_shdr_table(self):
+        """Read the section header array and .shstrtab, nothing else"""
+        if self._shdr_array is not None:
+            return
+        ehdr = self._ehdr
         # setup section header array
         shdr_array_memory_class = self._ElfW_Shdr*ehdr.e_shnum
         # get backing of the whole section header array
         shdr_array_buffer = self._get_c_array_at_offset(ehdr.e_shoff, ehdr.e_shentsize*ehdr.e_shnum)
         self._shdr_array = cast(shdr_array_buffer, POINTER(shdr_array_memory_class)).contents
+        if ehdr.e_shnum == 0:
+            return
 
         # string table for section header names
         shstrshdr = self._shdr_array[ehdr.e_shstrndx]
-        self._shstrtab = self._get_c_array_at_offset(shstrshdr.sh_offset, shstrshdr.sh_size)
-
-        # setup progam header array / segment array
-        phdr_array_memory_class = self._ElfW_Phdr*ehdr.e_phnum
-        phdr_array_buffer = self._get_c_array_at_offset(ehdr.e_phoff, ehdr.e_phentsize*ehdr.e_phnum)
-        self._phdr_array = cast(phdr_array_buffer, POINTER(phdr_array_memory_class)).contents
+        self._shstrtab = self._get_string_table_at_offset(shstrshdr.sh_offset, shstrshdr.sh_size)
 
     def _parse_shdrs(self):
+        self._read_shdr_table()
+        # records are only decoded when the view is indexed
+        self._sections = RecordView(self._shdr_array, self._decode_section_entry)
+        if self._ehdr.e_shnum == 0:
+            return
+
+        if self._reader is not None:
+            # every table the loop below loads, in as few reads as possible
+            self._reader.prefetch([(shdr.sh_offset, shdr.sh_size) for shdr in self._shdr_array
+                                   if shdr.sh_type in _PREFETCH_SECTION_TYPES
+                                   or (shdr.sh_type == elfenums.SHT.SHT_PROGBITS
+                                       and self._shstrtab[shdr.sh_name] in ('.got', '.got.plt'))])
+
         # maybe check for  weird occurrances here, like having 7 string tables
-        # TODO: make a subclass of namedtuple that only prints certain fields in the repr
-        section_tuple = namedtuple('Section', ['name', 'type'] + list(dict(self._ElfW_Shdr._fields_).keys()))
-        for shdr in self._shdr_array:
-            section_type = elfenums.SHT(shdr.sh_type)
-            section_name = string_at_offset(self._shstrtab, shdr.sh_name)
+        for section_index, shdr in enumerate(self._shdr_array):
+            section_type = _SHT(shdr.sh_type)
+            section_name = self._shstrtab[shdr.sh_name]
             if section_type == elfenums.SHT.SHT_STRTAB and section_name == '.strtab':
-                self._string_table = self._get_c_array_at_offset(shdr.sh_offset,
-                                                                  shdr.sh_size)
+                self._string_table = self._get_string_table_at_offset(shdr.sh_offset, shdr.sh_size)
             elif section_type == elfenums.SHT.SHT_STRTAB and section_name == '.dynstr':
-                self._dynamic_string_table = self._get_c_array_at_offset(shdr.sh_offset,
-                                                                          shdr.sh_size)
+                self._dynamic_string_table = self._get_string_table_at_offset(shdr.sh_offset, shdr.sh_size)
+                self._dynstr_section_index = section_index
             elif section_type == elfenums.SHT.SHT_DYNSYM and section_name == '.dynsym':
                 dyn_sym_array_memory_class = self._ElfW_Sym * (shdr.sh_size // sizeof(self._ElfW_Sym))
                 dyn_sym_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
                                                                     shdr.sh_size)
 
                 self._dyn_sym_array = cast(dyn_sym_array_buffer, POINTER(dyn_sym_array_memory_class)).contents
+                self._dynsym_section_index = section_index
             elif section_type == elfenums.SHT.SHT_SYMTAB and section_name == '.symtab':
                 sym_array_memory_class = self._ElfW_Sym * (shdr.sh_size // sizeof(self._ElfW_Sym))
                 sym_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
                                                                 shdr.sh_size)
                 self._sym_array = cast(sym_array_buffer, POINTER(sym_array_memory_class)).contents
+                self._symtab_section_index = section_index
             elif section_type == elfenums.SHT.SHT_DYNAMIC and section_name == '.dynamic':
                 dyn_array_memory_class = self._ElfW_Dyn * (shdr.sh_size // sizeof(self._ElfW_Dyn))
                 dyn_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
@@ -203,140 +651,738 @@ class ElfParser:
                 rela_array_memory_class = self._ElfW_Rela * (shdr.sh_size // sizeof(self._ElfW_Rela))
                 rela_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
                                                                  shdr.sh_size)
-                self._rela_array = cast(rela_array_buffer, POINTER(rela_array_memory_class)).contents
+                rela_array = cast(rela_array_buffer, POINTER(rela_array_memory_class)).contents
+                self._relocation_sections.append(RelocationSection(self, section_index, section_name,
+                                                                   rela_array, True,
+                                                                   shdr.sh_link, shdr.sh_info))
             elif section_type == elfenums.SHT.SHT_REL:
                 rel_array_memory_class = self._ElfW_Rel * (shdr.sh_size // sizeof(self._ElfW_Rel))
                 rel_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
                                                                 shdr.sh_size)
-                self._rel_array = cast(rel_array_buffer, POINTER(rel_array_memory_class)).contents
+                rel_array = cast(rel_array_buffer, POINTER(rel_array_memory_class)).contents
+                self._relocation_sections.append(RelocationSection(self, section_index, section_name,
+                                                                   rel_array, False,
+                                                                   shdr.sh_link, shdr.sh_info))
+            elif section_type == elfenums.SHT.SHT_GNU_HASH:
+                self._gnu_hash_table = self._get_c_array_at_offset(shdr.sh_offset,
+                                                                    shdr.sh_size)
+            elif section_type == elfenums.SHT.SHT_HASH:
+                self._hash_table = self._get_c_array_at_offset(shdr.sh_offset,
+                                                                shdr.sh_size)
+                # alpha and s390x use 64 bit hash entries
+                if shdr.sh_entsize == 8:
+                    self._hash_entry_size = 8
+            elif section_type == elfenums.SHT.SHT_GNU_versym:
+                self._versym_section_index = section_index
+            elif section_type == elfenums.SHT.SHT_GNU_verdef:
+                self._verdef_section_index = section_index
+            elif section_type == elfenums.SHT.SHT_GNU_verneed:
+                self._verneed_section_index = section_index
             elif section_type == elfenums.SHT.SHT_PROGBITS and section_name == '.got':
-                self.got = self._get_c_array_at_offset(shdr.sh_offset,
-                                                        shdr.sh_size)
+                self._got = self._get_c_array_at_offset(shdr.sh_offset,
+                                                         shdr.sh_size)
             elif section_type == elfenums.SHT.SHT_PROGBITS and section_name == '.got.plt':
-                self.got_plt = self._get_c_array_at_offset(shdr.sh_offset,
-                                                        shdr.sh_size)
-
-            section_dict = dict(shdr)
-            section_dict['name'] = section_name
-            section_dict['type'] = section_type
+                self._got_plt = self._get_c_array_at_offset(shdr.sh_offset,
+                                                             shdr.sh_size)
 
-            # self.sections.append(elfstructs.Shdr(**section_dict))
-            self.sections.append(section_tuple(**section_dict))
+    def _decode_section_entry(self, shdr):
+        return self._records['Section']._from_struct((self._shstrtab[shdr.sh_name], _SHT(shdr.sh_type)), shdr)
 
-    def _parse_symbol_entries(self):
-        extra_fields = ['name', 'type', 'binding', 'visibility']
-        sym_tuple = namedtuple('Symbol', extra_fields + list(dict(self._ElfW_Sym._fields_).keys()))
+    def _parse_symbols(self):
+        """name -> address of every .symtab symbol with a value"""
+        self.sections
+        self._symbols = {}
         for sym in self._sym_array:
-            symbol_name = string_at_offset(self._string_table, sym.st_name)
-            info_raw = sym.st_info
-            # decode sym type and binding
-            symbol_type = elfenums.STT(constexpr.ELF64_ST_TYPE(info_raw))
-            symbol_binding = elfenums.STB(constexpr.ELF64_ST_BIND(info_raw))
-            symbol_visibility = elfenums.STV(sym.st_other)
             if sym.st_value != 0:
-                self.symbols[symbol_name] = sym.st_value
-
-            symbol_entry_dict = dict(sym)
-            symbol_entry_dict['name'] = symbol_name
-            symbol_entry_dict['type'] = symbol_type
-            symbol_entry_dict['binding'] = symbol_binding
-            symbol_entry_dict['visibility'] = symbol_visibility
-            # self.symbol_entries.append(elfstructs.Sym(**symbol_entry_dict))
-            self.symbol_entries.append(sym_tuple(**symbol_entry_dict))
+                self._symbols[self._string_table[sym.st_name]] = sym.st_value + self._address
 
+    def _parse_dyn_symbols(self):
+        """name -> value of every .dynsym symbol"""
+        self.sections
+        self._dyn_symbols = {}
         # not sure if these ever actually have values set, might need to re evaluate
         for sym in self._dyn_sym_array:
-            symbol_name = string_at_offset(self._dynamic_string_table, sym.st_name)
-            info_raw = sym.st_info
-            # decode sym type and binding
-            symbol_type = elfenums.STT(constexpr.ELF64_ST_TYPE(info_raw))
-            symbol_binding = elfenums.STB(constexpr.ELF64_ST_BIND(info_raw))
-            symbol_visibility = elfenums.STV(sym.st_other)
-            # if sym.st_value != 0:
-            self.dyn_symbols[symbol_name] = sym.st_value
-
-            symbol_entry_dict = dict(sym)
-            symbol_entry_dict['name'] = symbol_name
-            symbol_entry_dict['type'] = symbol_type
-            symbol_entry_dict['binding'] = symbol_binding
-            symbol_entry_dict['visibility'] = symbol_visibility
-            self.symbol_entries.append(elfstructs.Sym(**symbol_entry_dict))
+            self._dyn_symbols[self._dynamic_string_table[sym.st_name]] = sym.st_value
+
+    def _parse_symbol_entries(self):
+        """View of the .symtab symbol entries"""
+        self.sections
+        self._static_symbol_entries = RecordView(self._sym_array, self._decode_symtab_entry)
+
+    def _parse_dyn_symbol_entries(self):
+        """View of the .dynsym symbol entries"""
+        self.sections
+        self._dyn_symbol_entries = RecordView(self._dyn_sym_array, self._decode_dynsym_entry)
+
+    def _decode_symtab_entry(self, sym):
+        return self._make_symbol_entry(sym, self._string_table[sym.st_name])
+
+    def _decode_dynsym_entry(self, sym):
+        return self._make_symbol_entry(sym, self._dynamic_string_table[sym.st_name])
+
+    def _make_symbol_entry(self, sym, symbol_name):
+        info_raw = sym.st_info
+        # decode sym type and binding
+        symbol_type = _STT(constexpr.ELF64_ST_TYPE(info_raw))
+        symbol_binding = _STB(constexpr.ELF64_ST_BIND(info_raw))
+        symbol_visibility = _STV(sym.st_other)
+
+        return self._records['Symbol']._from_struct((symbol_name, symbol_type,
+                                                     symbol_binding, symbol_visibility), sym)
+
+    def lookup_dynamic_symbol(self, name):
+        """Find the defined dynamic symbol called name through the symbol
+        hash table, without decoding the rest of .dynsym. Returns the
+        symbol entry or None"""
+        self._locate_dynamic_symbols()
+        if isinstance(name, str):
+            name_bytes = name.encode()
+        else:
+            name_bytes, name = name, name.decode()
+
+        if self._gnu_hash_table is not None:
+            index = self._gnu_hash_lookup(name_bytes)
+        elif self._hash_table is not None:
+            index = self._sysv_hash_lookup(name_bytes)
+        else:
+            index = self._linear_dyn_symbol_lookup(name_bytes)
+
+        if index is None:
+            return None
+        return self._make_symbol_entry(self._dyn_sym_array[index], name)
+
+    def _dyn_symbol_matches(self, index, name_bytes):
+        sym = self._dyn_sym_array[index]
+        if sym.st_shndx == elfenums.SHN.SHN_UNDEF:
+            return False
+        return self._dynamic_string_table.get_bytes(sym.st_name) == name_bytes
+
+    def _linear_dyn_symbol_lookup(self, name_bytes):
+        for index in range(len(self._dyn_sym_array)):
+            if self._dyn_symbol_matches(index, name_bytes):
+                return index
+
+    def _sysv_hash_lookup(self, name_bytes):
+        """bucket and chain walk over DT_HASH. chain[i] is the next symbol
+        index with the same bucket as symbol i, 0 ends the chain"""
+        table = self._hash_table
+        entry_fmt = self._struct_byteorder + ('Q' if self._hash_entry_size == 8 else 'I')
+        entry_size = self._hash_entry_size
+        nbucket, nchain = struct.unpack_from(self._struct_byteorder + entry_fmt[1]*2, table, 0)
+        if nbucket == 0:
+            return None
+
+        buckets_offset = 2*entry_size
+        chain_offset = buckets_offset + nbucket*entry_size
+        index, = struct.unpack_from(entry_fmt, table, buckets_offset + entry_size*(elf_hash(name_bytes) % nbucket))
+        # bound the walk by nchain in case the chain loops
+        for _ in range(nchain):
+            if index == 0 or index >= nchain:
+                return None
+            if self._dyn_symbol_matches(index, name_bytes):
+                return index
+            index, = struct.unpack_from(entry_fmt, table, chain_offset + entry_size*index)
+
+    def _gnu_hash_lookup(self, name_bytes):
+        """Same walk as do_lookup_x in ld.so: bloom filter, then bucket,
+        then the chain of hashes that runs parallel to .dynsym"""
+        table = self._gnu_hash_table
+        byteorder = self._struct_byteorder
+        nbuckets, symoffset, bloom_size, bloom_shift = struct.unpack_from(byteorder + 'IIII', table, 0)
+        if nbuckets == 0 or bloom_size == 0:
+            return None
+
+        h = gnu_hash(name_bytes)
+        # bloom words are ElfW(Addr) sized
+        bloom_word_size = self.bits // 8
+        bloom_offset = 16
+        bloom_word_fmt = byteorder + ('I' if self.bits == 32 else 'Q')
+        bloom_index = (h // self.bits) % bloom_size
+        bloom_word, = struct.unpack_from(bloom_word_fmt, table, bloom_offset + bloom_index*bloom_word_size)
+        mask = (1 << (h % self.bits)) | (1 << ((h >> bloom_shift) % self.bits))
+        if (bloom_word & mask) != mask:
+            return None
+
+        buckets_offset = bloom_offset + bloom_size*bloom_word_size
+        index, = struct.unpack_from(byteorder + 'I', table, buckets_offset + 4*(h % nbuckets))
+        if index < symoffset:
+            return None
+
+        chain_offset = buckets_offset + 4*nbuckets
+        while True:
+            chain_hash, = struct.unpack_from(byteorder + 'I', table, chain_offset + 4*(index - symoffset))
+            if (chain_hash | 1) == (h | 1) and self._dyn_symbol_matches(index, name_bytes):
+                return index
+            # the low bit marks the end of the chain
+            if chain_hash & 1:
+                return None
+            index += 1
+
+    def _build_symbol_index(self):
+        intervals = []
+        seen = set()
+        for sym in self.symbol_entries:
+            if sym.st_size == 0 or sym.st_value == 0 or sym.st_shndx == elfenums.SHN.SHN_UNDEF:
+                continue
+            # tls symbol values are offsets into the tls block, not addresses
+            if sym.type not in (elfenums.STT.STT_FUNC, elfenums.STT.STT_OBJECT,
+                                elfenums.STT.STT_GNU_IFUNC, elfenums.STT.STT_NOTYPE):
+                continue
+            start = sym.st_value + self._address
+            # symbols in both .symtab and .dynsym only need to be indexed once
+            key = (start, sym.st_size, sym.name)
+            if key in seen:
+                continue
+            seen.add(key)
+            intervals.append((start, start + sym.st_size, sym))
+        self._symbol_index = IntervalIndex(intervals)
+
+    def symbol_at(self, addr):
+        """Symbol entry whose [st_value, st_value + st_size) contains addr,
+        taking the current address into account. None if there isn't one"""
+        if self._symbol_index is None:
+            self._build_symbol_index()
+        return self._symbol_index.find(addr)
+
+    def symbols_at(self, addrs):
+        """Batched symbol_at for a sequence or numpy array of addresses"""
+        if self._symbol_index is None:
+            self._build_symbol_index()
+        return self._symbol_index.find_all(addrs)
+
+    def exported_symbols(self):
+        """Names of the defined, externally visible dynamic symbols, read
+        straight from the raw .dynsym array without building dyn_symbols.
+        .dynsym is found through PT_DYNAMIC and sized from the symbol hash
+        table, see _locate_dynamic_symbols"""
+        self._locate_dynamic_symbols()
+        exported_bindings = (elfenums.STB.STB_GLOBAL, elfenums.STB.STB_WEAK,
+                             elfenums.STB.STB_GNU_UNIQUE)
+        hidden_visibilities = (elfenums.STV.STV_HIDDEN, elfenums.STV.STV_INTERNAL)
+        names = []
+        for sym in self._dyn_sym_array:
+            if sym.st_shndx == elfenums.SHN.SHN_UNDEF:
+                continue
+            if constexpr.ELF64_ST_BIND(sym.st_info) not in exported_bindings:
+                continue
+            if constexpr.ELF64_ST_VISIBILITY(sym.st_other) in hidden_visibilities:
+                continue
+            names.append(self._dynamic_string_table[sym.st_name])
+        return names
+
+    def _parse_versions(self):
+        """Read .gnu.version into an array and walk the version
+        definition and requirement chains once for the version names"""
+        self.sections
+        self._versym = array('H')
+        self._versions = {}
+        self._needed_versions = {}
+        self._version_files = {}
+        if self._versym_section_index is not None:
+            shdr = self._shdr_array[self._versym_section_index]
+            size = shdr.sh_size - shdr.sh_size % 2
+            self._versym.frombytes(bytes(self._get_c_array_at_offset(shdr.sh_offset, size)))
+            if self.endianness != sys.byteorder:
+                self._versym.byteswap()
+        if self._verdef_section_index is not None:
+            self._parse_verdefs(self._shdr_array[self._verdef_section_index])
+        if self._verneed_section_index is not None:
+            self._parse_verneeds(self._shdr_array[self._verneed_section_index])
+
+    def _struct_at(self, structure, data, offset):
+        """structure at offset in data, None if it doesn't fit"""
+        if offset < 0 or offset + sizeof(structure) > len(data):
+            return None
+        return structure.from_buffer(data, offset)
+
+    def _parse_verdefs(self, shdr):
+        data = self._get_c_array_at_offset(shdr.sh_offset, shdr.sh_size)
+        string_table = self._get_string_table(shdr.sh_link)
+        offset = 0
+        # sh_info is the number of entries, it also bounds a looping chain
+        for _ in range(shdr.sh_info):
+            verdef = self._struct_at(self._ElfW_Verdef, data, offset)
+            if verdef is None:
+                break
+            # the base definition names the file itself, not a version
+            if verdef.vd_cnt > 0 and not verdef.vd_flags & elfenums.VER.VER_FLG_BASE:
+                verdaux = self._struct_at(self._ElfW_Verdaux, data, offset + verdef.vd_aux)
+                if verdaux is not None:
+                    self._versions[verdef.vd_ndx & VERSYM_VERSION] = string_table[verdaux.vda_name]
+            if verdef.vd_next == 0:
+                break
+            offset += verdef.vd_next
+
+    def _parse_verneeds(self, shdr):
+        data = self._get_c_array_at_offset(shdr.sh_offset, shdr.sh_size)
+        string_table = self._get_string_table(shdr.sh_link)
+        offset = 0
+        for _ in range(shdr.sh_info):
+            verneed = self._struct_at(self._ElfW_Verneed, data, offset)
+            if verneed is None:
+                break
+            file = string_table[verneed.vn_file]
+            names = self._needed_versions.setdefault(file, [])
+            aux_offset = offset + verneed.vn_aux
+            for _ in range(verneed.vn_cnt):
+                vernaux = self._struct_at(self._ElfW_Vernaux, data, aux_offset)
+                if vernaux is None:
+                    break
+                name = string_table[vernaux.vna_name]
+                index = vernaux.vna_other & VERSYM_VERSION
+                self._versions[index] = name
+                self._version_files[index] = file
+                names.append(name)
+                if vernaux.vna_next == 0:
+                    break
+                aux_offset += vernaux.vna_next
+            if verneed.vn_next == 0:
+                break
+            offset += verneed.vn_next
+
+    def _parse_version_symbols(self):
+        versions = self.versions
+        by_index = defaultdict(list)
+        for symbol_index, version_index in enumerate(self.versym):
+            by_index[version_index & VERSYM_VERSION].append(symbol_index)
+
+        self._version_symbols = {}
+        for version_index, symbol_indices in by_index.items():
+            name = versions.get(version_index)
+            if name is None:
+                # local, global or an index without a definition
+                continue
+            if name in self._version_symbols:
+                # the same name defined and needed, or needed from two files
+                self._version_symbols[name] = sorted(self._version_symbols[name] + symbol_indices)
+            else:
+                self._version_symbols[name] = symbol_indices
+
+    def symbol_version(self, index):
+        """Version name of .dynsym symbol index, None if it is unversioned"""
+        versym = self.versym
+        if index >= len(versym):
+            return None
+        return self.versions.get(versym[index] & VERSYM_VERSION)
+
+    def versioned_name(self, index):
+        """Name of .dynsym symbol index with its version, name@@VERSION
+        for the default version of a defined symbol and name@VERSION for a
+        hidden version or a reference to another file's version"""
+        self.sections
+        name = self._dynamic_string_table[self._dyn_sym_array[index].st_name]
+        version = self.symbol_version(index)
+        if version is None:
+            return name
+        version_index = self._versym[index]
+        if (version_index & VERSYM_HIDDEN or (version_index & VERSYM_VERSION) in self._version_files
+                or self._dyn_sym_array[index].st_shndx == elfenums.SHN.SHN_UNDEF):
+            return name + '@' + version
+        return name + '@@' + version
+
+    def _iter_notes(self, data, align):
+        """Notes in data, the contents of a note segment or section. Each
+        note and its desc start on an align boundary, which is 4 for
+        everything but the 8 aligned notes of 64 bit files"""
+        align = 8 if align == 8 else 4
+        nhdr_size = sizeof(self._ElfW_Nhdr)
+        base = addressof(data)
+        offset = 0
+        while True:
+            nhdr = self._struct_at(self._ElfW_Nhdr, data, offset)
+            if nhdr is None:
+                return
+            name_offset = offset + nhdr_size
+            desc_offset = (name_offset + nhdr.n_namesz + align - 1) & -align
+            desc_end = desc_offset + nhdr.n_descsz
+            if desc_end > len(data):
+                return
+            name = string_at(base + name_offset, nhdr.n_namesz).rstrip(b'\x00')
+            yield records.Note(name.decode(errors='surrogateescape'), nhdr.n_type,
+                               string_at(base + desc_offset, nhdr.n_descsz))
+            offset = (desc_end + align - 1) & -align
+
+    def segment_notes(self):
+        """Notes of every PT_NOTE segment. Only reads the segments"""
+        for phdr in self._phdr_array:
+            if phdr.p_type == elfenums.PT.PT_NOTE and phdr.p_filesz > 0:
+                data = self._get_c_array_at_offset(phdr.p_offset, phdr.p_filesz)
+                yield from self._iter_notes(data, phdr.p_align)
+
+    def section_notes(self):
+        """(section name, note) for the notes of every SHT_NOTE section"""
+        for section_name, shdr in self.raw_section_headers():
+            if shdr.sh_type == elfenums.SHT.SHT_NOTE and shdr.sh_size > 0:
+                data = self._get_c_array_at_offset(shdr.sh_offset, shdr.sh_size)
+                for note in self._iter_notes(data, shdr.sh_addralign):
+                    yield section_name, note
+
+    def raw_section_headers(self):
+        """(name, raw ElfW_Shdr) of every section. Only reads the section
+        header array and .shstrtab, none of the tables sections loads"""
+        self._read_shdr_table()
+        if self._ehdr.e_shnum == 0:
+            return
+        for shdr in self._shdr_array:
+            yield self._shstrtab[shdr.sh_name], shdr
+
+    def build_id(self):
+        """GNU build-id as a hex string, None if there isn't one.
+
+        Only the PT_NOTE segments are read on top of the ehdr and phdrs
+        read on open, the section headers and symbols are never touched.
+        Files without program headers, like relocatable objects, fall back
+        to the SHT_NOTE sections"""
+        if self._ehdr.e_phnum == 0:
+            notes = (note for _, note in self.section_notes())
+        else:
+            notes = self.segment_notes()
+        for note in notes:
+            if note.type == elfenums.NT.NT_GNU_BUILD_ID and note.name == ELF_NOTE_GNU:
+                return note.desc.hex()
+        return None
+
+    def section_index(self, name):
+        """Index of the first section called name, None if there isn't
+        one"""
+        if self._section_indices is None:
+            self.sections
+            self._section_indices = {}
+            for section_index, shdr in enumerate(self._shdr_array):
+                self._section_indices.setdefault(self._shstrtab[shdr.sh_name], section_index)
+        return self._section_indices.get(name)
+
+    def section_data(self, name, start=0, size=None):
+        """size bytes (up to the end by default) at start in the contents
+        of section name, decompressed if it is SHF_COMPRESSED or a legacy
+        .zdebug section. .debug_* names also find their .zdebug_*
+        counterpart.
+
+        Compressed sections are only decompressed as far as the end of the
+        slice asked for, and kept in a cache bounded by section_cache_bytes.
+        NOBITS sections have no data. Raises KeyError for a missing section"""
+        section_index = self.section_index(name)
+        if section_index is None and name.startswith('.debug_'):
+            section_index = self.section_index('.zdebug_' + name[len('.debug_'):])
+        if section_index is None:
+            raise KeyError(name)
+
+        shdr = self._shdr_array[section_index]
+        if shdr.sh_type == elfenums.SHT.SHT_NOBITS:
+            return b''
+        stream = self._section_cache.get(section_index)
+        if stream is None:
+            stream = self._section_stream(shdr)
+            if stream is None:
+                end = shdr.sh_size if size is None else min(start + size, shdr.sh_size)
+                return bytes(self._read_bytes(shdr.sh_offset + start, max(0, end - start)))
+            self._section_cache.add(section_index, stream)
+        data = stream.read(start, size)
+        self._section_cache.evict()
+        return data
+
+    def _section_stream(self, shdr):
+        """SectionStream for a compressed section, None if it isn't
+        compressed"""
+        if shdr.sh_flags & elfenums.SHF.SHF_COMPRESSED:
+            chdr_size = sizeof(self._ElfW_Chdr)
+            if shdr.sh_size < chdr_size:
+                raise Exception("Compressed section is smaller than its header")
+            chdr = cast(self._get_c_array_at_offset(shdr.sh_offset, chdr_size),
+                        POINTER(self._ElfW_Chdr)).contents
+            if chdr.ch_type == elfenums.ELFCOMPRESS.ELFCOMPRESS_ZLIB:
+                decompressor = compressed.zlib_decompressor()
+            elif chdr.ch_type == elfenums.ELFCOMPRESS.ELFCOMPRESS_ZSTD:
+                decompressor = compressed.zstd_decompressor()
+            else:
+                raise Exception("Unknown section compression %#x" % chdr.ch_type)
+            data_offset = shdr.sh_offset + chdr_size
+            size = chdr.ch_size
+        elif (self._shstrtab[shdr.sh_name].startswith('.zdebug')
+              and shdr.sh_size >= compressed.ZDEBUG_HEADER_SIZE):
+            header = bytes(self._read_bytes(shdr.sh_offset, compressed.ZDEBUG_HEADER_SIZE))
+            if header[:4] != compressed.ZDEBUG_MAGIC:
+                return None
+            decompressor = compressed.zlib_decompressor()
+            data_offset = shdr.sh_offset + compressed.ZDEBUG_HEADER_SIZE
+            size = int.from_bytes(header[4:], 'big')
+        else:
+            return None
+
+        compressed_size = shdr.sh_offset + shdr.sh_size - data_offset
+        return compressed.SectionStream(lambda offset, length: self._read_bytes(data_offset + offset, length),
+                                        compressed_size, decompressor, size)
+
+    def symbol_columns(self, dynamic=False):
+        """numpy backed columnar view of .symtab, or .dynsym if dynamic is
+        True. Requires numpy"""
+        self.sections
+        if dynamic is True:
+            return columnar.SymbolColumns(self._dyn_sym_array, self._ElfW_Sym,
+                                          self.endianness, self._dynamic_string_table)
+        return columnar.SymbolColumns(self._sym_array, self._ElfW_Sym,
+                                      self.endianness, self._string_table)
 
     def _parse_phdrs(self):
-        extra_fields = ['type', 'flags']
-        phdr_tuple = namedtuple('Phdr', extra_fields + list(dict(self._ElfW_Phdr._fields_).keys()))
+        self._program_headers = RecordView(self._phdr_array, self._decode_phdr_entry)
+        self._load_entries = []
         for phdr in self._phdr_array:
-            phdr_type = elfenums.PT(phdr.p_type)
-            phdr_flags = elfenums.PF(phdr.p_flags)
-            phdr_dict = dict(phdr)
-            phdr_dict['type'] = phdr_type
-            phdr_dict['flags'] = phdr_flags
-            # self.program_headers.append(elfstructs.Phdr(**phdr_dict))
-            self.program_headers.append(phdr_tuple(**phdr_dict))
             if phdr.p_type == elfenums.PT.PT_LOAD:
                 self._load_entries.append(phdr)
 
+        # segment ends are inclusive, like the linear scan these replaced
+        self._offset_map = SegmentMap([(phdr.p_offset, phdr.p_filesz, phdr.p_vaddr)
+                                       for phdr in self._load_entries], inclusive_end=True)
+        self._vaddr_map = SegmentMap([(phdr.p_vaddr, phdr.p_memsz, phdr.p_offset)
+                                      for phdr in self._load_entries], inclusive_end=True)
+
+    def _decode_phdr_entry(self, phdr):
+        return self._records['Phdr']._from_struct((_PT(phdr.p_type), _PF(phdr.p_flags)), phdr)
+
+    def _locate_dynamic(self):
+        """Find the dynamic array and dynamic string table through
+        PT_DYNAMIC and DT_STRTAB so that only the ehdr and phdrs have to be
+        read. Falls back to the section headers if there is no PT_DYNAMIC"""
+        dyn_phdr = None
+        for phdr in self._phdr_array:
+            if phdr.p_type == elfenums.PT.PT_DYNAMIC:
+                dyn_phdr = phdr
+                break
+
+        if dyn_phdr is None:
+            self.sections
+            return
+
+        dyn_array_memory_class = self._ElfW_Dyn * (dyn_phdr.p_filesz // sizeof(self._ElfW_Dyn))
+        dyn_array_buffer = self._get_c_array_at_offset(dyn_phdr.p_offset,
+                                                        dyn_phdr.p_filesz)
+        self._dyn_array = cast(dyn_array_buffer, POINTER(dyn_array_memory_class)).contents
+
+        if self._dynamic_string_table is not None:
+            return
+
+        strtab_addr = None
+        strtab_size = None
+        for d in self._dyn_array:
+            if d.d_tag == elfenums.DT.DT_STRTAB:
+                strtab_addr = d.d_un.d_ptr
+            elif d.d_tag == elfenums.DT.DT_STRSZ:
+                strtab_size = d.d_un.d_val
+
+        self.program_headers
+        strtab_offset = None
+        if strtab_addr is not None:
+            strtab_offset = self.vaddr_to_offset(strtab_addr)
+        if strtab_offset is None or strtab_size is None:
+            self.sections
+            return
+
+        self._dynamic_string_table = self._get_string_table_at_offset(strtab_offset, strtab_size)
+
+    def _locate_dynamic_symbols(self):
+        """Find .dynsym and the symbol hash tables through DT_SYMTAB,
+        DT_GNU_HASH and DT_HASH, sizing .dynsym from a hash table, so that a
+        lookup reads no section headers. Falls back to the section headers
+        if there is no PT_DYNAMIC or no hash table"""
+        if self._dynamic_symbols_located:
+            return
+        self._dynamic_symbols_located = True
+        if self._sections is not None:
+            return
+        self.dynamic_entries
+        if self._sections is not None or self._dynamic_string_table is None:
+            # _locate_dynamic already fell back to the section headers
+            self.sections
+            return
+
+        symtab_offset = None
+        gnu_hash_offset = None
+        hash_offset = None
+        for d in self._dyn_array:
+            if d.d_tag == elfenums.DT.DT_SYMTAB:
+                symtab_offset = self.vaddr_to_offset(d.d_un.d_ptr)
+            elif d.d_tag == elfenums.DT.DT_GNU_HASH:
+                gnu_hash_offset = self.vaddr_to_offset(d.d_un.d_ptr)
+            elif d.d_tag == elfenums.DT.DT_HASH:
+                hash_offset = self.vaddr_to_offset(d.d_un.d_ptr)
+        if symtab_offset is None or (gnu_hash_offset is None and hash_offset is None):
+            self.sections
+            if symtab_offset is not None and len(self._dyn_sym_array) == 0:
+                raise Exception("DT_SYMTAB can't be sized, there is no DT_GNU_HASH, DT_HASH or .dynsym section")
+            return
+
+        if gnu_hash_offset is not None:
+            gnu_hash_size, symbol_count = self._gnu_hash_extent(gnu_hash_offset)
+            self._gnu_hash_table = self._get_c_array_at_offset(gnu_hash_offset, gnu_hash_size)
+        if hash_offset is not None:
+            # alpha and s390x use 64 bit hash entries
+            if self.bits == 64 and self.e_machine in (elfenums.EM.EM_ALPHA, elfenums.EM.EM_S390):
+                self._hash_entry_size = 8
+            entry_fmt = self._struct_byteorder + ('QQ' if self._hash_entry_size == 8 else 'II')
+            nbucket, nchain = struct.unpack(entry_fmt, self._read_bytes(hash_offset, 2*self._hash_entry_size))
+            self._hash_table = self._get_c_array_at_offset(hash_offset,
+                                                           (2 + nbucket + nchain)*self._hash_entry_size)
+            # nchain is the symbol count
+            symbol_count = nchain
+        dyn_sym_array_memory_class = self._ElfW_Sym * symbol_count
+        dyn_sym_array_buffer = self._get_c_array_at_offset(symtab_offset,
+                                                            sizeof(dyn_sym_array_memory_class))
+        self._dyn_sym_array = cast(dyn_sym_array_buffer, POINTER(dyn_sym_array_memory_class)).contents
+
+    def _gnu_hash_extent(self, offset):
+        """(size in bytes, symbol count) of the DT_GNU_HASH table at offset.
+        Symbols below symoffset aren't hashed, past them the chain of the
+        highest bucket ends at the last symbol"""
+        byteorder = self._struct_byteorder
+        nbuckets, symoffset, bloom_size, _ = struct.unpack(byteorder + 'IIII', self._read_bytes(offset, 16))
+        buckets_offset = 16 + bloom_size*(self.bits // 8)
+        chain_offset = buckets_offset + 4*nbuckets
+        buckets = self._read_bytes(offset + buckets_offset, 4*nbuckets)
+        last = max(struct.unpack(byteorder + '%dI' % (len(buckets) // 4), buckets), default=0)
+        if last < symoffset:
+            return chain_offset, symoffset
+        while True:
+            chain = self._read_bytes(offset + chain_offset + 4*(last - symoffset), 256)
+            if len(chain) < 4:
+                # truncated, the chain runs past the end of the file
+                return chain_offset + 4*(last - symoffset), last
+            for chain_hash, in struct.iter_unpack(byteorder + 'I', chain[:len(chain) & ~3]):
+                last += 1
+                if chain_hash & 1:
+                    return chain_offset + 4*(last - symoffset), last
+
     def _parse_dyn_entries(self):
-        extra_fields = ['type']
-        dyn_tuple = namedtuple('Dyn', extra_fields + list(dict(self._ElfW_Dyn._fields_).keys()))
+        self._locate_dynamic()
+        self._dynamic_entries = RecordView(self._dyn_array, self._decode_dyn_entry)
+        self._needed_libraries = []
+        self._soname = None
+        self._rpath = []
+        self._runpath = []
+        self._dynamic_flags = 0
         for d in self._dyn_array:
-            tag_type = elfenums.DT(d.d_tag)
-            if tag_type == elfenums.DT.DT_NEEDED:
-                self.needed_libraries.append(string_at_offset(self._dynamic_string_table, d.d_un.d_ptr))
-            elif tag_type == elfenums.DT.DT_FLAGS_1:
-                self.dynamic_flags |= elfenums.DF_1(d.d_un.d_val)
+            d_tag = d.d_tag
+            if d_tag == elfenums.DT.DT_NEEDED:
+                self._needed_libraries.append(self._dynamic_string_table[d.d_un.d_ptr])
+            elif d_tag == elfenums.DT.DT_SONAME:
+                self._soname = self._dynamic_string_table[d.d_un.d_val]
+            elif d_tag == elfenums.DT.DT_RPATH:
+                self._rpath += [path for path in self._dynamic_string_table[d.d_un.d_val].split(':') if path]
+            elif d_tag == elfenums.DT.DT_RUNPATH:
+                self._runpath += [path for path in self._dynamic_string_table[d.d_un.d_val].split(':') if path]
+            elif d_tag == elfenums.DT.DT_FLAGS_1:
+                self._dynamic_flags |= _DF_1(d.d_un.d_val)
 
-            dyn_dict = dict(d)
-            dyn_dict['type'] = tag_type
-            # self.dynamic_entries.append(elfstructs.Dyn(**dyn_dict))
-            self.dynamic_entries.append(dyn_tuple(**dyn_dict))
+    def _decode_dyn_entry(self, d):
+        return self._records['Dyn']._from_struct((_DT(d.d_tag),), d)
 
     def offset_to_vaddr(self, offset):
-        for phdr in self._load_entries:
-            if (phdr.p_offset <= offset) and (offset <= phdr.p_offset + phdr.p_filesz):
-                return (offset - phdr.p_offset) + phdr.p_vaddr
+        self.program_headers
+        return self._offset_map.translate(offset)
 
     def vaddr_to_offset(self, addr):
-        for phdr in self._load_entries:
-            if (phdr.p_vaddr <= addr) and (addr <= (phdr.p_vaddr + phdr.p_memsz)):
-                return (addr - phdr.p_vaddr) + phdr.p_offset
+        self.program_headers
+        return self._vaddr_map.translate(addr)
 
+    def offsets_to_vaddrs(self, offsets):
+        """Batched offset_to_vaddr. Takes a sequence, returning a list with
+        None for unmapped offsets, or a numpy array, returning a masked
+        array"""
+        self.program_headers
+        return self._offset_map.translate_all(offsets)
+
+    def vaddrs_to_offsets(self, addrs):
+        """Batched vaddr_to_offset. Takes a sequence, returning a list with
+        None for unmapped addresses, or a numpy array, returning a masked
+        array"""
+        self.program_headers
+        return self._vaddr_map.translate_all(addrs)
 
     def _get_relocation_enum_for_machine(self):
         """There are lots of different relocation architectures supported,
         but even more machine types. """
-        for k, v in elfenums.MACHINE_TYPE_TO_RELOCATION_TYPE_MAPPING.items():
+        from . import relocenums
+        for k, v in elfenums.MACHINE_TYPE_TO_RELOCATION_TYPE_NAME.items():
             if self.e_machine in k:
-                return v
-
-    def _parse_rela_entries(self):
-        extra_fields = ['name', 'type']
-        rela_tuple = namedtuple('Rela', extra_fields + list(dict(self._ElfW_Rela._fields_).keys()) + ['r_sym'])
-        for rela in self._rela_array:
-            rela_info = rela.r_info
-            rela_sym = self._constexpr['ELFW_R_SYM'](rela_info)
-            rela_type = self.relocation_enum(self._constexpr['ELFW_R_TYPE'](rela_info))
-            name = string_at_offset(self._dynamic_string_table, self._dyn_sym_array[rela_sym].st_name)
-            rela_dict = dict(rela)
-            rela_dict['name'] = name
-            rela_dict['type'] = rela_type
-            rela_dict['r_sym'] = rela_sym
-            # self.relocation_entries.append(elfstructs.Rela(**rela_dict))
-            self.relocation_entries.append(rela_tuple(**rela_dict))
-
-
-    def _parse_rel_entries(self):
-        extra_fields = ['name', 'type']
-        rel_tuple = namedtuple('Rel', extra_fields + list(dict(self._ElfW_Rel._fields_).keys()) + ['r_sym'])
-        for rel in self._rel_array:
+                return getattr(relocenums, v)
+
+    def _get_symbol_table(self, section_index):
+        """Symbol array and string table of the symbol table at
+        section_index, following its sh_link to the string table"""
+        self.sections
+        if section_index == self._dynsym_section_index:
+            return self._dyn_sym_array, self._dynamic_string_table
+        if section_index == self._symtab_section_index:
+            return self._sym_array, self._string_table
+        if section_index in self._symbol_tables:
+            return self._symbol_tables[section_index]
+
+        sym_array = []
+        string_table = None
+        shdr = self._shdr_array[section_index] if 0 < section_index < len(self._shdr_array) else None
+        if shdr is not None and shdr.sh_type in (elfenums.SHT.SHT_SYMTAB, elfenums.SHT.SHT_DYNSYM):
+            sym_array_memory_class = self._ElfW_Sym * (shdr.sh_size // sizeof(self._ElfW_Sym))
+            sym_array_buffer = self._get_c_array_at_offset(shdr.sh_offset,
+                                                            shdr.sh_size)
+            sym_array = cast(sym_array_buffer, POINTER(sym_array_memory_class)).contents
+            string_table = self._get_string_table(shdr.sh_link)
+
+        self._symbol_tables[section_index] = (sym_array, string_table)
+        return sym_array, string_table
+
+    def _get_string_table(self, section_index):
+        """StringTable of the section at section_index, the sh_link of
+        symbol and version sections"""
+        self.sections
+        if section_index == self._dynstr_section_index:
+            return self._dynamic_string_table
+        if section_index not in self._string_tables:
+            strshdr = self._shdr_array[section_index]
+            self._string_tables[section_index] = self._get_string_table_at_offset(strshdr.sh_offset, strshdr.sh_size)
+        return self._string_tables[section_index]
+
+    def _relocation_columns(self, relocation_section):
+        sym_array, string_table = self._get_symbol_table(relocation_section.symbol_table_index)
+        symbol_columns = None
+        if string_table is not None:
+            symbol_columns = columnar.SymbolColumns(sym_array, self._ElfW_Sym,
+                                                    self.endianness, string_table)
+        rel_structure = self._ElfW_Rela if relocation_section.is_rela is True else self._ElfW_Rel
+        return columnar.RelocationColumns(relocation_section._array, rel_structure,
+                                          self.endianness, self.bits, symbol_columns)
+
+    def relocation_columns(self):
+        """Columnar views of every relocation section, see
+        RelocationSection.columns"""
+        return [relocation_section.columns() for relocation_section in self.relocation_sections]
+
+    def _relocation_symbol_name(self, sym_array, string_table, r_sym):
+        if string_table is None or r_sym >= len(sym_array):
+            return ''
+        return string_table[sym_array[r_sym].st_name]
+
+    def _relocation_type_decoder(self):
+        if self.relocation_enum is None:
+            # no relocation enum for this machine, keep the raw values
+            return int
+        return enum_table(self.relocation_enum)
+
+    def _relocation_view(self, relocation_section, relocation_record):
+        sym_array, string_table = self._get_symbol_table(relocation_section.symbol_table_index)
+        relocation_type = self._relocation_type_decoder()
+        r_sym = self._constexpr['ELFW_R_SYM']
+        r_type = self._constexpr['ELFW_R_TYPE']
+
+        def decode(rel):
             rel_info = rel.r_info
-            rel_sym = self._constexpr['ELFW_R_SYM'](rel_info)
-            rel_type = self.relocation_enum(self._constexpr['ELFW_R_TYPE'](rel_info))
-            name = string_at_offset(self._dynamic_string_table, self._dyn_sym_array[rel_sym].st_name)
-            rel_dict = dict(rel)
-            rel_dict['name'] = name
-            rel_dict['type'] = rel_type
-            rel_dict['r_sym'] = rel_sym
-            # self.relocation_entries.append(elfstructs.rel(**rel_dict))
-            self.relocation_entries.append(rel_tuple(**rel_dict))
+            rel_sym = r_sym(rel_info)
+            name = self._relocation_symbol_name(sym_array, string_table, rel_sym)
+            return relocation_record._from_struct((name, relocation_type(r_type(rel_info))), rel, (rel_sym,))
+        return RecordView(relocation_section._array, decode)
+
+    def _parse_rela_entries(self, relocation_section):
+        """View of the entries of a SHT_RELA section"""
+        return self._relocation_view(relocation_section, self._records['Rela'])
 
+    def _parse_rel_entries(self, relocation_section):
+        """View of the entries of a SHT_REL section"""
+        return self._relocation_view(relocation_section, self._records['Rel'])
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Record types for decoded table entries.
+
+One class per table and bitness, created once at import. Records are
+namedtuples (so __slots__ = (), no per instance dict): the decoded fields
+first, then every field of the underlying elf structure in its layout
+order. Relocations end with r_sym. Notes are the same for every bitness.
+"""
+
+from collections import namedtuple
+from operator import attrgetter
+
+from . import elfstructs
+
+
+def _record_class(name, leading_fields, structure, trailing_fields=()):
+    struct_fields = tuple(field for field, _ in structure._fields_)
+    base = namedtuple(name, leading_fields + struct_fields + trailing_fields)
+
+    def _from_struct(cls, leading, struct, trailing=()):
+        """Record from the decoded leading values, the fields of struct
+        and the trailing values"""
+        return tuple.__new__(cls, leading + get_struct_fields(struct) + trailing)
+
+    get_struct_fields = attrgetter(*struct_fields)
+    return type(name, (base,), {'__slots__': (),
+                                '__module__': __name__,
+                                '_from_struct': classmethod(_from_struct)})
+
+
+_SECTION_FIELDS = ('name', 'type')
+_SYMBOL_FIELDS = ('name', 'type', 'binding', 'visibility')
+_PHDR_FIELDS = ('type', 'flags')
+_DYN_FIELDS = ('type',)
+_RELOCATION_FIELDS = ('name', 'type')
+
+Elf32_Section = _record_class('Elf32_Section', _SECTION_FIELDS, elfstructs.Elf32_Shdr)
+Elf64_Section = _record_class('Elf64_Section', _SECTION_FIELDS, elfstructs.Elf64_Shdr)
+Elf32_Symbol = _record_class('Elf32_Symbol', _SYMBOL_FIELDS, elfstructs.Elf32_Sym)
+Elf64_Symbol = _record_class('Elf64_Symbol', _SYMBOL_FIELDS, elfstructs.Elf64_Sym)
+Elf32_Phdr = _record_class('Elf32_Phdr', _PHDR_FIELDS, elfstructs.Elf32_Phdr)
+Elf64_Phdr = _record_class('Elf64_Phdr', _PHDR_FIELDS, elfstructs.Elf64_Phdr)
+Elf32_Dyn = _record_class('Elf32_Dyn', _DYN_FIELDS, elfstructs.Elf32_Dyn)
+Elf64_Dyn = _record_class('Elf64_Dyn', _DYN_FIELDS, elfstructs.Elf64_Dyn)
+Elf32_Rela = _record_class('Elf32_Rela', _RELOCATION_FIELDS, elfstructs.Elf32_Rela, ('r_sym',))
+Elf64_Rela = _record_class('Elf64_Rela', _RELOCATION_FIELDS, elfstructs.Elf64_Rela, ('r_sym',))
+Elf32_Rel = _record_class('Elf32_Rel', _RELOCATION_FIELDS, elfstructs.Elf32_Rel, ('r_sym',))
+Elf64_Rel = _record_class('Elf64_Rel', _RELOCATION_FIELDS, elfstructs.Elf64_Rel, ('r_sym',))
+
+# notes aren't fixed size, name and desc follow the Nhdr in the note data
+Note = namedtuple('Note', ('name', 'type', 'desc'))
+
+ELF32_RECORDS = {'Section': Elf32_Section,
+                 'Symbol': Elf32_Symbol,
+                 'Phdr': Elf32_Phdr,
+                 'Dyn': Elf32_Dyn,
+                 'Rela': Elf32_Rela,
+                 'Rel': Elf32_Rel}
+
+ELF64_RECORDS = {'Section': Elf64_Section,
+                 'Symbol': Elf64_Symbol,
+                 'Phdr': Elf64_Phdr,
+                 'Dyn': Elf64_Dyn,
+                 'Rela': Elf64_Rela,
+                 'Rel': Elf64_Rel}
+
+
+def get_records(bits):
+    if bits == 32:
+        return ELF32_RECORDS
+    elif bits == 64:
+        return ELF64_RECORDS
+    raise Exception("Bitness must be 32 or 64")
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""ldd style dependency resolution, without running anything.
+
+Follows DT_NEEDED the way ld.so does: DT_RPATH (of the object and its
+loaders, unless the object has a DT_RUNPATH), the library path, DT_RUNPATH,
+the ld.so.conf directories and the default directories, with $ORIGIN and
+$LIB expanded. Every path is looked up inside a sysroot, with symlinks
+resolved against the sysroot rather than the host, so container images
+can be resolved from an unpacked root filesystem.
+
+Libraries are parsed once, through a LibraryCache that can be shared
+between resolvers, and only their ehdr, phdrs and dynamic section are read.
+"""
+
+from collections import namedtuple, deque
+import glob
+import os
+import posixpath
+
+from .parse_elf import ElfParser
+
+DEFAULT_LD_SO_CONF = '/etc/ld.so.conf'
+# glibc's system directories. Libraries of the wrong class or machine are
+# skipped, so listing both lib64 and lib is safe
+DEFAULT_PATHS = ('/lib64', '/usr/lib64', '/lib', '/usr/lib')
+
+# symlinks followed while resolving one path, like the kernel's MAXSYMLINKS
+MAX_SYMLINKS = 40
+
+# what the resolver needs from a library, builtin types only
+LibraryInfo = namedtuple('LibraryInfo', ('bits', 'endianness', 'e_machine', 'soname',
+                                         'needed', 'rpath', 'runpath'))
+
+
+def host_path(sysroot, path):
+    """Host path of path inside sysroot"""
+    return os.path.join(sysroot, path.lstrip('/'))
+
+
+def sysroot_realpath(sysroot, path):
+    """Absolute path inside sysroot with every symlink resolved as if
+    sysroot was /, so absolute links stay inside it. Components that don't
+    exist are kept as they are. None on a symlink loop"""
+    parts = [part for part in path.split('/') if part]
+    parts.reverse()
+    resolved = []
+    links = 0
+    while parts:
+        part = parts.pop()
+        if part == '.':
+            continue
+        if part == '..':
+            if resolved:
+                resolved.pop()
+            continue
+        try:
+            target = os.readlink(host_path(sysroot, '/'.join(resolved + [part])))
+        except OSError:
+            resolved.append(part)
+            continue
+        links += 1
+        if links > MAX_SYMLINKS:
+            return None
+        if target.startswith('/'):
+            resolved = []
+        parts.extend(reversed([part for part in target.split('/') if part]))
+    return '/' + '/'.join(resolved)
+
+
+def read_ld_so_conf(sysroot='/', path=DEFAULT_LD_SO_CONF):
+    """Directories listed in the ld.so.conf at path inside sysroot,
+    following include lines. Missing files are skipped"""
+    directories = []
+    seen = set()
+
+    def read(conf):
+        if conf in seen:
+            return
+        seen.add(conf)
+        try:
+            with open(host_path(sysroot, conf)) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return
+        for line in lines:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            words = line.split()
+            if words[0] == 'include':
+                for pattern in words[1:]:
+                    pattern = posixpath.join(posixpath.dirname(conf), pattern)
+                    matches = glob.glob(os.path.join(glob.escape(sysroot), pattern.lstrip('/')))
+                    for match in sorted(matches):
+                        read('/' + os.path.relpath(match, sysroot).replace(os.sep, '/'))
+            elif words[0] == 'hwcap':
+                continue
+            else:
+                # old ldconfig accepted dir=type
+                directories.extend(word.split('=', 1)[0] for word in line.replace(',', ' ').replace(':', ' ').split())
+
+    read(path)
+    return directories
+
+
+def _read_library(path):
+    """LibraryInfo of the elf file at path, None if it can't be parsed"""
+    try:
+        with ElfParser(path) as elf:
+            return LibraryInfo(elf.bits, elf.endianness, int(elf.e_machine), elf.soname,
+                               list(elf.needed_libraries), list(elf.rpath), list(elf.runpath))
+    except Exception:
+        return None
+
+
+class LibraryCache:
+    """LibraryInfo of every file parsed so far, keyed by file identity,
+    (st_dev, st_ino, st_size, st_mtime_ns), so a file reached through
+    other paths, sysroots or hard links (such as the shared lower layers
+    of container images) is only parsed once"""
+    def __init__(self):
+        self._entries = {}
+        self.parsed = 0
+        self.hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path):
+        """LibraryInfo of the file at host path, None if it isn't a
+        parseable elf file"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+        self.parsed += 1
+        info = self._entries[key] = _read_library(path)
+        return info
+
+
+class DependencyGraph:
+    """Dependencies of root, a path inside the sysroot.
+
+    libraries: path -> LibraryInfo of root and everything it loads, in load
+               order (breadth first, like ld.so)
+    needed: path -> [(DT_NEEDED name, path it resolved to or None)]
+    Paths are sysroot paths with symlinks resolved"""
+    def __init__(self, root):
+        self.root = root
+        self.libraries = {}
+        self.needed = {}
+
+    def __iter__(self):
+        return iter(self.libraries)
+
+    def __len__(self):
+        return len(self.libraries)
+
+    @property
+    def missing(self):
+        """(path, DT_NEEDED name) of every dependency that wasn't found"""
+        return [(path, name) for path, needed in self.needed.items()
+                for name, found in needed if found is None]
+
+    def closure(self):
+        """Paths of every library root loads, in load order, root excluded"""
+        return [path for path in self.libraries if path != self.root]
+
+
+class Resolver:
+    """Resolves dependencies inside sysroot.
+
+    ld_so_conf: ld.so.conf inside sysroot, or None to skip it
+    default_paths: last resort directories
+    library_path: directories searched like LD_LIBRARY_PATH, none by default
+    cache: LibraryCache to share between resolvers"""
+    def __init__(self, sysroot='/', ld_so_conf=DEFAULT_LD_SO_CONF, default_paths=DEFAULT_PATHS,
+                 library_path=(), cache=None):
+        self.sysroot = os.path.abspath(sysroot)
+        self.ld_so_conf = ld_so_conf
+        self.default_paths = list(default_paths)
+        self.library_path = list(library_path)
+        self.cache = LibraryCache() if cache is None else cache
+        self._conf_paths = None
+        self._realpaths = {}
+
+    @property
+    def conf_paths(self):
+        if self._conf_paths is None:
+            self._conf_paths = [] if self.ld_so_conf is None else read_ld_so_conf(self.sysroot, self.ld_so_conf)
+        return self._conf_paths
+
+    def _realpath(self, path):
+        if path not in self._realpaths:
+            self._realpaths[path] = sysroot_realpath(self.sysroot, path)
+        return self._realpaths[path]
+
+    def _load(self, path):
+        """(path, resolved path, LibraryInfo) of the file at sysroot path,
+        None if it doesn't exist or isn't elf"""
+        resolved = self._realpath(path)
+        if resolved is None:
+            return None
+        info = self.cache.get(host_path(self.sysroot, resolved))
+        if info is None:
+            return None
+        return path, resolved, info
+
+    @staticmethod
+    def _expand(directory, origin, bits):
+        for token, value in (('$ORIGIN', origin), ('${ORIGIN}', origin),
+                             ('$LIB', 'lib64' if bits == 64 else 'lib'),
+                             ('${LIB}', 'lib64' if bits == 64 else 'lib')):
+            directory = directory.replace(token, value)
+        return directory
+
+    def _search_paths(self, path, graph, loaders, origins):
+        """Directories searched for the DT_NEEDED entries of path, in ld.so
+        order"""
+        info = graph.libraries[path]
+        directories = []
+        if not info.runpath:
+            # DT_RPATH of the object, then of whatever loaded it, up to root.
+            # Loaders with a DT_RUNPATH don't contribute their DT_RPATH
+            loader = path
+            while loader is not None:
+                loader_info = graph.libraries[loader]
+                if not loader_info.runpath:
+                    directories += [self._expand(d, origins[loader], loader_info.bits) for d in loader_info.rpath]
+                loader = loaders[loader]
+        directories += self.library_path
+        directories += [self._expand(d, origins[path], info.bits) for d in info.runpath]
+        directories += self.conf_paths
+        directories += self.default_paths
+        return directories
+
+    def _find(self, name, directories, info):
+        """First library called name in directories that matches the class
+        and machine of info"""
+        for directory in directories:
+            if not directory.startswith('/'):
+                # relative entries are relative to the cwd of the process,
+                # which doesn't exist here
+                continue
+            found = self._load(posixpath.join(directory, name))
+            if found is None:
+                continue
+            candidate = found[2]
+            if (candidate.bits, candidate.endianness, candidate.e_machine) == (info.bits, info.endianness,
+                                                                               info.e_machine):
+                return found
+        return None
+
+    def resolve(self, path):
+        """DependencyGraph of the executable or library at path, a path
+        inside the sysroot"""
+        root = self._load(path)
+        if root is None:
+            raise Exception("Can't parse %s" % path)
+        _, root_path, root_info = root
+        graph = DependencyGraph(root_path)
+        graph.libraries[root_path] = root_info
+        # $ORIGIN of the executable comes from /proc/self/exe, with its
+        # symlinks resolved. For libraries it is the directory of the path
+        # they were found at
+        origins = {root_path: posixpath.dirname(root_path)}
+        loaders = {root_path: None}
+        # DT_NEEDED and soname -> path of what is already loaded
+        loaded = {}
+        if root_info.soname is not None:
+            loaded[root_info.soname] = root_path
+
+        queue = deque([root_path])
+        while queue:
+            current = queue.popleft()
+            info = graph.libraries[current]
+            search_paths = None
+            graph.needed[current] = []
+            for name in info.needed:
+                found_path = loaded.get(name)
+                if found_path is None:
+                    if '/' in name:
+                        found = self._load(name if name.startswith('/')
+                                           else posixpath.join(origins[current], name))
+                    else:
+                        if search_paths is None:
+                            search_paths = self._search_paths(current, graph, loaders, origins)
+                        found = self._find(name, search_paths, info)
+                    if found is not None:
+                        found_at, found_path, found_info = found
+                        loaded[name] = found_path
+                        if found_path not in graph.libraries:
+                            graph.libraries[found_path] = found_info
+                            loaders[found_path] = current
+                            origins[found_path] = posixpath.dirname(posixpath.normpath(found_at))
+                            if found_info.soname is not None:
+                                loaded.setdefault(found_info.soname, found_path)
+                            queue.append(found_path)
+                graph.needed[current].append((name, found_path))
+        return graph
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Parse many elf files in parallel.
+
+ctypes objects can't be pickled, so workers send back compact summaries
+made only of builtin types instead of ElfParser instances.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+import os
+from . import elfenums
+from .parse_elf import ElfParser
+
+SUMMARY_FIELDS = ('header', 'needed', 'exports', 'build_id', 'debug_info')
+DEFAULT_FIELDS = ('header', 'needed')
+
+DEBUG_SECTION_NAMES = ('.debug_info', '.zdebug_info')
+
+
+def debug_info_kind(elf):
+    """'none' for a file with code but no debug info, 'embedded' for one
+    with both, 'separate' for a debug file whose code sections are NOBITS,
+    like objcopy --only-keep-debug output, and 'empty' when it has neither.
+    Only the section headers and their names are read"""
+    has_debug_info = False
+    has_code = False
+    for name, shdr in elf.raw_section_headers():
+        if name in DEBUG_SECTION_NAMES:
+            has_debug_info = True
+        elif shdr.sh_flags & elfenums.SHF.SHF_EXECINSTR and shdr.sh_type != elfenums.SHT.SHT_NOBITS:
+            has_code = True
+    if has_code:
+        return 'embedded' if has_debug_info else 'none'
+    return 'separate' if has_debug_info else 'empty'
+
+
+def summarize(path, fields=DEFAULT_FIELDS):
+    """Picklable summary of a single file. Parse errors are reported in the
+    summary under 'error' instead of being raised, so one bad file doesn't
+    stop a scan"""
+    summary = {'path': path}
+    try:
+        with ElfParser(path) as elf:
+            if 'header' in fields:
+                summary['header'] = {'bits': elf.bits,
+                                     'endianness': elf.endianness,
+                                     'osabi': int(elf.osabi),
+                                     'e_type': int(elf.e_type),
+                                     'e_machine': int(elf.e_machine)}
+            if 'needed' in fields:
+                summary['needed'] = list(elf.needed_libraries)
+            if 'exports' in fields:
+                summary['exports'] = elf.exported_symbols()
+            if 'build_id' in fields:
+                summary['build_id'] = elf.build_id()
+            if 'debug_info' in fields:
+                summary['debug_info'] = debug_info_kind(elf)
+    except Exception as e:
+        summary['error'] = '%s: %s' % (e.__class__.__name__, e)
+    return summary
+
+
+def _summarize_chunk(paths, fields):
+    return [summarize(path, fields) for path in paths]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def scan_paths(paths, fields=DEFAULT_FIELDS, workers=None, chunksize=16, max_pending=None):
+    """Summarize every path in a process pool, yielding summaries as they
+    complete (not in input order).
+    paths may be a lazy iterable, it is only consumed as fast as the workers
+    keep up. At most max_pending chunks (default 4 per worker) are in flight
+    at once, which bounds memory no matter how many paths there are.
+    workers=0 summarizes in the calling process.
+    Unknown fields raise ValueError here, not once the summaries are
+    iterated"""
+    unknown_fields = set(fields) - set(SUMMARY_FIELDS)
+    if unknown_fields:
+        raise ValueError("Unknown summary fields %s" % ', '.join(sorted(unknown_fields)))
+    return _scan_paths(paths, tuple(fields), workers, chunksize, max_pending)
+
+
+def _scan_paths(paths, fields, workers, chunksize, max_pending):
+    if workers == 0:
+        for path in paths:
+            yield summarize(path, fields)
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 4*workers
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = _chunks(paths, chunksize)
+        pending = set()
+        for chunk in islice(chunks, max_pending):
+            pending.add(executor.submit(_summarize_chunk, chunk, fields))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for chunk in islice(chunks, 1):
+                    pending.add(executor.submit(_summarize_chunk, chunk, fields))
+                yield from future.result()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Bounded, caching lookups into elf string tables"""
+
+from ctypes import Array, addressof, string_at
+import sys
+
+# bytes copied per step while looking for the NUL that ends a string in a
+# buffer without find, most names fit in the first one
+_SCAN_SIZE = 64
+
+
+class StringTable:
+    """Strings of a SHT_STRTAB section, looked up by offset.
+
+    The table is the size bytes at start in data, which is searched in
+    place, never copied: a lookup only copies the string it finds. data is
+    best a buffer with find (bytes, bytearray, mmap), such as a read planner
+    block or the mmap, any other buffer is scanned through a memoryview.
+    Decoded strings are cached by offset and interned, so every entry that
+    names the same string shares one str. Lookups never read outside the
+    table: an offset past the end is the empty string and a string missing
+    its NUL ends at the end of the table"""
+    __slots__ = ('_data', '_find', '_start', '_end', '_address', '_cache')
+
+    def __init__(self, data, start=0, size=None):
+        self._address = None
+        self._find = getattr(data, 'find', None)
+        if self._find is None:
+            view = memoryview(data).cast('B')
+            end = len(view) if size is None else min(start + size, len(view))
+            # a ctypes array whose table ends in a NUL can be read with
+            # string_at, every string in it is terminated within the table
+            if isinstance(data, Array) and end > start and view[end - 1] == 0:
+                self._address = addressof(data) + start
+            data = view
+        self._data = data
+        self._start = start
+        self._end = len(data) if size is None else min(start + size, len(data))
+        self._cache = {}
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, offset):
+        try:
+            return self._cache[offset]
+        except KeyError:
+            pass
+        # undecodable bytes are kept as surrogates, so malformed names can
+        # still be encoded back with errors='surrogateescape'
+        s = self._cache[offset] = sys.intern(self._get(offset).decode(errors='surrogateescape'))
+        return s
+
+    def get_bytes(self, offset):
+        return bytes(self._get(offset))
+
+    def _get(self, offset):
+        data = self._data
+        start = self._start + offset
+        end = self._end
+        if start >= end:
+            return b''
+        if self._address is not None:
+            return string_at(self._address + offset)
+        if self._find is not None:
+            nul = self._find(b'\x00', start, end)
+            return data[start:end if nul == -1 else nul]
+
+        s = b''
+        scan_size = _SCAN_SIZE
+        while start < end:
+            chunk = data[start:min(start + scan_size, end)].tobytes()
+            nul = chunk.find(b'\x00')
+            if nul != -1:
+                return s + chunk[:nul]
+            s += chunk
+            start += len(chunk)
+            scan_size *= 2
+        return s
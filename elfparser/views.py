@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Read only sequence views over the raw elf tables.
+
+Records are only decoded when an element is read, so asking for the length
+of a table or for a handful of its entries doesn't decode the rest. Nothing
+is cached, iterate into a list to keep the decoded records around.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+
+
+class _View(Sequence):
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return ChainView(self, other)
+
+    def __radd__(self, other):
+        return ChainView(other, self)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, list(self))
+
+
+class RecordView(_View):
+    """Sequence of decode(array[i]) for i in indices (every index of array
+    by default). Slicing gives another view over the same array"""
+    __slots__ = ('_array', '_decode', '_indices')
+
+    def __init__(self, array, decode, indices=None):
+        self._array = array
+        self._decode = decode
+        self._indices = range(len(array)) if indices is None else indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RecordView(self._array, self._decode, self._indices[index])
+        return self._decode(self._array[self._indices[index]])
+
+    def __iter__(self):
+        array = self._array
+        decode = self._decode
+        for i in self._indices:
+            yield decode(array[i])
+
+
+class ChainView(_View):
+    """Concatenation of sequences, without copying them"""
+    __slots__ = ('_parts', '_starts', '_length', '_indices')
+
+    def __init__(self, *parts, indices=None):
+        self._parts = parts
+        self._starts = []
+        length = 0
+        for part in parts:
+            self._starts.append(length)
+            length += len(part)
+        self._length = length
+        self._indices = range(length) if indices is None else indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def _item(self, i):
+        # empty parts share their start with the next part, bisect_right
+        # always lands on the last, non empty, one
+        part = bisect_right(self._starts, i) - 1
+        return self._parts[part][i - self._starts[part]]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ChainView(*self._parts, indices=self._indices[index])
+        return self._item(self._indices[index])
+
+    def __iter__(self):
+        if self._indices == range(self._length):
+            for part in self._parts:
+                yield from part
+        else:
+            for i in self._indices:
+                yield self._item(i)
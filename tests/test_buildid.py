@@ -0,0 +1,62 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+from elfparser.buildid import BuildIdIndex, _walk
+from elfparser.parse_elf import ElfParser
+from elfparser.scanner import debug_info_kind
+
+
+@pytest.fixture
+def binary():
+    """A host binary with a build-id"""
+    path = os.path.realpath(sys.executable)
+    with ElfParser(path) as elf:
+        build_id = elf.build_id()
+    if build_id is None:
+        pytest.skip('%s has no build-id' % path)
+    return path, build_id
+
+
+@pytest.fixture
+def tree(tmp_path, binary):
+    root = tmp_path / 'root'
+    (root / 'bin').mkdir(parents=True)
+    shutil.copy(binary[0], str(root / 'bin' / 'python'))
+    (root / 'bin' / 'notes.txt').write_text('not elf')
+    # a link back to the root
+    os.symlink('..', str(root / 'bin' / 'loop'))
+    return str(root)
+
+
+def test_walk_skips_directories_seen_through_symlinks(tree):
+    paths = sorted(os.path.relpath(path, tree) for path, _ in _walk(tree, True))
+    assert paths == [os.path.join('bin', 'notes.txt'), os.path.join('bin', 'python')]
+    assert sorted(os.path.relpath(path, tree) for path, _ in _walk(tree, False)) == paths
+
+
+def test_update_and_lookup(tmp_path, tree, binary):
+    python = os.path.join(tree, 'bin', 'python')
+    with BuildIdIndex(str(tmp_path / 'index.db')) as index:
+        assert index.update(tree, workers=0, follow_symlinks=True) == (2, 0, 0)
+        assert len(index) == 1
+        found, _ = index.lookup(binary[1])
+        assert found == python
+        assert index.lookup(binary[1].upper())[0] == python
+        assert index.lookup('00'*20) == (None, None)
+
+        # nothing changed
+        assert index.update(tree, workers=0) == (0, 2, 0)
+        os.unlink(python)
+        assert index.update(tree, workers=0) == (0, 1, 1)
+        assert index.lookup(binary[1]) == (None, None)
+
+
+def test_debug_info_kind_reads_only_section_headers(binary):
+    with ElfParser(binary[0]) as elf:
+        kind = debug_info_kind(elf)
+        assert elf._sections is None
+        names = [name for name, _ in elf.raw_section_headers()]
+    assert kind == ('embedded' if '.debug_info' in names else 'none')
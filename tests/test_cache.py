@@ -0,0 +1,74 @@
+import os
+import shutil
+import struct
+
+from benchmarks.synth_elf import build_elf
+from elfparser import elfenums
+from elfparser.cache import ParseCache
+from elfparser.parse_elf import ElfParser
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def test_unknown_header_values_round_trip(tmp_path):
+    data = bytearray(build_elf(symbols=10))
+    # e_machine and e_ident[EI_OSABI] that elfenums doesn't know
+    struct.pack_into('<H', data, 18, 0xfff0)
+    data[7] = 0xf0
+    path = _write(tmp_path / 'unknown.so', data)
+    cache = ParseCache(str(tmp_path / 'cache'))
+    stored = cache.put(path)
+    loaded = cache.get(path)
+    assert loaded.e_machine == stored.e_machine == 0xfff0
+    assert loaded.osabi == 0xf0
+    assert loaded.e_type is elfenums.ET.ET_DYN
+
+
+def test_entries_match_the_parser(tmp_path):
+    path = _write(tmp_path / 'synth.so', build_elf(symbols=30, relocations=20))
+    cache = ParseCache(str(tmp_path / 'cache'))
+    assert cache.get(path) is None
+    cache.put(path)
+    cached = cache.get(path)
+    with ElfParser(path) as elf:
+        assert cached.needed_libraries == elf.needed_libraries
+        assert cached.dyn_symbols == elf.dyn_symbols
+        for table in ('sections', 'symbol_entries', 'relocation_entries'):
+            assert list(getattr(cached, table)) == list(getattr(elf, table))
+        # d_un is a DynUn instead of the ctypes union
+        assert ([(d.d_tag, d.d_un.d_val) for d in cached.dynamic_entries]
+                == [(d.d_tag, d.d_un.d_val) for d in elf.dynamic_entries])
+
+
+def test_stat_key_misses_after_a_change(tmp_path):
+    path = _write(tmp_path / 'synth.so', build_elf(symbols=10))
+    cache = ParseCache(str(tmp_path / 'cache'))
+    cache.load(path)
+    _write(path, build_elf(symbols=20))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.get(path) is None
+    with ElfParser(path) as elf:
+        assert cache.load(path).dyn_symbols == elf.dyn_symbols
+
+
+def test_content_key_survives_a_copy(tmp_path):
+    path = _write(tmp_path / 'synth.so', build_elf(symbols=10))
+    copy = str(tmp_path / 'copy.so')
+    shutil.copy(path, copy)
+    cache = ParseCache(str(tmp_path / 'cache'), key='content')
+    cache.put(path)
+    assert cache.get(copy) is not None
+
+
+def test_eviction_keeps_the_cache_bounded(tmp_path):
+    cache_dir = tmp_path / 'cache'
+    cache = ParseCache(str(cache_dir), max_bytes=1)
+    for i in range(3):
+        cache.put(_write(tmp_path / ('%d.so' % i), build_elf(symbols=10, seed=i)))
+    # the entry just written is evicted too, the bound is never exceeded
+    assert sum(entry.stat().st_size for entry in os.scandir(str(cache_dir))) <= 1
@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser.parse_elf import ElfParser
+
+numpy = pytest.importorskip('numpy')
+
+SYMBOLS = 30
+
+
+@pytest.fixture(params=[(bits, endianness) for bits in (32, 64) for endianness in ('little', 'big')],
+                ids=lambda param: '%d-%s' % param)
+def data(request):
+    bits, endianness = request.param
+    # parsed in place, so the columns are views of this bytearray
+    return bytearray(build_elf(bits=bits, endianness=endianness, symbols=SYMBOLS, relocations=40))
+
+
+def _assert_views(data, *columns):
+    file_bytes = numpy.frombuffer(data, dtype=numpy.uint8)
+    for column in columns:
+        assert numpy.shares_memory(column, file_bytes)
+        assert not column.flags.writeable
+        with pytest.raises(ValueError):
+            column[0] = 1
+
+
+@pytest.mark.parametrize('dynamic', (False, True))
+def test_symbol_columns_match_the_records(data, dynamic):
+    with ElfParser(data) as elf:
+        columns = elf.symbol_columns(dynamic=dynamic)
+        # .symtab comes first in symbol_entries, then .dynsym
+        entries = list(elf.symbol_entries)
+        records = entries[SYMBOLS + 1:] if dynamic else entries[:SYMBOLS + 1]
+        assert len(columns) == len(records) == SYMBOLS + 1
+        assert columns.st_value.tolist() == [sym.st_value for sym in records]
+        assert columns.st_size.tolist() == [sym.st_size for sym in records]
+        assert columns.st_shndx.tolist() == [sym.st_shndx for sym in records]
+        assert columns.type.tolist() == [sym.type for sym in records]
+        assert columns.binding.tolist() == [sym.binding for sym in records]
+        assert columns.visibility.tolist() == [sym.visibility for sym in records]
+        assert columns.names() == [sym.name for sym in records]
+        _assert_views(data, columns.st_value, columns.st_info)
+
+
+def test_relocation_columns_match_the_records(data):
+    with ElfParser(data) as elf:
+        [columns] = elf.relocation_columns()
+        records = list(elf.relocation_entries)
+        assert len(columns) == len(records) == 40
+        assert columns.r_offset.tolist() == [rel.r_offset for rel in records]
+        assert columns.r_sym.tolist() == [rel.r_sym for rel in records]
+        assert columns.r_type.tolist() == [rel.type for rel in records]
+        # SHT_REL addends are zero
+        assert columns.r_addend.tolist() == [getattr(rel, 'r_addend', 0) for rel in records]
+        assert columns.names() == [rel.name for rel in records]
+        assert columns.name(3) == records[3].name
+        _assert_views(data, columns.r_offset, columns.r_info)
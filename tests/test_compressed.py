@@ -0,0 +1,116 @@
+import zlib
+
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser import compressed, elfenums, elfstructs
+from elfparser.parse_elf import ElfParser
+
+# several CHUNK_SIZEs decompressed, so a partial read leaves some behind
+DATA = b''.join(b'%08d\n' % i for i in range(400000))
+SHF_COMPRESSED = elfenums.SHF.SHF_COMPRESSED
+
+
+def _chdr_section(bits, endianness, ch_type, payload, size=len(DATA)):
+    chdr = elfstructs.get_elf_structures(bits, endianness)['ElfW_Chdr']()
+    chdr.ch_type = ch_type
+    chdr.ch_size = size
+    chdr.ch_addralign = 1
+    return bytes(chdr) + payload
+
+
+def _zdebug_section(payload, size=len(DATA)):
+    return compressed.ZDEBUG_MAGIC + size.to_bytes(8, 'big') + payload
+
+
+def _elf(*extra_sections, **kwargs):
+    return build_elf(symbols=10, relocations=0, extra_sections=extra_sections, **kwargs)
+
+
+@pytest.mark.parametrize('bits', (32, 64))
+@pytest.mark.parametrize('endianness', ('little', 'big'))
+def test_zlib_compressed_section(bits, endianness):
+    section = _chdr_section(bits, endianness, elfenums.ELFCOMPRESS.ELFCOMPRESS_ZLIB, zlib.compress(DATA))
+    data = _elf(('.debug_info', elfenums.SHT.SHT_PROGBITS, SHF_COMPRESSED, section),
+                bits=bits, endianness=endianness)
+    with ElfParser(data) as elf:
+        assert elf.section_data('.debug_info') == DATA
+        assert elf.section_data('.debug_info', 1000, 50) == DATA[1000:1050]
+
+
+def test_zstd_compressed_section():
+    zstandard = pytest.importorskip('zstandard')
+    section = _chdr_section(64, 'little', elfenums.ELFCOMPRESS.ELFCOMPRESS_ZSTD,
+                            zstandard.ZstdCompressor().compress(DATA))
+    with ElfParser(_elf(('.debug_info', elfenums.SHT.SHT_PROGBITS, SHF_COMPRESSED, section))) as elf:
+        assert elf.section_data('.debug_info', 2000000, 100) == DATA[2000000:2000100]
+        assert elf.section_data('.debug_info') == DATA
+
+
+def test_zdebug_is_found_by_its_debug_name():
+    section = _zdebug_section(zlib.compress(DATA))
+    with ElfParser(_elf(('.zdebug_line', elfenums.SHT.SHT_PROGBITS, 0, section))) as elf:
+        assert elf.section_data('.debug_line') == DATA
+        assert elf.section_data('.zdebug_line', 10, 10) == DATA[10:20]
+        with pytest.raises(KeyError):
+            elf.section_data('.debug_info')
+
+
+def test_partial_reads_decompress_part_of_the_stream():
+    section = _chdr_section(64, 'little', elfenums.ELFCOMPRESS.ELFCOMPRESS_ZLIB, zlib.compress(DATA))
+    with ElfParser(_elf(('.debug_info', elfenums.SHT.SHT_PROGBITS, SHF_COMPRESSED, section))) as elf:
+        assert elf.section_data('.debug_info', 0, 100) == DATA[:100]
+        index = elf.section_index('.debug_info')
+        stream = elf._section_cache.get(index)
+        assert 100 <= len(stream) < len(DATA)
+        assert not stream.complete
+        decompressed = len(stream)
+        # behind what was already decompressed, nothing more is
+        assert elf.section_data('.debug_info', 50, 10) == DATA[50:60]
+        assert len(stream) == decompressed
+
+
+def test_reads_past_the_end_are_clamped():
+    section = _chdr_section(64, 'little', elfenums.ELFCOMPRESS.ELFCOMPRESS_ZLIB, zlib.compress(DATA))
+    data = _elf(('.debug_info', elfenums.SHT.SHT_PROGBITS, SHF_COMPRESSED, section),
+                ('.plain', elfenums.SHT.SHT_PROGBITS, 0, b'0123456789'))
+    with ElfParser(data) as elf:
+        assert elf.section_data('.debug_info', len(DATA) - 5, 100) == DATA[-5:]
+        assert elf.section_data('.debug_info', len(DATA) + 10, 100) == b''
+        assert elf.section_data('.plain', 8, 100) == b'89'
+        assert elf.section_data('.plain', 20) == b''
+
+
+def test_nobits_section_has_no_data():
+    with ElfParser(_elf(('.bss', elfenums.SHT.SHT_NOBITS, elfenums.SHF.SHF_ALLOC, bytes(4096)))) as elf:
+        assert elf.section_data('.bss') == b''
+        assert elf.section_data('.bss', 100, 10) == b''
+
+
+def test_section_cache_evicts_under_section_cache_bytes():
+    small = b'x' * 1000
+    data = _elf(*[('.zdebug_%d' % i, elfenums.SHT.SHT_PROGBITS, 0,
+                   _zdebug_section(zlib.compress(small), len(small))) for i in range(3)])
+    with ElfParser(data, section_cache_bytes=2500) as elf:
+        indices = [elf.section_index('.zdebug_%d' % i) for i in range(3)]
+        elf.section_data('.zdebug_0')
+        elf.section_data('.zdebug_1')
+        # touching 0 makes 1 the least recently used
+        elf.section_data('.zdebug_0', 0, 10)
+        elf.section_data('.zdebug_2')
+        assert indices[1] not in elf._section_cache
+        assert indices[0] in elf._section_cache and indices[2] in elf._section_cache
+        assert elf._section_cache.total_bytes <= 2500
+        # evicted streams are decompressed again
+        assert elf.section_data('.zdebug_1') == small
+
+
+def test_section_cache_keeps_the_last_stream():
+    cache = compressed.SectionCache(max_bytes=10)
+    payload = zlib.compress(bytes(100))
+    stream = compressed.SectionStream(lambda offset, size: payload[offset:offset + size], len(payload),
+                                      compressed.zlib_decompressor(), 100)
+    cache.add(1, stream)
+    assert stream.read() == bytes(100) and stream.complete
+    cache.evict()
+    assert len(cache) == 1 and cache.get(1) is stream
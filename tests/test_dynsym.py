@@ -0,0 +1,95 @@
+import os
+import struct
+
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser import elfenums
+from elfparser.parse_elf import ElfParser
+
+LIBM_PATHS = ('/lib/x86_64-linux-gnu/libm.so.6', '/usr/lib64/libm.so.6', '/lib64/libm.so.6')
+
+
+def _without_section_headers(data):
+    """Copy of data, an elf file, with e_shoff, e_shnum and e_shstrndx
+    zeroed"""
+    data = bytearray(data)
+    byteorder = '<' if data[5] == 1 else '>'
+    if data[4] == 2:
+        struct.pack_into(byteorder + 'Q', data, 0x28, 0)
+        struct.pack_into(byteorder + 'HH', data, 0x3c, 0, 0)
+    else:
+        struct.pack_into(byteorder + 'I', data, 0x20, 0)
+        struct.pack_into(byteorder + 'HH', data, 0x30, 0, 0)
+    return data
+
+
+def _strip_section_headers(src, dst):
+    with open(src, 'rb') as f:
+        data = f.read()
+    with open(dst, 'wb') as f:
+        f.write(_without_section_headers(data))
+    return dst
+
+
+@pytest.fixture
+def libm():
+    for path in LIBM_PATHS:
+        if os.path.exists(path):
+            return path
+    pytest.skip('no x86_64 libm')
+
+
+@pytest.fixture
+def stripped_libm(libm, tmp_path):
+    return _strip_section_headers(libm, str(tmp_path / 'libm.so.6'))
+
+
+def test_gnu_hash_lookup_without_section_headers(libm, stripped_libm):
+    with ElfParser(libm) as elf:
+        expected = elf.lookup_dynamic_symbol('cos')
+    with ElfParser(stripped_libm) as elf:
+        sym = elf.lookup_dynamic_symbol('cos')
+        assert elf.lookup_dynamic_symbol('no_such_symbol') is None
+        # found through PT_DYNAMIC, the section headers are never read
+        assert elf._sections is None
+    assert sym.name == 'cos'
+    assert sym.st_value == expected.st_value
+
+
+def test_gnu_hash_sizes_dynsym(libm):
+    with ElfParser(libm) as elf:
+        elf.lookup_dynamic_symbol('cos')
+        located = len(elf._dyn_sym_array)
+    with ElfParser(libm) as elf:
+        elf.sections
+        assert located == len(elf._dyn_sym_array)
+
+
+@pytest.mark.parametrize('bits', (32, 64))
+@pytest.mark.parametrize('endianness', ('little', 'big'))
+def test_sysv_hash_without_section_headers(bits, endianness):
+    # synth_elf only writes DT_HASH
+    data = bytearray(build_elf(bits=bits, endianness=endianness, symbols=50))
+    with ElfParser(data) as elf:
+        expected = sorted(elf.exported_symbols())
+        name = expected[7]
+        value = elf.lookup_dynamic_symbol(name).st_value
+    with ElfParser(_without_section_headers(data)) as elf:
+        assert sorted(elf.exported_symbols()) == expected
+        assert elf.lookup_dynamic_symbol(name).st_value == value
+        assert elf._sections is None
+    assert len(expected) == 50
+
+
+def test_dynsym_without_hash_table_raises():
+    data = _without_section_headers(build_elf(symbols=10))
+    with ElfParser(data) as elf:
+        dyn_phdr = next(phdr for phdr in elf.program_headers if phdr.p_type == elfenums.PT.PT_DYNAMIC)
+    # retag DT_HASH as DT_DEBUG
+    for offset in range(dyn_phdr.p_offset, dyn_phdr.p_offset + dyn_phdr.p_filesz, 16):
+        if struct.unpack_from('<q', data, offset)[0] == elfenums.DT.DT_HASH:
+            struct.pack_into('<q', data, offset, elfenums.DT.DT_DEBUG)
+    with ElfParser(data) as elf:
+        with pytest.raises(Exception, match='DT_SYMTAB'):
+            elf.exported_symbols()
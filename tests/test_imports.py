@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def _modules_after(statement):
+    """sys.modules of a fresh interpreter after running statement"""
+    out = subprocess.run([sys.executable, '-c', statement + '; import sys; print(" ".join(sys.modules))'],
+                         cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_parse_elf_import_leaves_out_numpy():
+    assert 'numpy' not in _modules_after('import elfparser.parse_elf')
+
+
+def test_parse_elf_import_leaves_out_lazy_modules():
+    modules = _modules_after('import elfparser.parse_elf')
+    assert 'elfparser.elfmacros' not in modules
+    assert 'elfparser.arch_specific' not in modules
+    assert 'elfparser.relocenums' not in modules
+
+
+def test_list_lookups_leave_out_numpy():
+    modules = _modules_after('from elfparser.parse_elf import ElfParser; '
+                             'elf = ElfParser(%r); elf.offsets_to_vaddrs([0, 64]); elf.symbols_at([0])'
+                             % sys.executable)
+    assert 'numpy' not in modules
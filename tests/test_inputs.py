@@ -0,0 +1,72 @@
+import io
+
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser.parse_elf import ElfParser
+
+DATA = build_elf(symbols=20)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / 'synth.so'
+    path.write_bytes(DATA)
+    return path
+
+
+@pytest.mark.parametrize('make', (str, lambda path: path))
+def test_paths(path, make):
+    with ElfParser(make(path)) as elf:
+        assert elf.file == str(path)
+        assert len(elf.exported_symbols()) == 20
+
+
+@pytest.mark.parametrize('make', (bytes, bytearray, memoryview, io.BytesIO))
+def test_buffers(make):
+    with ElfParser(make(DATA)) as elf:
+        assert len(elf.exported_symbols()) == 20
+
+
+def test_bytes_read_from_a_file(path):
+    with open(str(path), 'rb') as f:
+        data = f.read()
+    with ElfParser(data) as elf:
+        assert elf.file is None
+        assert len(elf.exported_symbols()) == 20
+
+
+def test_binary_file_object_from_its_position(path):
+    path.write_bytes(b'junk' + DATA)
+    with open(str(path), 'rb') as f:
+        f.read(4)
+        with ElfParser(f) as elf:
+            assert len(elf.exported_symbols()) == 20
+        assert not f.closed
+
+
+def test_text_file_object_is_rejected(path):
+    with open(str(path), encoding='latin-1') as f:
+        with pytest.raises(TypeError, match='binary mode'):
+            ElfParser(f)
+
+
+def test_lazy_reads_after_close_raise(tmp_path):
+    # big enough that the section headers aren't in the first read
+    path = tmp_path / 'big.so'
+    path.write_bytes(build_elf(symbols=2000))
+    elf = ElfParser(str(path))
+    elf.close()
+    # the fd number the parser used is reused by the next open
+    with open(str(path), 'rb'):
+        with pytest.raises(ValueError, match='closed'):
+            elf.sections
+
+
+def test_lazy_reads_after_the_file_object_is_closed_raise(tmp_path):
+    path = tmp_path / 'big.so'
+    path.write_bytes(build_elf(symbols=2000))
+    with open(str(path), 'rb') as f:
+        elf = ElfParser(f)
+    with pytest.raises(ValueError, match='closed'):
+        elf.sections
@@ -0,0 +1,23 @@
+from benchmarks.synth_elf import build_elf
+from elfparser.instrumentation import ParseStats
+from elfparser.parse_elf import ElfParser
+
+
+def test_view_decodes_are_timed_under_their_stage():
+    records = []
+    stats = ParseStats(records.append)
+    elf = ElfParser(build_elf(symbols=100, relocations=50), stats=stats)
+    entries = elf.symbol_entries
+    assert stats.decoded.get('_parse_dyn_symbol_entries', 0) == 0
+
+    list(entries)
+    # the first ten come from .symtab
+    list(entries[:10])
+    list(elf.relocation_entries)
+    assert stats.decoded['_parse_symbol_entries'] == 111
+    assert stats.decoded['_parse_dyn_symbol_entries'] == 101
+    assert stats.decoded['_parse_rela_entries'] == 50
+    # one build per stage, decodes aren't counted as calls
+    assert stats.calls['_parse_dyn_symbol_entries'] == 1
+    assert stats.seconds['_parse_dyn_symbol_entries'] >= stats.decode_seconds['_parse_dyn_symbol_entries'] > 0
+    assert sum(record.decoded for record in records) == 101 + 111 + 50
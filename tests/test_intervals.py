@@ -0,0 +1,137 @@
+import pytest
+
+from benchmarks.synth_elf import TEXT_ADDRESS, build_elf
+from elfparser import elfenums
+from elfparser.intervals import IntervalIndex, SegmentMap
+from elfparser.parse_elf import ElfParser
+
+# 'a' contains 'b' and 'c', 'd' comes after a gap
+INTERVALS = [(200, 300, 'd'), (10, 20, 'b'), (0, 100, 'a'), (30, 40, 'c')]
+# (start, size, target_start)
+SEGMENTS = [(0x2000, 0x500, 0x602000), (0, 0x1000, 0x400000)]
+
+
+@pytest.fixture
+def index():
+    return IntervalIndex(INTERVALS)
+
+
+def _find_linear(addr):
+    """The greatest start among the intervals that contain addr"""
+    containing = [(start, value) for start, end, value in INTERVALS if start <= addr < end]
+    return max(containing)[1] if containing else None
+
+
+def test_find(index):
+    assert index.find(15) == 'b'
+    assert index.find(35) == 'c'
+    assert index.find(200) == 'd'
+    assert index.find(300) is None
+    assert index.find(-1, 'default') == 'default'
+
+
+def test_overlapping_intervals_walk_backwards(index):
+    # past the end of 'b' and 'c', only the interval that contains them
+    # is left
+    assert index.find(25) == 'a'
+    assert index.find(45) == 'a'
+    assert index.find(99) == 'a'
+
+
+def test_gap_misses(index):
+    # the running maximum end stops the walk before it reaches 'a'
+    assert index.find(100) is None
+    assert index.find(150) is None
+
+
+def test_find_all_matches_find(index):
+    addrs = list(range(-5, 320))
+    assert index.find_all(addrs) == [_find_linear(addr) for addr in addrs]
+
+
+def test_numpy_batch_matches_find(index):
+    numpy = pytest.importorskip('numpy')
+    addrs = numpy.arange(0, 320, dtype=numpy.uint64)
+    assert index.find_all(addrs, 'miss') == [index.find(addr, 'miss') for addr in range(320)]
+    indices, found = index.find_indices(addrs)
+    assert found.tolist() == [_find_linear(addr) is not None for addr in range(320)]
+    assert [index.values[i] for i in indices[found].tolist()] == [
+        _find_linear(addr) for addr in range(320) if _find_linear(addr) is not None]
+    assert IntervalIndex([]).find_all(addrs[:3]) == [None]*3
+
+
+def test_symbol_at():
+    with ElfParser(build_elf(symbols=20, relocations=0)) as elf:
+        sym = elf.symbol_at(TEXT_ADDRESS + 5*16 + 3)
+        assert (sym.st_value, sym.st_size) == (TEXT_ADDRESS + 5*16, 16)
+        assert elf.symbol_at(TEXT_ADDRESS + 20*16) is None
+        assert elf.symbol_at(TEXT_ADDRESS - 1) is None
+        addrs = [TEXT_ADDRESS + i*8 for i in range(-2, 44)]
+        assert elf.symbols_at(addrs) == [elf.symbol_at(addr) for addr in addrs]
+
+
+def test_symbols_at_numpy():
+    numpy = pytest.importorskip('numpy')
+    with ElfParser(build_elf(symbols=20, relocations=0)) as elf:
+        addrs = numpy.arange(TEXT_ADDRESS - 16, TEXT_ADDRESS + 22*16, 4, dtype=numpy.uint64)
+        assert elf.symbols_at(addrs) == [elf.symbol_at(addr) for addr in addrs.tolist()]
+
+
+def test_rebase_invalidates_the_index():
+    with ElfParser(build_elf(symbols=20, relocations=0)) as elf:
+        name = elf.symbol_at(TEXT_ADDRESS).name
+        elf.address = 0x1000000
+        assert elf.symbol_at(TEXT_ADDRESS) is None
+        assert elf.symbol_at(0x1000000 + TEXT_ADDRESS).name == name
+        assert elf.symbols_at([0x1000000 + TEXT_ADDRESS + 16])[0].st_value == TEXT_ADDRESS + 16
+
+
+def test_translate_inclusive_end():
+    segments = SegmentMap(SEGMENTS, inclusive_end=True)
+    assert segments.translate(0x10) == 0x400010
+    # p_offset + p_filesz is mapped, the byte after it isn't
+    assert segments.translate(0x1000) == 0x401000
+    assert segments.translate(0x1001) is None
+    assert segments.translate(0x2500) == 0x602500
+    assert segments.translate(0x1800, 'unmapped') == 'unmapped'
+    assert SegmentMap(SEGMENTS).translate(0x1000) is None
+
+
+def test_translate_all_matches_translate():
+    segments = SegmentMap(SEGMENTS, inclusive_end=True)
+    addrs = list(range(0, 0x3000, 0x80)) + [0x1000, 0x1001, 0x2500, 0x2501]
+    assert segments.translate_all(addrs) == [segments.translate(addr) for addr in addrs]
+    assert segments.translate_all([0x1800], -1) == [-1]
+
+
+def test_translate_all_numpy_is_masked():
+    numpy = pytest.importorskip('numpy')
+    segments = SegmentMap(SEGMENTS, inclusive_end=True)
+    addrs = list(range(0, 0x3000, 0x80)) + [0x1000, 0x1001, 0x2500, 0x2501]
+    result = segments.translate_all(numpy.array(addrs, dtype=numpy.uint64))
+    assert result.dtype == numpy.uint64
+    assert result.tolist() == [segments.translate(addr) for addr in addrs]
+    assert result.mask.tolist() == [segments.translate(addr) is None for addr in addrs]
+    assert SegmentMap([]).translate_all(numpy.arange(3)).mask.all()
+
+
+def test_offsets_and_vaddrs():
+    data = build_elf(symbols=20, relocations=0)
+    with ElfParser(data) as elf:
+        load = next(phdr for phdr in elf.program_headers if phdr.p_type == elfenums.PT.PT_LOAD)
+        end = load.p_offset + load.p_filesz
+        offsets = [0, 0x40, end, end + 1]
+        assert elf.offsets_to_vaddrs(offsets) == [elf.offset_to_vaddr(offset) for offset in offsets]
+        assert elf.offsets_to_vaddrs(offsets)[2:] == [load.p_vaddr + load.p_filesz, None]
+        assert elf.vaddrs_to_offsets([load.p_vaddr + 0x40, load.p_vaddr + load.p_memsz + 1]) == [
+            load.p_offset + 0x40, None]
+
+
+def test_offsets_and_vaddrs_numpy():
+    numpy = pytest.importorskip('numpy')
+    with ElfParser(build_elf(symbols=20, relocations=0)) as elf:
+        offsets = numpy.arange(0, 0x4000, 0x100, dtype=numpy.uint64)
+        vaddrs = elf.offsets_to_vaddrs(offsets)
+        assert vaddrs.tolist() == [elf.offset_to_vaddr(offset) for offset in offsets.tolist()]
+        offsets_back = elf.vaddrs_to_offsets(vaddrs.compressed())
+        assert offsets_back.tolist() == offsets[~vaddrs.mask].tolist()
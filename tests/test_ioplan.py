@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+from elfparser.ioplan import ReadPlanner, merge_ranges
+
+DATA = bytes(range(256))*4096
+
+
+@pytest.fixture
+def fd(tmp_path):
+    path = tmp_path / 'data'
+    path.write_bytes(DATA)
+    fd = os.open(str(path), os.O_RDONLY)
+    yield fd
+    os.close(fd)
+
+
+def test_merge_ranges():
+    assert merge_ranges([(10, 5), (0, 5)]) == [(0, 5), (10, 15)]
+    # adjacent, overlapping and contained ranges always merge
+    assert merge_ranges([(0, 5), (5, 5)]) == [(0, 10)]
+    assert merge_ranges([(0, 100), (10, 5), (50, 100)]) == [(0, 150)]
+    assert merge_ranges([(0, 5), (7, 0), (9, -1)]) == [(0, 5)]
+
+
+def test_merge_ranges_gap_and_max_block():
+    assert merge_ranges([(0, 5), (10, 5)], gap=5) == [(0, 15)]
+    assert merge_ranges([(0, 5), (10, 5)], gap=4) == [(0, 5), (10, 15)]
+    assert merge_ranges([(0, 5), (6, 5), (12, 5)], gap=10, max_block=11) == [(0, 11), (12, 17)]
+    # a single range bigger than max_block isn't split
+    assert merge_ranges([(0, 100)], max_block=10) == [(0, 100)]
+
+
+def test_read_and_accounting(fd):
+    planner = ReadPlanner(fd, min_read=100)
+    assert bytes(planner.read(10, 20)) == DATA[10:30]
+    assert (planner.read_count, planner.bytes_read) == (1, 100)
+    # served out of the first block, [10, 110)
+    assert bytes(planner.read(50, 60)) == DATA[50:110]
+    assert planner.read_count == 1
+    assert bytes(planner.read(100, 20)) == DATA[100:120]
+    assert (planner.read_count, planner.bytes_read) == (2, 200)
+
+
+def test_base_offset(fd):
+    planner = ReadPlanner(fd, base_offset=1000)
+    assert bytes(planner.read(0, 16)) == DATA[1000:1016]
+    assert planner.read_uncached(5000, 16) == DATA[6000:6016]
+
+
+def test_overlapping_blocks(fd):
+    planner = ReadPlanner(fd, min_read=100)
+    planner.read_block(50, 10)
+    planner.prefetch([(0, 1000)])
+    assert planner.read_count == 2
+    # the block at 50 doesn't cover this, the earlier one at 0 does
+    block, start = planner.read_block(200, 10)
+    assert len(block) == 1000 and start == 200
+    assert bytes(planner.read(140, 20)) == DATA[140:160]
+    assert planner.read_count == 2
+
+
+def test_short_reads_at_eof(fd):
+    planner = ReadPlanner(fd, min_read=4096)
+    block, start = planner.read_block(len(DATA) - 10, 10)
+    assert bytes(block[start:]) == DATA[-10:]
+    assert planner.bytes_read == 10
+    assert planner.read_uncached(len(DATA) - 5, 100) == DATA[-5:]
+    assert planner.read_uncached(len(DATA) + 5, 100) == b''
+    # a table that runs past the end of the file can't be backed by a block
+    with pytest.raises(ValueError):
+        planner.read(len(DATA) - 10, 20)
+
+
+def test_read_uncached_keeps_nothing(fd):
+    planner = ReadPlanner(fd)
+    assert planner.read_uncached(100, 10) == DATA[100:110]
+    planner.read_uncached(100, 10)
+    assert planner.read_count == 2
+    planner.read(0, 10)
+    # served by the block read since
+    assert planner.read_uncached(100, 10) == DATA[100:110]
+    assert planner.read_count == 3
+
+
+@pytest.mark.parametrize('ranges, reads', [
+    # adjacent
+    ([(0, 100), (100, 100), (200, 100)], 1),
+    # within gap
+    ([(0, 100), (30000, 100), (60000, 100)], 1),
+    # further apart than gap
+    ([(0, 100), (200000, 100), (600000, 100)], 3),
+    ([(0, 100), (30000, 100), (600000, 100)], 2),
+])
+def test_prefetch_read_counts(fd, ranges, reads):
+    planner = ReadPlanner(fd)
+    planner.prefetch(ranges)
+    assert planner.read_count == reads
+    for offset, size in ranges:
+        assert bytes(planner.read(offset, size)) == DATA[offset:offset + size]
+    # everything is cached now
+    planner.prefetch(ranges)
+    assert planner.read_count == reads
+
+
+def test_prefetch_max_block(fd):
+    planner = ReadPlanner(fd, gap=1 << 20, max_block=4096)
+    planner.prefetch([(0, 100), (2000, 100), (5000, 100)])
+    assert planner.read_count == 2
+    assert planner.bytes_read == 2100 + 100
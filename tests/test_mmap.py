@@ -0,0 +1,31 @@
+from benchmarks.synth_elf import build_elf
+from elfparser.parse_elf import ElfParser
+
+
+def _parse(tmp_path):
+    path = tmp_path / 'synth.so'
+    path.write_bytes(build_elf(symbols=20))
+    elf = ElfParser(str(path), use_mmap=True)
+    elf.symbols
+    elf.dyn_symbols
+    list(elf.relocation_entries)
+    elf.lookup_dynamic_symbol(elf.exported_symbols()[0])
+    return elf
+
+
+def test_close_unmaps(tmp_path):
+    elf = _parse(tmp_path)
+    mapping = elf._mmap
+    elf.close()
+    assert mapping.closed
+    # closing again is harmless
+    elf.close()
+
+
+def test_held_views_keep_the_mapping(tmp_path):
+    elf = _parse(tmp_path)
+    mapping = elf._mmap
+    sections = elf.sections
+    elf.close()
+    assert not mapping.closed
+    del sections
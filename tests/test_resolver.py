@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser.resolver import LibraryCache, Resolver, read_ld_so_conf
+
+
+def _library(sysroot, path, **kwargs):
+    """Write a synthetic library at path inside sysroot"""
+    kwargs.setdefault('needed', [])
+    host = os.path.join(sysroot, path.lstrip('/'))
+    os.makedirs(os.path.dirname(host), exist_ok=True)
+    with open(host, 'wb') as f:
+        f.write(build_elf(symbols=1, relocations=0, **kwargs))
+
+
+@pytest.fixture
+def sysroot(tmp_path):
+    root = str(tmp_path)
+    # liba.so is in every directory, which one is picked shows the order
+    for directory in ('/app/rlib', '/app/lib', '/usr/lib'):
+        _library(root, directory + '/liba.so', needed=['libdep.so'])
+    # only reachable through a DT_RPATH inherited from the executable
+    _library(root, '/app/rlib/libdep.so')
+    _library(root, '/opt/conf/libconf.so')
+    _library(root, '/app/bin/rpath', needed=['liba.so', 'libconf.so', 'libmissing.so'],
+             rpath='$ORIGIN/../rlib')
+    _library(root, '/app/bin/runpath', needed=['liba.so'],
+             rpath='$ORIGIN/../rlib', runpath='${ORIGIN}/../lib')
+    os.makedirs(os.path.join(root, 'usr/bin'))
+    os.symlink('/app/bin/rpath', os.path.join(root, 'usr/bin/rpath'))
+
+    os.makedirs(os.path.join(root, 'etc/ld.so.conf.d'))
+    with open(os.path.join(root, 'etc/ld.so.conf'), 'w') as f:
+        f.write('# comment\ninclude ld.so.conf.d/*.conf\n')
+    with open(os.path.join(root, 'etc/ld.so.conf.d/conf.conf'), 'w') as f:
+        f.write('/opt/conf\n')
+    return root
+
+
+def _resolver(sysroot):
+    return Resolver(sysroot, default_paths=('/usr/lib',))
+
+
+def test_ld_so_conf_include(sysroot):
+    assert read_ld_so_conf(sysroot) == ['/opt/conf']
+
+
+def test_rpath_is_searched_and_inherited(sysroot):
+    graph = _resolver(sysroot).resolve('/app/bin/rpath')
+    assert dict(graph.needed['/app/bin/rpath']) == {'liba.so': '/app/rlib/liba.so',
+                                                    'libconf.so': '/opt/conf/libconf.so',
+                                                    'libmissing.so': None}
+    assert graph.needed['/app/rlib/liba.so'] == [('libdep.so', '/app/rlib/libdep.so')]
+    assert graph.missing == [('/app/bin/rpath', 'libmissing.so')]
+    assert graph.closure() == ['/app/rlib/liba.so', '/opt/conf/libconf.so', '/app/rlib/libdep.so']
+
+
+def test_runpath_overrides_rpath(sysroot):
+    graph = _resolver(sysroot).resolve('/app/bin/runpath')
+    assert graph.needed['/app/bin/runpath'] == [('liba.so', '/app/lib/liba.so')]
+    # DT_RUNPATH only applies to the object's own DT_NEEDED entries
+    assert graph.needed['/app/lib/liba.so'] == [('libdep.so', None)]
+
+
+def test_origin_of_a_symlinked_executable(sysroot):
+    graph = _resolver(sysroot).resolve('/usr/bin/rpath')
+    assert graph.root == '/app/bin/rpath'
+    assert dict(graph.needed[graph.root])['liba.so'] == '/app/rlib/liba.so'
+
+
+def test_cache_is_shared(sysroot):
+    cache = LibraryCache()
+    Resolver(sysroot, cache=cache).resolve('/app/bin/rpath')
+    parsed = cache.parsed
+    Resolver(sysroot, cache=cache).resolve('/app/bin/rpath')
+    assert cache.parsed == parsed
+    assert cache.hits > 0
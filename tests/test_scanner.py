@@ -0,0 +1,52 @@
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser.scanner import scan_paths
+
+FILES = 12
+
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for i in range(FILES):
+        path = tmp_path / ('%d.so' % i)
+        path.write_bytes(build_elf(symbols=5, relocations=0, needed=['libdep%d.so' % i], seed=i))
+        paths.append(str(path))
+    bad = tmp_path / 'bad.so'
+    bad.write_bytes(b'not an elf file')
+    return paths + [str(bad), str(tmp_path / 'missing.so')]
+
+
+def test_unknown_fields_raise_before_iteration(paths):
+    with pytest.raises(ValueError, match='no_such_field'):
+        scan_paths(paths, fields=('needed', 'no_such_field'))
+
+
+@pytest.mark.parametrize('workers', (0, 2))
+def test_summaries(paths, workers):
+    summaries = {summary['path']: summary
+                 for summary in scan_paths(paths, fields=('header', 'needed'), workers=workers, chunksize=3)}
+    assert sorted(summaries) == sorted(paths)
+    for i, path in enumerate(paths[:FILES]):
+        assert summaries[path]['needed'] == ['libdep%d.so' % i]
+        assert summaries[path]['header']['bits'] == 64
+        assert 'error' not in summaries[path]
+    # per file errors are reported, not raised
+    for path in paths[FILES:]:
+        assert 'error' in summaries[path] and 'needed' not in summaries[path]
+
+
+def test_max_pending_bounds_the_paths_consumed(paths):
+    consumed = []
+
+    def lazy_paths():
+        for path in paths * 10:
+            consumed.append(path)
+            yield path
+
+    summaries = scan_paths(lazy_paths(), workers=2, chunksize=1, max_pending=2)
+    next(summaries)
+    # max_pending chunks up front, then one more per completed chunk
+    assert len(consumed) <= 2*2
+    assert len(list(summaries)) + 1 == len(consumed) == len(paths)*10
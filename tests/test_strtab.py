@@ -0,0 +1,40 @@
+import mmap
+from ctypes import c_ubyte
+
+import pytest
+
+from elfparser.strtab import StringTable
+
+TABLE = b'\x00ab\x00cd\x00efg'
+EXPECTED = ['', 'ab', 'b', '', 'cd', 'd', '', 'efg', 'fg', 'g', '', '']
+
+
+def _anonymous_mmap(data):
+    m = mmap.mmap(-1, len(data))
+    m.write(data)
+    return m
+
+
+@pytest.mark.parametrize('make', (bytes, bytearray, memoryview, _anonymous_mmap,
+                                  lambda data: (c_ubyte*len(data)).from_buffer_copy(data)))
+def test_lookups_over_buffers(make):
+    data = make(b'XX' + TABLE + b'YY')
+    table = StringTable(data, 2, len(TABLE))
+    assert len(table) == len(TABLE)
+    # the unterminated last string ends at the end of the table, not in YY
+    assert [table[offset] for offset in range(12)] == EXPECTED
+    assert table.get_bytes(4) == b'cd'
+    assert table.get_bytes(100) == b''
+
+
+def test_lookups_share_the_buffer():
+    data = bytearray(TABLE)
+    table = StringTable(data)
+    data[1:3] = b'xy'
+    assert table[1] == 'xy'
+
+
+def test_nul_terminated_ctypes_table():
+    data = (c_ubyte*7).from_buffer_copy(TABLE[:7])
+    table = StringTable(data)
+    assert [table[offset] for offset in range(9)] == EXPECTED[:7] + ['', '']
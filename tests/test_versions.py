@@ -0,0 +1,99 @@
+from array import array
+
+import pytest
+
+from benchmarks.synth_elf import build_elf
+from elfparser import elfenums, elfstructs
+from elfparser.parse_elf import VERSYM_HIDDEN, ElfParser
+
+SYMBOLS = 8
+# synth_elf puts extra sections after .text and .synth.1
+VERSTR_INDEX = 9 + 2
+# .dynsym index -> versym entry: local, global, FOO_1, FOO_2 hidden and
+# default, and two versions needed from libc
+VERSYM = [0, 1, 2, 3 | VERSYM_HIDDEN, 3, 4, 5, 4, 1]
+
+
+def _struct(structure, **fields):
+    s = structure()
+    for k, v in fields.items():
+        setattr(s, k, v)
+    return bytes(s)
+
+
+def _version_sections(bits, endianness):
+    structures = elfstructs.get_elf_structures(bits, endianness)
+    names = ['libsynth.so', 'FOO_1', 'FOO_2', 'libc.so.6', 'GLIBC_2.2.5', 'GLIBC_2.34']
+    verstr = b'\x00' + b''.join(name.encode() + b'\x00' for name in names)
+    offsets = {name: verstr.index(b'\x00' + name.encode() + b'\x00') + 1 for name in names}
+
+    Verdef, Verdaux = structures['ElfW_Verdef'], structures['ElfW_Verdaux']
+    verdef_size = len(_struct(Verdef)) + len(_struct(Verdaux))
+    verdefs = [('libsynth.so', 1, elfenums.VER.VER_FLG_BASE), ('FOO_1', 2, 0), ('FOO_2', 3, 0)]
+    verdef = b''
+    for i, (name, index, flags) in enumerate(verdefs):
+        verdef += _struct(Verdef, vd_version=1, vd_flags=flags, vd_ndx=index, vd_cnt=1,
+                          vd_aux=len(_struct(Verdef)),
+                          vd_next=verdef_size if i < len(verdefs) - 1 else 0)
+        verdef += _struct(Verdaux, vda_name=offsets[name])
+
+    Verneed, Vernaux = structures['ElfW_Verneed'], structures['ElfW_Vernaux']
+    vernaux_size = len(_struct(Vernaux))
+    verneed = _struct(Verneed, vn_version=1, vn_cnt=2, vn_file=offsets['libc.so.6'],
+                      vn_aux=len(_struct(Verneed)))
+    verneed += _struct(Vernaux, vna_other=4, vna_name=offsets['GLIBC_2.2.5'], vna_next=vernaux_size)
+    verneed += _struct(Vernaux, vna_other=5, vna_name=offsets['GLIBC_2.34'])
+
+    versym = b''.join(v.to_bytes(2, endianness) for v in VERSYM)
+    return (('.verstr', elfenums.SHT.SHT_STRTAB, 0, verstr),
+            ('.gnu.version', elfenums.SHT.SHT_GNU_versym, 0, versym),
+            ('.gnu.version_d', elfenums.SHT.SHT_GNU_verdef, 0, verdef, VERSTR_INDEX, len(verdefs)),
+            ('.gnu.version_r', elfenums.SHT.SHT_GNU_verneed, 0, verneed, VERSTR_INDEX, 1))
+
+
+@pytest.fixture(params=[(bits, endianness) for bits in (32, 64) for endianness in ('little', 'big')],
+                ids=lambda param: '%d-%s' % param)
+def elf(request):
+    bits, endianness = request.param
+    data = build_elf(bits=bits, endianness=endianness, sections=2, symbols=SYMBOLS, relocations=0,
+                     extra_sections=_version_sections(bits, endianness))
+    with ElfParser(data) as elf:
+        yield elf
+
+
+def test_versym_is_byteswapped(elf):
+    assert elf.versym == array('H', VERSYM)
+
+
+def test_definition_and_requirement_chains(elf):
+    # the base definition names the file, not a version
+    assert elf.versions == {2: 'FOO_1', 3: 'FOO_2', 4: 'GLIBC_2.2.5', 5: 'GLIBC_2.34'}
+    assert elf.needed_versions == {'libc.so.6': ['GLIBC_2.2.5', 'GLIBC_2.34']}
+
+
+def test_version_symbols(elf):
+    assert elf.version_symbols == {'FOO_1': [2], 'FOO_2': [3, 4], 'GLIBC_2.2.5': [5, 7],
+                                   'GLIBC_2.34': [6]}
+
+
+def test_versioned_name(elf):
+    elf.sections
+    names = [elf._dynamic_string_table[sym.st_name] for sym in elf._dyn_sym_array]
+    assert [elf.versioned_name(i) for i in range(1, len(VERSYM))] == [
+        names[1],
+        names[2] + '@@FOO_1',
+        # hidden and needed versions aren't the default
+        names[3] + '@FOO_2',
+        names[4] + '@@FOO_2',
+        names[5] + '@GLIBC_2.2.5',
+        names[6] + '@GLIBC_2.34',
+        names[7] + '@GLIBC_2.2.5',
+        names[8]]
+
+
+def test_file_without_versions():
+    with ElfParser(build_elf(symbols=4, relocations=0)) as elf:
+        assert len(elf.versym) == 0
+        assert elf.versions == {} and elf.version_symbols == {}
+        elf.sections
+        assert elf.versioned_name(1) == elf._dynamic_string_table[elf._dyn_sym_array[1].st_name]